@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import desc, update, select
+from sqlalchemy.dialects.postgresql import insert
 from app.models import Movie, MovieManagerSummary
 from typing import Optional, List
 import re
@@ -10,15 +11,16 @@ def get_movie(db: Session, movie_id: int) -> Optional[Movie]:
     """영화 정보 조회"""
     return db.query(Movie).filter(Movie.id == movie_id).first()
 
-def update_movie_status(db: Session, movie_id: int, status: str) -> bool:
-    """영화 상태 업데이트"""
-    movie = db.query(Movie).filter(Movie.id == movie_id).first()
-    if movie:
-        movie.status = status
+def update_movie_status(db: Session, movie_id: int, status: str, commit: bool = True) -> bool:
+    """영화 상태 업데이트 (객체 로드 없이 단일 UPDATE 문으로 처리)"""
+    result = db.execute(
+        update(Movie)
+        .where(Movie.id == movie_id)
+        .values(status=status)
+    )
+    if commit:
         db.commit()
-        db.refresh(movie)
-        return True
-    return False
+    return result.rowcount > 0
 
 def mark_movie_failed(db: Session, movie_id: int) -> bool:
     """영화 상태를 실패로 표시"""
@@ -87,6 +89,23 @@ def create_or_update_summary(db: Session, movie_id: int, summary_id: int, summar
         db.commit()
         return summary
 
+def upsert_summaries(db: Session, movie_id: int, summaries: List[dict], commit: bool = True) -> int:
+    """여러 요약을 한 번의 INSERT ... ON CONFLICT DO UPDATE 문으로 생성 또는 덮어쓰기"""
+    if not summaries:
+        return 0
+    stmt = insert(MovieManagerSummary).values([
+        {"movie_id": movie_id, "summary_id": s["summary_id"], "summary_text": s["summary_text"]}
+        for s in summaries
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[MovieManagerSummary.movie_id, MovieManagerSummary.summary_id],
+        set_={"summary_text": stmt.excluded.summary_text}
+    )
+    result = db.execute(stmt)
+    if commit:
+        db.commit()
+    return result.rowcount
+
 def delete_summaries_from(db: Session, movie_id: int, from_summary_id: int) -> int:
     """특정 summary_id 이후의 모든 요약 삭제 (재시작 시 사용)"""
     deleted_count = db.query(MovieManagerSummary)\
@@ -118,6 +137,15 @@ def get_summaries_up_to(db: Session, movie_id: int, summary_id: int) -> List[Mov
              .order_by(MovieManagerSummary.summary_id)\
              .all() 
 
+def get_summary_rows_up_to(db: Session, movie_id: int, summary_id: int) -> List[dict]:
+    """특정 summary_id까지의 요약을 (summary_id, summary_text) 매핑으로 조회 (ORM 객체 생성 없음)"""
+    return db.execute(
+        select(MovieManagerSummary.summary_id, MovieManagerSummary.summary_text)
+        .where(MovieManagerSummary.movie_id == movie_id)
+        .where(MovieManagerSummary.summary_id <= summary_id)
+        .order_by(MovieManagerSummary.summary_id)
+    ).mappings().all()
+
 def get_custom_prompts(db: Session, movie_id: int) -> Optional[List[str]]:
     """영화의 커스텀 프롬프트들 조회"""
     movie = db.query(Movie).filter(Movie.id == movie_id).first()
@@ -32,6 +32,8 @@ print(f"데이터베이스 연결 URL: {masked_url}")
 # SQLAlchemy 엔진 생성
 engine = create_engine(
     DATABASE_URL,
+    pool_size=10,  # 요청 처리와 DB 쓰기 스레드가 연결을 매번 새로 맺지 않도록 재사용할 연결 수
+    max_overflow=20,
     pool_pre_ping=True,
     pool_recycle=300,
     echo=False  # SQL 로그 출력 (개발시에만)
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, HTTPException
+import logging
 from app.services.moviemanager_service import process_videos_from_folder, process_single_video
 from app.schemas import MovieManagerRequest, MovieManagerResponse
 
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/moviemanager", tags=["moviemanager"])
 
 @router.post("", response_model=MovieManagerResponse)
@@ -29,7 +32,7 @@ async def moviemanager_endpoint(req: MovieManagerRequest):
             if not req.s3_video_uri.startswith("s3://"):
                 raise HTTPException(status_code=400, detail="s3_video_uri는 's3://'로 시작해야 합니다.")
             
-            print(f"🎬 단일 비디오 모드: {req.s3_video_uri}")
+            logger.info("🎬 단일 비디오 모드: %s", req.s3_video_uri)
             result = await process_single_video(
                 s3_video_uri=req.s3_video_uri,
                 characters_info=req.characters_info,
@@ -46,7 +49,7 @@ async def moviemanager_endpoint(req: MovieManagerRequest):
             if not req.s3_folder_path.startswith("s3://"):
                 raise HTTPException(status_code=400, detail="s3_folder_path는 's3://'로 시작해야 합니다.")
             
-            print(f"📁 폴더 모드: {req.s3_folder_path}")
+            logger.info("📁 폴더 모드: %s", req.s3_folder_path)
             result = await process_videos_from_folder(
                 s3_folder_path=req.s3_folder_path,
                 characters_info=req.characters_info,
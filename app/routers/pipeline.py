@@ -1,12 +1,31 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from app.services.transcribe_service import transcribe_video
-from app.services.scene_service import scene_process
-from app.services.summarize_service import summarize_content
+from app.services.summarize_service import summarize_content, summarize_content_stream
 from app.schemas import PipelineRequest, SummarizeResponse
 import asyncio
 
 router = APIRouter(prefix="/pipeline", tags=["pipeline"])
 
+async def analyze_pipeline_input(req: PipelineRequest):
+    """
+    STT와 장면 감지를 병렬로 처리하고 (발화 리스트, 요약용 장면 이미지 리스트)를 반환합니다.
+    """
+    # 장면 처리 모듈(cv2, scenedetect)은 처음 요청될 때 임포트하여 서버 기동 시간을 줄임
+    from app.services.scene_service import scene_process
+    
+    # 병렬 실행
+    transcribe_task = transcribe_video(req.s3_video_uri, req.language_code)
+    scene_task = asyncio.to_thread(scene_process, req.s3_video_uri, req.threshold)
+    utterances, (scenes, _) = await asyncio.gather(transcribe_task, scene_task)
+    
+    # scene의 JPEG 이미지(bytes)와 start_time만 추출 (요약 요청에 bytes 그대로 전달)
+    scene_images = [
+        {"start_time": scene["start_time"], "image": scene["frame_image"]}
+        for scene in scenes
+    ]
+    return utterances, scene_images
+
 @router.post("", response_model=SummarizeResponse)
 async def pipeline_endpoint(req: PipelineRequest):
     """
@@ -16,19 +35,28 @@ async def pipeline_endpoint(req: PipelineRequest):
         raise HTTPException(status_code=400, detail="s3_video_uri는 's3://'로 시작해야 합니다.")
     
     try:
-        # 병렬 실행
-        transcribe_task = asyncio.to_thread(transcribe_video, req.s3_video_uri, req.language_code)
-        scene_task = asyncio.to_thread(scene_process, req.s3_video_uri, req.threshold)
-        utterances, scenes = await asyncio.gather(transcribe_task, scene_task)
-        
-        # scene의 base64 이미지와 start_time만 추출
-        scene_images = [
-            {"start_time": scene["start_time"], "image": scene["frame_image"]}
-            for scene in scenes
-        ]
+        utterances, scene_images = await analyze_pipeline_input(req)
         
         # summarize 실행 (scene_images를 전달)
         summary = await summarize_content(utterances, scene_images)
         return SummarizeResponse(summary=summary)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"파이프라인 처리 중 오류 발생: {str(e)}") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"파이프라인 처리 중 오류 발생: {str(e)}")
+
+@router.post("/stream")
+async def pipeline_stream_endpoint(req: PipelineRequest):
+    """
+    /pipeline과 같은 처리를 하되, Claude 요약을 생성되는 대로 텍스트 스트림으로 전달합니다.
+    """
+    if not req.s3_video_uri.startswith("s3://"):
+        raise HTTPException(status_code=400, detail="s3_video_uri는 's3://'로 시작해야 합니다.")
+    
+    try:
+        utterances, scene_images = await analyze_pipeline_input(req)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"파이프라인 처리 중 오류 발생: {str(e)}")
+    
+    return StreamingResponse(
+        summarize_content_stream(utterances, scene_images),
+        media_type="text/plain; charset=utf-8"
+    )
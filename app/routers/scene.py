@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException
-from app.services.scene_service import scene_process
 from app.schemas import SceneRequest, SceneResponse
 from typing import List
+from app.services.utils import b64encode
 
 router = APIRouter(prefix="/scene", tags=["scene"])
 
@@ -13,11 +13,14 @@ def detect_scenes_endpoint(req: SceneRequest):
     if not req.s3_video_uri.startswith("s3://"):
         raise HTTPException(status_code=400, detail="s3_video_uri는 's3://'로 시작해야 합니다.")
     
+    # 장면 처리 모듈(cv2, scenedetect)은 처음 요청될 때 임포트하여 서버 기동 시간을 줄임
+    from app.services.scene_service import scene_process
+    
     try:
-        scenes = scene_process(
-            s3_uri=req.s3_video_uri,
-            threshold=req.threshold
-        )
+        scenes, _ = scene_process(req.s3_video_uri, req.threshold)
+        # 장면 처리 과정에서는 JPEG bytes를 그대로 다루고, base64 인코딩은 응답을 만들 때 한 번만 수행
+        for scene in scenes:
+            scene["frame_image"] = b64encode(scene["frame_image"]).decode('ascii')
         return SceneResponse(scenes=scenes)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -40,7 +40,7 @@ class SceneInfo(BaseModel):
     end_time: float
     start_frame: int
     end_frame: int
-    frame_image: str  # base64 encoded image
+    frame_image: str  # base64 encoded image (응답 직전에 JPEG bytes를 인코딩)
 
 class SceneResponse(BaseModel):
     scenes: List[SceneInfo]
@@ -63,7 +63,7 @@ class CombinedResponse(BaseModel):
 # ─────────────────────────────────────────
 class SummarizeRequest(BaseModel):
     utterances: List[UtteranceResponse]  # STT 결과
-    scene_images: List[dict]  # {"start_time": float, "image": str} 형태로 전달
+    scene_images: List[dict]  # {"start_time": float, "image": str | bytes} 형태로 전달 (bytes는 요청 시 base64로 인코딩)
 
 class SummarizeResponse(BaseModel):
     summary: str  # Claude의 요약 응답
@@ -0,0 +1,104 @@
+# app/services/llm_cache_service.py
+
+from dotenv import load_dotenv
+from typing import Optional
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 동일한 입력(프롬프트 + 이미지 + 모델)에 대한 Claude 응답을 재실행 간에도 재사용하기 위한 정확 일치 캐시
+# 켜면 같은 입력으로 다시 실행해도 이전과 똑같은 응답을 돌려주므로, 새 응답을 받으려는 재실행이 많은 환경에서는 끈 상태로 둠
+#   LLM_CACHE_ENABLED: 캐시 사용 여부 (기본 false)
+#   LLM_CACHE_PATH: SQLite 캐시 파일 경로 (기본 /tmp/llm_cache.sqlite3)
+#   LLM_CACHE_MAX_AGE_HOURS: 이 시간보다 오래된 응답은 사용하지 않고 삭제 (기본 168시간 = 7일)
+#   LLM_CACHE_MAX_ROWS: 저장할 최대 응답 수, 넘으면 오래된 것부터 삭제 (기본 10000)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "false").lower() == "true"
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", os.path.join("/tmp", "llm_cache.sqlite3"))
+LLM_CACHE_MAX_AGE_HOURS = float(os.getenv("LLM_CACHE_MAX_AGE_HOURS", "168"))
+LLM_CACHE_MAX_ROWS = int(os.getenv("LLM_CACHE_MAX_ROWS", "10000"))
+
+llm_cache_conn = None
+llm_cache_lock = threading.Lock()
+
+def init_llm_cache():
+    """
+    SQLite 캐시 파일을 열고 테이블을 준비합니다. 처음 사용할 때 한 번만 수행됩니다.
+    """
+    global llm_cache_conn
+
+    if llm_cache_conn is not None:
+        return  # 이미 초기화된 경우 재할당하지 않음
+
+    conn = sqlite3.connect(LLM_CACHE_PATH, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_cache ("
+        "cache_key TEXT PRIMARY KEY, "
+        "response TEXT NOT NULL, "
+        "created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP)"
+    )
+    conn.commit()
+    llm_cache_conn = conn
+
+def make_cache_key(model_id: str, *parts) -> str:
+    """
+    모델 ID와 입력 조각들(str 또는 bytes)로 SHA-256 캐시 키를 만듭니다.
+    조각 사이에 길이를 함께 넣어 경계가 달라도 같은 키가 나오지 않게 합니다.
+    """
+    hasher = hashlib.sha256((model_id or "").encode("utf-8"))
+    for part in parts:
+        data = part.encode("utf-8") if isinstance(part, str) else part
+        hasher.update(len(data).to_bytes(8, "little"))
+        hasher.update(data)
+    return hasher.hexdigest()
+
+def get_cached_response(cache_key: str) -> Optional[str]:
+    """
+    캐시에 저장된 응답을 반환합니다. 없거나 캐시를 사용할 수 없으면 None을 반환합니다.
+    """
+    if not LLM_CACHE_ENABLED:
+        return None
+    try:
+        with llm_cache_lock:
+            init_llm_cache()
+            row = llm_cache_conn.execute(
+                "SELECT response FROM llm_cache WHERE cache_key = ? AND created_at >= datetime('now', ?)",
+                (cache_key, f"-{LLM_CACHE_MAX_AGE_HOURS} hours")
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        logger.warning("⚠️ LLM 캐시 조회 실패: %s", e)
+        return None
+
+def put_cached_response(cache_key: str, response: str):
+    """
+    응답을 캐시에 저장합니다. 캐시 저장 실패는 요약 처리에 영향을 주지 않도록 경고만 남깁니다.
+    """
+    if not LLM_CACHE_ENABLED:
+        return
+    try:
+        with llm_cache_lock:
+            init_llm_cache()
+            llm_cache_conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (cache_key, response) VALUES (?, ?)",
+                (cache_key, response)
+            )
+            # 오래된 응답과 최대 개수를 넘는 응답을 정리하여 캐시 파일이 계속 커지지 않도록 함
+            llm_cache_conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < datetime('now', ?)",
+                (f"-{LLM_CACHE_MAX_AGE_HOURS} hours",)
+            )
+            llm_cache_conn.execute(
+                "DELETE FROM llm_cache WHERE cache_key IN ("
+                "SELECT cache_key FROM llm_cache ORDER BY rowid DESC LIMIT -1 OFFSET ?)",
+                (LLM_CACHE_MAX_ROWS,)
+            )
+            llm_cache_conn.commit()
+    except sqlite3.Error as e:
+        logger.warning("⚠️ LLM 캐시 저장 실패: %s", e)
@@ -3,8 +3,9 @@
 from dotenv import load_dotenv
 from typing import List
 import boto3
+from botocore.config import Config
+from app.services.utils import json_dumps, json_loads
 import os
-import json
 
 load_dotenv()
 
@@ -29,10 +30,12 @@ def init_marengo_client():
     if not (aws_key and aws_secret and MARENGO_MODEL_ID):
         raise RuntimeError("필수 환경 변수가 설정되지 않았습니다: AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY, MARENGO_MODEL_ID")
 
+    # 장면 임베딩 스레드들이 이 클라이언트 하나를 공유하므로 동시 요청 수만큼 연결 풀을 확보 (botocore 기본값 10)
     marengo_client = boto3.client(service_name='bedrock-runtime',
         region_name=aws_region,
         aws_access_key_id=aws_key,
-        aws_secret_access_key=aws_secret)
+        aws_secret_access_key=aws_secret,
+        config=Config(max_pool_connections=int(os.getenv("MARENGO_MAX_POOL_CONNECTIONS", "32"))))
 
 def embed_marengo(input_type: str, input: str) -> List[float]:
     """
@@ -60,13 +63,13 @@ def embed_marengo(input_type: str, input: str) -> List[float]:
         raise RuntimeError("Marengo Bedrock 클라이언트가 초기화되지 않았습니다.")
     response = marengo_client.invoke_model(
         modelId=MARENGO_MODEL_ID,
-        body=json.dumps(message)
+        body=json_dumps(message)
     )
 
     
 
     # response["body"]는 StreamingBody → .read() 필요
-    result = json.loads(response["body"].read())
+    result = json_loads(response["body"].read())
 
     embedding = result['data'][0]['embedding']
 
@@ -1,15 +1,25 @@
 import os
-import json
-import boto3
+from botocore.exceptions import ClientError
 import re
-from typing import List, Dict
+import hashlib
+import bisect
+import logging
+import time
+import shutil
+import tempfile
+import threading
+import multiprocessing
+from typing import List, Dict, Iterable, Mapping
+from types import MappingProxyType
 from app.services.transcribe_service import transcribe_video
-from app.services.scene_service import scene_process, download_json_from_s3, delete_embeddings_and_thumbnails
 from app.services.video_chunk_service import generate_video_chunks_info, extract_chunk_for_processing, cleanup_chunk_file
 from app.services.marengo_service import embed_marengo
+from app.services.llm_cache_service import make_cache_key, get_cached_response, put_cached_response
+from app.services.utils import json_dumps, json_loads, get_aws_client, s3_bucket_and_key, BEDROCK_SEM
 from app.crud import (
-    create_or_update_summary, 
+    upsert_summaries, 
     get_summaries_up_to, 
+    get_summary_rows_up_to,
     delete_summaries_from,
     update_movie_status, 
     mark_movie_failed,
@@ -22,12 +32,155 @@ from app.crud import (
 )
 from app.database import SessionLocal
 import asyncio
+import functools
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import numpy as np
 from app.services.claude_service import init_claude_client, bedrock_client
+from dotenv import load_dotenv
 
-def load_prompts(language: str = "kor") -> Dict[str, str]:
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# 프로세스 수명 동안 바뀌지 않는 환경변수는 임포트 시점에 한 번만 읽음
+AWS_REGION = os.getenv("AWS_DEFAULT_REGION")
+CLAUDE_MODEL_ID = os.getenv("CLAUDE_MODEL_ID")
+SCENES_BUCKET = os.getenv("SCENES_BUCKET")
+
+def get_bedrock_runtime_client():
+    """
+    프로세스 내에서 공유하는 Bedrock Runtime 클라이언트를 반환합니다.
+    """
+    return get_aws_client('bedrock-runtime', region_name=AWS_REGION)
+
+def get_s3_client():
+    """
+    프로세스 내에서 공유하는 S3 클라이언트를 반환합니다.
+    """
+    return get_aws_client('s3')
+
+# Rolling Context로 프롬프트에 포함할 직전 요약 개수
+ROLLING_CONTEXT_SIZE = 3
+
+# 프롬프트에서 청크마다 동일한 앞부분(등장인물 정보, 지시문)과 이후 가변 부분을 나누는 경계 표시
+PROMPT_CACHE_BOUNDARY = "\x00PROMPT_CACHE_BOUNDARY\x00"
+
+# Bedrock 프롬프트 캐싱(cachePoint) 사용 여부. 캐싱을 지원하지 않는 모델(CLAUDE_MODEL_ID)이면 false로 설정
+# (켜 둔 상태에서 모델이 cachePoint를 거부하면 cachePoint 없이 한 번 다시 요청함)
+BEDROCK_PROMPT_CACHE_ENABLED = os.getenv("BEDROCK_PROMPT_CACHE", "true").lower() == "true"
+CACHE_POINT_BLOCK = {"cachePoint": {"type": "default"}}
+
+# DB 쓰기 스레드가 수명 동안 재사용하는 세션 (쓰기마다 세션을 새로 만들고 닫지 않음)
+DB_WRITER_LOCAL = threading.local()
+
+# DB 쓰기 스레드가 존재를 확인한 영화 ID를 다시 조회하지 않고 재사용하는 시간 (초)
+MOVIE_CHECK_TTL = 60.0
+
+def _init_db_writer():
+    """
+    DB 쓰기 스레드 초기화: 스레드 전용 세션과 영화 존재 확인 캐시를 하나씩 만들어 둡니다.
+    """
+    DB_WRITER_LOCAL.session = SessionLocal()
+    DB_WRITER_LOCAL.verified_movies = {}  # movie_id -> (title, 확인 시각)
+
+# DB 쓰기 전용 단일 스레드: 요청 흐름을 막지 않으면서 제출 순서대로 커밋되어 상태가 역행하지 않음
+DB_WRITE_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="db-writer", initializer=_init_db_writer)
+
+# True이면 Rolling Context 창에서 밀려난 요약들을 하나의 누적 요약(memento)으로 압축해 계속 프롬프트에 포함
+ROLLING_MEMENTO_ENABLED = os.getenv("ROLLING_MEMENTO", "false").lower() == "true"
+
+# 청크/비디오 요약을 몇 개씩 모아 한 번의 INSERT와 커밋으로 저장할지 (재시작 시 최대 이 개수만큼만 다시 요약)
+SUMMARY_SAVE_BATCH_SIZE = max(1, int(os.getenv("SUMMARY_SAVE_BATCH_SIZE", "4")))
+
+# 진행 상태(PROCEEDING[i/N]) 기록 간격 (초). 이 간격 또는 전체의 1% 단위마다만 DB에 기록
+STATUS_WRITE_INTERVAL = float(os.getenv("STATUS_WRITE_INTERVAL", "30"))
+
+# 번역 결과 캐시 (입력 묶음 해시 -> 번역 리스트). 같은 영화 재실행/재시도 시 Bedrock 왕복을 생략
+TRANSLATE_CACHE_SIZE = 256
+translate_cache: "OrderedDict[str, list[str]]" = OrderedDict()
+
+# 장면 감지(프레임 디코딩, 품질 검사, JPEG 인코딩)는 CPU 위주 작업이므로 GIL을 피해 별도 프로세스에서 실행
+# STT는 AWS Transcribe 호출/폴링뿐이라 스레드로 충분함
+# fork로 워커를 만들면 부모의 스레드(로그 리스너, DB 쓰기, S3 I/O)가 잡고 있던 잠금과 S3/Bedrock 연결 풀 소켓까지 복사되므로,
+# spawn으로 새 인터프리터에서 시작하고 풀은 장면 처리가 처음 필요할 때 만듦
+SCENE_PROCESS_WORKERS = max(1, int(os.getenv("SCENE_PROCESS_WORKERS", str(os.cpu_count() or 1))))
+scene_process_pool = None
+scene_process_pool_lock = threading.Lock()
+
+def get_scene_process_pool() -> ProcessPoolExecutor:
+    """
+    장면 처리 프로세스 풀을 처음 사용할 때 한 번만 생성하여 반환합니다.
+    """
+    global scene_process_pool
+    if scene_process_pool is None:
+        with scene_process_pool_lock:
+            if scene_process_pool is None:
+                from app.services.scene_service import init_scene_worker
+                scene_process_pool = ProcessPoolExecutor(
+                    max_workers=SCENE_PROCESS_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=init_scene_worker
+                )
+    return scene_process_pool
+
+async def run_scene_process(*args) -> tuple[List[Dict], str]:
+    """
+    scene_process를 장면 처리 프로세스 풀에서 실행합니다.
+    scene_service(cv2, scenedetect)는 장면 처리가 처음 필요할 때 임포트하여 서버 기동 시간을 줄입니다.
+    """
+    from app.services.scene_service import scene_process
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_scene_process_pool(), scene_process, *args)
+
+# S3/ffprobe/ffmpeg 같은 네트워크 I/O 전용 스레드 풀
+# 기본 실행기는 오래 걸리는 transcribe/Bedrock 호출이 스레드를 점유하므로, 짧은 S3 작업이 그 뒤에 줄 서지 않도록 분리
+S3_IO_EXECUTOR = ThreadPoolExecutor(max_workers=int(os.getenv("S3_IO_MAX_WORKERS", "8")), thread_name_prefix="s3-io")
+
+async def run_s3_io(func, *args):
+    """
+    네트워크 I/O 위주의 동기 함수를 S3_IO_EXECUTOR에서 실행하여 이벤트 루프를 막지 않고 결과를 기다립니다.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(S3_IO_EXECUTOR, functools.partial(func, *args))
+
+def get_frames_dir(movie_id: int, video_index: int = None) -> str:
+    """
+    장면 프레임 임시 파일을 저장할 폴더 경로 (/tmp/movie_{movie_id}/video_{i})
+    video_index가 없으면 영화 단위 상위 폴더를 반환합니다.
+    """
+    movie_dir = os.path.join(tempfile.gettempdir(), f"movie_{movie_id}")
+    if video_index is None:
+        return movie_dir
+    return os.path.join(movie_dir, f"video_{video_index}")
+
+# 폴더 모드에서 Claude 요약과 겹쳐서 미리 분석(STT + 장면 감지)해 둘 비디오 개수
+# STT 대기는 스레드를 점유하지 않으므로, Transcribe 동시 작업 한도(TRANSCRIBE_MAX_CONCURRENCY)와 디스크/메모리 여유에 맞춰 늘릴 수 있음
+FOLDER_PREFETCH_DEPTH = max(1, int(os.getenv("FOLDER_PREFETCH_DEPTH", "2")))
+
+# 단일 비디오 모드에서 Claude 요약과 겹쳐서 미리 추출/분석해 둘 청크 개수
+CHUNK_PREFETCH_DEPTH = max(1, int(os.getenv("CHUNK_PREFETCH_DEPTH", "2")))
+
+# 폴더 모드에서 처리 대상으로 인식하는 비디오 확장자 (소문자)
+VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm')
+
+# 프롬프트 파일의 섹션 헤더 (한 줄 전체가 <<SECTION>> 형태)
+PROMPT_SECTION_RE = re.compile(r'(?m)^[ \t]*<<(.+?)>>[ \t\r]*$')
+
+# 자연 정렬용 숫자 분리 패턴
+NATURAL_SORT_SPLIT_RE = re.compile(r'(\d+)')
+
+# Claude 응답의 장면 선택 블록과 그 안의 장면 번호
+SCENE_SELECTION_RE = re.compile(r'\[SCENE_SELECTION\](.*?)\[/SCENE_SELECTION\]', re.DOTALL)
+SCENE_NUMBER_RE = re.compile(r'\d+')
+# 장면 선택 블록의 한 줄: "번호. 검색어: 장면 번호들" (검색어에 ':'가 있어도 마지막 ':' 기준으로 분리)
+SCENE_SELECTION_ROW_RE = re.compile(r'(?m)^[ \t]*(\d+)\.[ \t]*.*:[ \t]*([^\n:]*)$')
+
+@functools.lru_cache(maxsize=4)
+def load_prompts(language: str = "kor") -> Mapping[str, str]:
     """
     prompts.txt 파일에서 프롬프트 템플릿을 로드합니다.
+    언어별로 프로세스당 한 번만 읽고 파싱하며, 캐시된 결과를 보호하기 위해 읽기 전용 매핑으로 반환합니다.
     """
     if language == "eng":
         prompts_file_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "prompts_eng.txt")
@@ -37,33 +190,12 @@ def load_prompts(language: str = "kor") -> Dict[str, str]:
     with open(prompts_file_path, 'r', encoding='utf-8') as f:
         content = f.read()
     
-    prompts = {}
-    # 줄 단위로 파싱하여 섹션을 식별
-    lines = content.split('\n')
-    current_section = None
-    current_content = []
-    
-    for line in lines:
-        # 섹션 헤더 식별 (줄의 시작과 끝이 <<>>로 둘러싸인 경우)
-        if line.strip().startswith('<<') and line.strip().endswith('>>'):
-            # 이전 섹션 저장
-            if current_section and current_content:
-                prompts[current_section] = '\n'.join(current_content).strip()
-            
-            # 새 섹션 시작
-            current_section = line.strip()[2:-2]  # << >> 제거
-            current_content = []
-        else:
-            # 섹션 내용 추가
-            if current_section:
-                current_content.append(line)
-    
-    # 마지막 섹션 저장
-    if current_section and current_content:
-        prompts[current_section] = '\n'.join(current_content).strip()
+    # [섹션 이전 내용, 이름1, 내용1, 이름2, 내용2, ...] 형태로 한 번에 분리
+    parts = PROMPT_SECTION_RE.split(content)
+    prompts = {parts[i].strip(): parts[i + 1].strip() for i in range(1, len(parts), 2)}
     
-    print(f"📄 프롬프트 템플릿 로드 완료: {list(prompts.keys())}")
-    return prompts
+    logger.info("📄 프롬프트 템플릿 로드 완료: %s", list(prompts.keys()))
+    return MappingProxyType(prompts)
 
 
 def natural_sort_key(s: str) -> List:
@@ -72,7 +204,7 @@ def natural_sort_key(s: str) -> List:
     숫자가 포함된 문자열을 올바른 순서로 정렬합니다.
     예: video_1.mp4, video_2.mp4, ..., video_10.mp4
     """
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
+    return [int(text) if text.isdigit() else text.lower() for text in NATURAL_SORT_SPLIT_RE.split(s)]
 
 def get_video_files_from_s3_folder(s3_folder_path: str) -> List[str]:
     """
@@ -90,55 +222,86 @@ def get_video_files_from_s3_folder(s3_folder_path: str) -> List[str]:
     if prefix and not prefix.endswith("/"):
         prefix += "/"
     
-    s3 = boto3.client('s3')
+    s3 = get_s3_client()
     
     try:
-        # S3 폴더 내 모든 객체 조회
-        response = s3.list_objects_v2(Bucket=bucket, Prefix=prefix)
+        # S3 폴더 내 모든 객체 조회 (1000개 단위 페이지를 끝까지 순회, 폴더 자체 키(/로 끝남)는 JMESPath로 제외)
+        paginator = s3.get_paginator('list_objects_v2')
+        keys = [
+            key for key in paginator.paginate(Bucket=bucket, Prefix=prefix).search("Contents[?!ends_with(Key, '/')].Key")
+            if key is not None  # Contents가 없는 페이지는 None
+        ]
         
-        if 'Contents' not in response:
+        if not keys:
             raise ValueError(f"S3 폴더가 비어있거나 존재하지 않습니다: {s3_folder_path}")
         
-        # 비디오 파일 확장자 필터링
-        video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm']
-        video_files = []
-        
-        for obj in response['Contents']:
-            key = obj['Key']
-            # 폴더 자체는 제외 (키가 /로 끝나는 경우)
-            if key.endswith('/'):
-                continue
-                
-            # 비디오 파일인지 확인
-            file_extension = os.path.splitext(key)[1].lower()
-            if file_extension in video_extensions:
-                video_uri = f"s3://{bucket}/{key}"
-                video_files.append(video_uri)
+        # 비디오 파일 확장자 필터링 (확장자 튜플로 한 번에 검사)
+        video_keys = [key for key in keys if key.lower().endswith(VIDEO_EXTENSIONS)]
         
-        if not video_files:
+        if not video_keys:
             raise ValueError(f"S3 폴더에 비디오 파일이 없습니다: {s3_folder_path}")
         
         # 자연스러운 정렬 (숫자를 고려한 정렬)
         # 예: video_1.mp4, video_2.mp4, ..., video_10.mp4 순서로 정렬
-        video_files.sort(key=natural_sort_key)
+        # list.sort는 정렬 키를 요소마다 한 번만 계산하며, 공통 접두사(s3://버킷/)가 붙기 전의 키로 정렬해 분할할 문자열을 줄임
+        video_keys.sort(key=natural_sort_key)
+        video_files = [f"s3://{bucket}/{key}" for key in video_keys]
         
-        print(f"📁 S3 폴더에서 {len(video_files)}개의 비디오 파일을 발견했습니다:")
-        for i, video_file in enumerate(video_files):
-            print(f"   {i+1}. {video_file}")
+        logger.info("📁 S3 폴더에서 %s개의 비디오 파일을 발견했습니다.", len(video_files))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, video_file in enumerate(video_files):
+                logger.debug("   %s. %s", i + 1, video_file)
         
         return video_files
         
     except Exception as e:
         raise RuntimeError(f"S3 폴더 조회 중 오류 발생: {str(e)}")
 
-def create_claude_prompt_with_context(utterances: List[Dict], scene_images: List[Dict], characters_info: str, previous_summaries: List[str] = None, current_video_index: int = 0, prompt_language: str = "kor", custom_utterance = None, with_cw=True, retrieval_queries: List[str] = None) -> str:
+@functools.lru_cache(maxsize=8)
+def render_analysis_base_template(prompt_language: str, characters_info: str) -> tuple[str, bool]:
+    """
+    VIDEO_ANALYSIS_PROMPT 템플릿에 영화 단위로 고정된 등장인물 정보를 미리 채워 둔 기본 템플릿을 반환합니다.
+    같은 영화의 청크들은 (언어, 등장인물 정보)가 같으므로 치환과 캐시 경계 판단을 한 번만 수행합니다.
+    returns:
+        (등장인물 정보가 채워진 템플릿, {context}가 청크별 내용보다 앞에 있는지 여부)
+    """
+    template = load_prompts(prompt_language).get("VIDEO_ANALYSIS_PROMPT", "")
+    
+    # 정적 앞부분이 청크별 내용(대화, 장면)을 포함하지 않을 때만 캐시 경계 표시 가능
+    context_pos = template.find("{context}")
+    context_first = context_pos >= 0 and all(
+        template.find(field) < 0 or context_pos < template.find(field)
+        for field in ("{conversation}", "{scene_times}")
+    )
+    
+    if not context_first:
+        # 캐시 경계를 둘 수 없으면 청크마다 프롬프트 전체를 새로 처리하게 되므로 템플릿 순서를 알림 (영화당 한 번)
+        logger.warning("⚠️ VIDEO_ANALYSIS_PROMPT에서 {context}가 {conversation}/{scene_times}보다 뒤에 있어 프롬프트 캐싱을 적용할 수 없습니다. 고정 지시문과 {characters_info}를 앞에 두세요.")
+    
+    # 이후 청크별 format에서 등장인물 정보의 중괄호가 필드로 해석되지 않도록 이스케이프
+    escaped_characters_info = (characters_info or "").replace("{", "{{").replace("}", "}}")
+    return template.replace("{characters_info}", escaped_characters_info), context_first
+
+
+def create_claude_prompt_with_context(utterances: List[Dict], scene_images: List[Dict], characters_info: str, previous_summaries: List[str] = None, current_video_index: int = 0, prompt_language: str = "kor", custom_utterance = None, with_cw=True, retrieval_queries: List[str] = None, cache_split: bool = False, rolling_memento: str = None, base_template: tuple[str, bool] = None) -> str:
     """
     Rolling Context 기법으로 최근 3개 비디오 요약만 포함하여 Claude 프롬프트를 생성합니다.
     장면과 대사를 시간대별로 연결하여 제공합니다.
+    cache_split이 True이고 템플릿에서 {context}가 청크별 내용보다 앞에 있으면,
+    정적인 앞부분 바로 뒤에 PROMPT_CACHE_BOUNDARY를 넣어 프롬프트 캐싱 경계로 쓸 수 있게 합니다.
+    base_template은 호출하는 쪽이 루프 밖에서 render_analysis_base_template으로 한 번 만든 값이며, 없으면 여기서 조회합니다.
     """
-    # 프롬프트 템플릿 로드
-    prompts = load_prompts(prompt_language)
-    template = prompts.get("VIDEO_ANALYSIS_PROMPT", "")
+    # 등장인물 정보가 미리 채워진 영화 단위 기본 템플릿 (청크마다 다시 치환하지 않음)
+    if base_template is None:
+        base_template = render_analysis_base_template(prompt_language, characters_info)
+    template, context_first = base_template
+    mark_cache_boundary = cache_split and context_first
+    
+    # 발화별 대사 문자열은 한 번만 만들어 대화 내용과 장면별 대사에 함께 사용 (텍스트가 없으면 None)
+    dialogue_lines = [
+        f"[{utt.get('speaker', 'Unknown')}] {utt['text']}" if utt and utt.get('text') else None
+        for utt in utterances
+    ] if utterances else []
     
     if custom_utterance:
         conversation = custom_utterance
@@ -146,56 +309,53 @@ def create_claude_prompt_with_context(utterances: List[Dict], scene_images: List
     else: 
         # 안전한 conversation 생성
         if utterances:
-            conversation = "\n".join([
-                f"[{utterance.get('speaker', 'Unknown')}] {utterance.get('text', '')}"
-                for utterance in utterances if utterance and utterance.get('text')
-            ])
+            conversation = "\n".join(line for line in dialogue_lines if line)
         else:
             conversation = "(이 영상에는 대화 내용이 없습니다)"
     
     # 안전한 scene_times 생성 -> 장면과 대사를 시간대별로 연결
     scene_dialogue_mapping = ""
     if scene_images and utterances:
-        scene_info_list = []
-        for i, scene in enumerate(scene_images):
-            if scene:
-                scene_start = scene.get('start_time', 0)
-                scene_end = scene_start + 5  # 장면 길이를 5초로 가정 (또는 scene에 end_time이 있다면 사용)
-                
-                # 해당 장면 시간대의 대사 찾기
-                scene_utterances = [
-                    utt for utt in utterances
-                    if utt.get('start_time', 0) < scene_end and utt.get('end_time', 0) > scene_start
-                ]
-                
-                dialogue_texts = []
-                for utt in scene_utterances:
-                    speaker = utt.get('speaker', 'Unknown')
-                    text = utt.get('text', '')
-                    if text:
-                        dialogue_texts.append(f"[{speaker}] {text}")
-                
-                dialogue = " / ".join(dialogue_texts) if dialogue_texts else "(대사 없음)"
-                
-                scene_info_list.append(
-                    f"Scene {i}: 시간={scene_start:.1f}s, 대사: {dialogue}"
-                )
+        # 발화를 시작 시간 순으로 한 번만 정렬해 두고, 장면마다 겹칠 수 있는 구간만 이분 탐색으로 확인
+        utt_starts = [utt.get('start_time', 0) for utt in utterances]
+        utt_ends = [utt.get('end_time', 0) for utt in utterances]
+        utt_order = sorted(range(len(utterances)), key=utt_starts.__getitem__)
+        sorted_starts = [utt_starts[k] for k in utt_order]
+        # 가장 긴 발화 길이: 이보다 먼저 시작한 발화는 장면 시작 전에 끝나므로 탐색에서 제외
+        max_utt_duration = max(0, max(end - start for start, end in zip(utt_starts, utt_ends)))
+        
+        def scene_info_lines():
+            for i, scene in enumerate(scene_images):
+                if scene:
+                    scene_start = scene.get('start_time', 0)
+                    scene_end = scene_start + 5  # 장면 길이를 5초로 가정 (또는 scene에 end_time이 있다면 사용)
+                    
+                    # 해당 장면 시간대의 대사 찾기 (원래 발화 순서 유지)
+                    lo = bisect.bisect_right(sorted_starts, scene_start - max_utt_duration)
+                    hi = bisect.bisect_left(sorted_starts, scene_end)
+                    matched = sorted(
+                        k for k in utt_order[lo:hi]
+                        if utt_ends[k] > scene_start and dialogue_lines[k]
+                    )
+                    
+                    dialogue = " / ".join(dialogue_lines[k] for k in matched) if matched else "(대사 없음)"
+                    yield f"Scene {i}: 시간={scene_start:.1f}s, 대사: {dialogue}"
         
-        scene_dialogue_mapping = "\n".join(scene_info_list)
+        scene_dialogue_mapping = "\n".join(scene_info_lines())
     elif scene_images:
         # utterances가 없는 경우 기존 방식
-        scene_dialogue_mapping = "\n".join([
+        scene_dialogue_mapping = "\n".join(
             f"Scene {i}: 시간={scene.get('start_time', 0):.1f}s"
             for i, scene in enumerate(scene_images) if scene
-        ])
+        )
     else:
         scene_dialogue_mapping = "(이 영상에는 장면 정보가 없습니다)"
     
-    # Rolling Context: 최근 3개 비디오 요약만 사용
+    # Rolling Context: 최근 ROLLING_CONTEXT_SIZE개 비디오 요약만 사용
     context = ""
     if previous_summaries and with_cw:
-        # 최근 3개만 선택 (현재 비디오 직전 3개)
-        recent_summaries = previous_summaries[-3:]
+        # 최근 3개만 선택 (현재 비디오 직전 3개, deque로 전달되어도 동작)
+        recent_summaries = list(previous_summaries)[-ROLLING_CONTEXT_SIZE:]
         start_index = max(0, current_video_index - len(recent_summaries))
         
         context = "\n\n[최근 영상들의 줄거리]\n" + "\n\n".join([
@@ -203,33 +363,67 @@ def create_claude_prompt_with_context(utterances: List[Dict], scene_images: List
             for i, summary in enumerate(recent_summaries)
         ]) + "\n\n"
         
-        print(f"📚 Rolling Context: 최근 {len(recent_summaries)}개 영상의 요약을 컨텍스트로 사용 (영상 {start_index + 1}~{current_video_index})")
+        if rolling_memento:
+            # 창 밖의 이전 영상들은 압축된 누적 요약으로 제공
+            context = f"\n\n[영상 1~{start_index}의 누적 줄거리]\n{rolling_memento}" + context
+        
+        logger.debug("📚 Rolling Context: 최근 %s개 영상의 요약을 컨텍스트로 사용 (영상 %s~%s)", len(recent_summaries), start_index + 1, current_video_index)
     
     # 템플릿에 변수 삽입
     prompt = template.format(
-        characters_info=characters_info,
-        context=context,
+        context=PROMPT_CACHE_BOUNDARY + context if mark_cache_boundary else context,
         conversation=conversation,
         scene_times=scene_dialogue_mapping
     )
     
     # retrieval_queries가 있는 경우 추가 프롬프트
     if retrieval_queries:
-        retrieval_section = "\n\n=== 장면 검색 요청 ===\n"
-        retrieval_section += "사용자가 다음 검색어로 장면을 찾고 싶어합니다:\n"
-        for idx, query in enumerate(retrieval_queries, 1):
-            retrieval_section += f"{idx}. {query}\n"
-        retrieval_section += "\n위 장면 목록에서 각 검색어와 가장 관련된 장면 번호들을 선택해주세요.\n"
-        retrieval_section += "응답 마지막에 다음 형식으로 추가해주세요:\n"
-        retrieval_section += "[SCENE_SELECTION]\n"
-        for idx, query in enumerate(retrieval_queries, 1):
-            retrieval_section += f"{idx}. {query}: Scene 번호 (쉼표로 구분, 예: 0, 3, 7)\n"
-        retrieval_section += "[/SCENE_SELECTION]"
-        
-        prompt += retrieval_section
+        # 조각을 모아 한 번에 이어붙임 (반복적인 문자열 += 없이)
+        retrieval_parts = ["\n\n=== 장면 검색 요청 ===", "사용자가 다음 검색어로 장면을 찾고 싶어합니다:"]
+        retrieval_parts.extend(f"{idx}. {query}" for idx, query in enumerate(retrieval_queries, 1))
+        retrieval_parts.extend([
+            "",
+            "위 장면 목록에서 각 검색어와 가장 관련된 장면 번호들을 선택해주세요.",
+            "응답 마지막에 다음 형식으로 추가해주세요:",
+            "[SCENE_SELECTION]"
+        ])
+        retrieval_parts.extend(f"{idx}. {query}: Scene 번호 (쉼표로 구분, 예: 0, 3, 7)" for idx, query in enumerate(retrieval_queries, 1))
+        retrieval_parts.append("[/SCENE_SELECTION]")
+        
+        prompt += "\n".join(retrieval_parts)
     
     return prompt
 
+def _read_claude_stream(bedrock, model_id: str, request_body: Dict) -> str:
+    """
+    invoke_model_with_response_stream으로 Claude 응답을 받아 텍스트 델타를 이어붙입니다.
+    """
+    response = bedrock.invoke_model_with_response_stream(
+        modelId=model_id,
+        body=json_dumps(request_body)
+    )
+
+    text_parts = []
+    for event in response['body']:
+        chunk = event.get('chunk')
+        if not chunk:
+            continue
+        payload = json_loads(chunk['bytes'])
+        if payload.get('type') == 'content_block_delta':
+            delta = payload.get('delta', {})
+            if delta.get('type') == 'text_delta':
+                text_parts.append(delta.get('text', ''))
+
+    return "".join(text_parts)
+
+async def invoke_claude_stream(bedrock, model_id: str, request_body: Dict) -> str:
+    """
+    Claude 스트리밍 응답을 별도 스레드에서 소비하여 이벤트 루프를 막지 않고 전체 텍스트를 반환합니다.
+    응답이 생성되는 동안 다른 작업(다음 청크 추출 등)이 이벤트 루프에서 진행될 수 있습니다.
+    """
+    async with BEDROCK_SEM:
+        return await asyncio.to_thread(_read_claude_stream, bedrock, model_id, request_body)
+
 async def translate_with_claude(text_list: list[str]) -> list[str]:
     """
     자동으로 비영어권 텍스트면 영어로 번역합니다.
@@ -239,11 +433,19 @@ async def translate_with_claude(text_list: list[str]) -> list[str]:
         list[str]: 번역된 텍스트 리스트
     """
 
-    bedrock = boto3.client(
-        service_name='bedrock-runtime',
-        region_name=os.getenv("AWS_DEFAULT_REGION")
-    )
-    model_id = os.getenv("CLAUDE_MODEL_ID")
+    # 모두 ASCII면 이미 영어로 보고 번역 호출 없이 그대로 반환
+    if all(s.isascii() for s in text_list):
+        return list(text_list)
+
+    cache_key = hashlib.blake2b("\x1f".join(text_list).encode("utf-8"), digest_size=16).hexdigest()
+    cached = translate_cache.get(cache_key)
+    if cached is not None:
+        translate_cache.move_to_end(cache_key)
+        logger.info("♻️ 번역 캐시 적중 (%s개)", len(cached))
+        return list(cached)
+
+    bedrock = get_bedrock_runtime_client()
+    model_id = CLAUDE_MODEL_ID
 
     # convert text to string by list comprehension
     prompt = """Translate the following text to English.
@@ -269,34 +471,30 @@ async def translate_with_claude(text_list: list[str]) -> list[str]:
         ]
     }
 
-    response = bedrock.invoke_model(
-        modelId=model_id,
-        body=json.dumps(request_body)
-    )
+    translated_text = await invoke_claude_stream(bedrock, model_id, request_body)
 
-    response_body = json.loads(response['body'].read())
-    translated_text = response_body['content'][0]['text']
-
-    # 디버깅: 모델 답변 출력
-    print("🤖 TRANSLATED RESPONSE:")
-    print("=" * 80)
-    print(translated_text)
-    print("=" * 80)
+    # 디버깅: 모델 답변 출력 (DEBUG 레벨에서만)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🤖 TRANSLATED RESPONSE:\n%s", translated_text)
 
     # 파싱 ### 구분자로 분리
     try:
         translated_list = [part.strip() for part in translated_text.split("###")]
         translated_list = [part for part in translated_list if part]  # 빈 문자열 제거
-        print(f"✅ 번역된 텍스트 개수: {len(translated_list)}")
+        logger.info("✅ 번역된 텍스트 개수: %s", len(translated_list))
         if len(translated_list) != len(text_list):
             raise ValueError("번역된 텍스트 개수가 입력 텍스트 개수와 일치하지 않습니다.")
-        return translated_list
+        # 정상 파싱된 결과만 캐시 (오류 시 원본 반환값은 캐시하지 않음)
+        translate_cache[cache_key] = translated_list
+        if len(translate_cache) > TRANSLATE_CACHE_SIZE:
+            translate_cache.popitem(last=False)
+        return list(translated_list)
     except Exception as e:
-        print(f"❌ 번역 파싱 중 오류: {str(e)}")
+        logger.error("❌ 번역 파싱 중 오류: %s", str(e))
         return text_list  # 오류 시 원본 텍스트 반환
 
 
-async def get_bedrock_response_with_context(utterances: List[Dict], scene_images: List[Dict], characters_info: str, previous_summaries: List[str] = None, current_video_index: int = 0, prompt_language: str = "kor", custom_utterance = None, with_cw=True, retrieval_queries: List[str] = None) -> tuple[str, Dict[str, List[int]]]:
+async def get_bedrock_response_with_context(utterances: List[Dict], scene_images: List[Dict], characters_info: str, previous_summaries: List[str] = None, current_video_index: int = 0, prompt_language: str = "kor", custom_utterance = None, with_cw=True, retrieval_queries: List[str] = None, rolling_memento: str = None, base_template: tuple[str, bool] = None) -> tuple[str, Dict[str, List[int]]]:
     """
     Rolling Context 기법으로 최근 3개 비디오 요약만 컨텍스트로 포함하여 Bedrock Claude 응답을 생성합니다.
     retrieval_queries가 있으면 장면 선택 결과도 함께 반환합니다.
@@ -304,103 +502,169 @@ async def get_bedrock_response_with_context(utterances: List[Dict], scene_images
     Returns:
         tuple[str, Dict[str, List[int]]]: (요약 텍스트, 검색어별 선택된 장면 인덱스)
     """
-    model_id = os.getenv("CLAUDE_MODEL_ID")
+    model_id = CLAUDE_MODEL_ID
 
     # 텍스트 프롬프트 생성 (Rolling Context 적용)
-    text_prompt = create_claude_prompt_with_context(utterances, scene_images, characters_info, previous_summaries, current_video_index, prompt_language=prompt_language, custom_utterance=custom_utterance, with_cw=with_cw, retrieval_queries=retrieval_queries)
+    text_prompt = create_claude_prompt_with_context(utterances, scene_images, characters_info, previous_summaries, current_video_index, prompt_language=prompt_language, custom_utterance=custom_utterance, with_cw=with_cw, retrieval_queries=retrieval_queries, cache_split=True, rolling_memento=rolling_memento, base_template=base_template)
+    static_prefix, _, text_prompt = text_prompt.rpartition(PROMPT_CACHE_BOUNDARY)
     
-    # 디버깅: 프롬프트 출력
-    print("=" * 80)
-    print("📝 PROMPT INPUT:")
-    print("=" * 80)
-    print(text_prompt)
-    print("=" * 80)
+    # 디버깅: 프롬프트 출력 (DEBUG 레벨에서만 포맷팅)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📝 PROMPT INPUT:\n%s%s", static_prefix, text_prompt)
 
     # 멀티모달 메시지 구성 (Converse API 형식)
+    # 청크마다 동일한 앞부분을 먼저 두고 cachePoint를 찍어, 이후 호출에서는 가변 부분만 새로 처리되도록 함
     content = []
+    if static_prefix:
+        content.append({
+            "text": static_prefix
+        })
+        if BEDROCK_PROMPT_CACHE_ENABLED:
+            content.append(CACHE_POINT_BLOCK)
+    image_paths = []
+    image_digests = []
     if scene_images:
-        for i, scene in enumerate(scene_images):
-            if scene and scene.get("image"):
-                # 이미 bytes 형태로 전달됨
-                content.append({
-                    "image": {
-                        "format": "jpeg",
-                        "source": {
-                            "bytes": scene["image"]
+        # 같은 프레임이 반복되면 동일한 이미지 블록을 재사용 (bytes 그대로, 복사 없음)
+        image_blocks = {}
+        for scene in scene_images:
+            if not scene:
+                continue
+            # 메모리 절약을 위해 장면에서 이미지 데이터 제거 (파일로 전달된 경우 요청 직전에 읽음)
+            image_bytes = scene.pop("image", None)
+            if image_bytes is None and scene.get("image_path"):
+                image_path = scene.pop("image_path")
+                image_paths.append(image_path)
+                with open(image_path, "rb") as f:
+                    image_bytes = f.read()
+            if image_bytes:
+                digest = hashlib.blake2b(image_bytes, digest_size=16).digest()
+                image_digests.append(digest)
+                image_block = image_blocks.get(digest)
+                if image_block is None:
+                    image_block = {
+                        "image": {
+                            "format": "jpeg",
+                            "source": {
+                                "bytes": image_bytes
+                            }
                         }
                     }
-                })
-                del scene_images[i]["image"]  # 메모리 절약을 위해 이미지 데이터 제거
+                    image_blocks[digest] = image_block
+                content.append(image_block)
     content.append({
         "text": text_prompt
     })
 
+    # 같은 입력(프롬프트 전체 + 이미지 + 모델)으로 이미 받은 응답이 있으면 재사용 (재시작/재시도 시 Bedrock 호출 생략)
+    cache_key = make_cache_key(model_id, static_prefix, text_prompt, *image_digests)
+
     # Bedrock Converse API 사용
-    bedrock = boto3.client('bedrock-runtime', region_name=os.getenv("AWS_DEFAULT_REGION"))
+    bedrock = get_bedrock_runtime_client()
     
-    response = bedrock.converse(
-        modelId=model_id,
-        messages=[
-            {
-                "role": "user",
-                "content": content
-            }
-        ],
-        inferenceConfig={
-            "maxTokens": 4096
-        }
-    )
-    
-    # Converse API 응답에서 텍스트 추출
-    claude_response = response['output']['message']['content'][0]['text']
+    try:
+        claude_response = await asyncio.to_thread(get_cached_response, cache_key)
+        if claude_response is not None:
+            logger.info("♻️ Claude 응답 캐시 적중: 이전과 동일한 입력이므로 Bedrock 호출을 생략합니다.")
+        else:
+            # 동시 Bedrock 호출 수를 제한하고, 응답을 기다리는 동안 이벤트 루프를 막지 않도록 별도 스레드에서 호출
+            async with BEDROCK_SEM:
+                request = {
+                    "modelId": model_id,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": content
+                        }
+                    ],
+                    "inferenceConfig": {
+                        "maxTokens": 4096
+                    }
+                }
+                try:
+                    response = await asyncio.to_thread(bedrock.converse, **request)
+                except ClientError as e:
+                    # 프롬프트 캐싱을 지원하지 않는 모델은 cachePoint를 ValidationException으로 거부하므로 빼고 한 번만 다시 요청
+                    if e.response.get('Error', {}).get('Code') != 'ValidationException' or CACHE_POINT_BLOCK not in content:
+                        raise
+                    logger.warning("⚠️ 모델이 cachePoint를 거부하여 프롬프트 캐싱 없이 다시 요청합니다 (BEDROCK_PROMPT_CACHE=false로 끌 수 있음): %s", e)
+                    content.remove(CACHE_POINT_BLOCK)
+                    response = await asyncio.to_thread(bedrock.converse, **request)
+            
+            # Converse API 응답에서 텍스트 추출
+            claude_response = response['output']['message']['content'][0]['text']
+            await asyncio.to_thread(put_cached_response, cache_key, claude_response)
+    finally:
+        # 요청이 끝나면 프레임 임시 파일 삭제
+        for image_path in image_paths:
+            try:
+                os.unlink(image_path)
+            except OSError:
+                pass
     
     # 디버깅: 모델 답변 출력
-    print("🤖 CLAUDE RESPONSE:")
-    print("=" * 80)
-    print(claude_response)
-    print("=" * 80)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🤖 CLAUDE RESPONSE:\n%s", claude_response)
     
     # 장면 선택 결과 파싱
     scene_selections = {}
     if retrieval_queries:
         # [SCENE_SELECTION] ... [/SCENE_SELECTION] 섹션 찾기
-        selection_match = re.search(r'\[SCENE_SELECTION\](.*?)\[/SCENE_SELECTION\]', claude_response, re.DOTALL)
+        selection_match = SCENE_SELECTION_RE.search(claude_response)
         if selection_match:
             selection_text = selection_match.group(1)
-            print("\n📌 장면 선택 결과 파싱:")
+            logger.debug("📌 장면 선택 결과 파싱:")
+            
+            # 블록을 한 번만 훑어 줄 번호별 장면 번호 문자열을 모은 뒤 검색어 순서(번호)로 매칭
+            numbers_by_idx = {int(row_idx): numbers.strip() for row_idx, numbers in SCENE_SELECTION_ROW_RE.findall(selection_text)}
             
             for idx, query in enumerate(retrieval_queries, 1):
-                # 각 검색어에 대한 장면 번호 찾기
-                # 해당 줄만 매칭하도록 수정 (줄바꿈 전까지만, 공백도 줄바꿈 제외)
-                pattern = f"{idx}\\.\\s*{re.escape(query)}:[ \\t]*([^\\n]*)"
-                match = re.search(pattern, selection_text)
-                if match:
-                    scene_numbers_str = match.group(1).strip()
-                    # 빈 문자열이 아닌 경우에만 숫자 추출
-                    if scene_numbers_str:
-                        # 숫자만 추출
-                        scene_numbers = [int(n) for n in re.findall(r'\d+', scene_numbers_str)]
-                        if scene_numbers:
-                            scene_selections[query] = scene_numbers
-                            print(f"  {query}: Scene {scene_numbers}")
-                        else:
-                            scene_selections[query] = []
-                            print(f"  {query}: 선택된 장면 없음 (숫자 없음)")
-                    else:
-                        scene_selections[query] = []
-                        print(f"  {query}: 선택된 장면 없음 (빈 응답)")
+                scene_numbers = [int(n) for n in SCENE_NUMBER_RE.findall(numbers_by_idx.get(idx, ""))]
+                scene_selections[query] = scene_numbers
+                if scene_numbers:
+                    logger.debug("  %s: Scene %s", query, scene_numbers)
                 else:
-                    scene_selections[query] = []
-                    print(f"  {query}: 선택된 장면 없음")
+                    logger.debug("  %s: 선택된 장면 없음", query)
             
             # 응답에서 [SCENE_SELECTION] 섹션 제거
-            claude_response = re.sub(r'\[SCENE_SELECTION\].*?\[/SCENE_SELECTION\]', '', claude_response, flags=re.DOTALL).strip()
+            claude_response = SCENE_SELECTION_RE.sub('', claude_response).strip()
     else:
         # retrieval_queries가 없는 경우 빈 딕셔너리 반환
         scene_selections = {}
     
     return claude_response, scene_selections
 
+async def fold_into_memento(rolling_memento: str, evicted_summary: str) -> str:
+    """
+    Rolling Context 창에서 밀려난 요약을 기존 누적 요약(memento)에 합쳐 하나의 짧은 요약으로 압축합니다.
+    창 크기가 고정되어 있으므로 프롬프트에 들어가는 컨텍스트 길이는 영상 수와 무관하게 일정합니다.
+    """
+    bedrock = get_bedrock_runtime_client()
+    
+    prompt = """Merge the story so far and the next part below into one concise plot summary.
+    Keep character names, key events and unresolved threads. Write in the same language as the input.
+    Just output the merged summary without any extra explanation."""
+    prompt += f"\n\n[Story so far]\n{rolling_memento or '(none)'}\n\n[Next part]\n{evicted_summary}"
+    
+    request_body = {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 2048,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {
+                        "type": "text",
+                        "text": prompt
+                    }
+                ]
+            }
+        ]
+    }
+    
+    memento = await invoke_claude_stream(bedrock, CLAUDE_MODEL_ID, request_body)
+    logger.info("🧩 누적 요약(memento) 갱신 완료 (길이: %s 문자)", len(memento))
+    return memento.strip()
+
 def parse_final_summary(final_summary_text: str, expected_len: int) -> Dict[str, str]:
     """
     최종 요약에서 줄거리와 평론을 분리합니다.
@@ -423,7 +687,7 @@ def parse_final_summary(final_summary_text: str, expected_len: int) -> Dict[str,
         return parts
             
     except Exception as e:
-        print(f"❌ 최종 요약 파싱 중 오류: {str(e)}")
+        logger.error("❌ 최종 요약 파싱 중 오류: %s", str(e))
 
 def collect_thumbnail_info(video_summaries: List[Dict], s3_video_uri: str = None) -> Dict[str, any]:
     """
@@ -456,15 +720,15 @@ def collect_thumbnail_info(video_summaries: List[Dict], s3_video_uri: str = None
                 directory_path = "/".join(uri_parts[1:-1])
                 if directory_path:
                     # 같은 디렉토리에 thumbnails 폴더 생성
-                    scenes_bucket = os.getenv("SCENES_BUCKET")
+                    scenes_bucket = SCENES_BUCKET
                     if scenes_bucket:
                         thumbnail_folder_uri = f"s3://{scenes_bucket}/{directory_path}/thumbnails/"
                     else:
-                        print("⚠️ SCENES_BUCKET 환경변수가 설정되지 않았습니다.")
+                        logger.warning("⚠️ SCENES_BUCKET 환경변수가 설정되지 않았습니다.")
         
-        print(f"📷 썸네일 정보 수집 완료:")
-        print(f"   폴더 URI: {thumbnail_folder_uri}")
-        print(f"   개별 URL 개수: {len(thumbnail_urls)}")
+        logger.info("📷 썸네일 정보 수집 완료:")
+        logger.info("   폴더 URI: %s", thumbnail_folder_uri)
+        logger.info("   개별 URL 개수: %s", len(thumbnail_urls))
         
         return {
             "folder_uri": thumbnail_folder_uri,
@@ -472,12 +736,52 @@ def collect_thumbnail_info(video_summaries: List[Dict], s3_video_uri: str = None
         }
         
     except Exception as e:
-        print(f"❌ 썸네일 정보 수집 중 오류: {str(e)}")
+        logger.error("❌ 썸네일 정보 수집 중 오류: %s", str(e))
         return {
             "folder_uri": None,
             "urls": []
         }
 
+@functools.lru_cache(maxsize=32)
+def load_scene_embeddings(embedding_uri: str, etag: str) -> tuple[List[str], Dict[str, int], np.ndarray]:
+    """
+    S3의 임베딩 파일을 다운로드해 (URI 리스트, URI→행 인덱스, 행 정규화된 임베딩 행렬)로 변환합니다.
+    임베딩 파일은 같은 경로에 누적 저장되므로 ETag까지 캐시 키로 사용해, 파일이 바뀌면 다시 로드합니다.
+    반환된 행렬은 캐시에서 공유되므로 읽기 전용입니다.
+    """
+    from app.services.scene_service import download_embeddings_from_s3
+    uri_list, scene_feat_matrix = download_embeddings_from_s3(embedding_uri)
+    logger.info("✅ S3에서 임베딩 벡터 데이터 다운로드 완료 (총 %s개 항목)", len(uri_list))
+    
+    uri_to_idx = {uri: idx for idx, uri in enumerate(uri_list)}
+    
+    # 정규화
+    scene_feat_matrix /= np.linalg.norm(scene_feat_matrix, axis=1, keepdims=True)
+    scene_feat_matrix.flags.writeable = False
+    return uri_list, uri_to_idx, scene_feat_matrix
+
+def get_scene_embeddings(embedding_uri: str) -> tuple[List[str], Dict[str, int], np.ndarray]:
+    """
+    현재 S3 객체의 ETag를 확인한 뒤 load_scene_embeddings 캐시를 통해 임베딩을 반환합니다.
+    """
+    bucket, key = s3_bucket_and_key(embedding_uri)
+    etag = get_s3_client().head_object(Bucket=bucket, Key=key)['ETag']
+    return load_scene_embeddings(embedding_uri, etag)
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수가 높은 순서대로 상위 k개의 인덱스를 반환합니다.
+    전체 정렬 대신 argpartition으로 상위 k개만 골라낸 뒤 그 k개만 정렬합니다.
+    """
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.array([], dtype=int)
+    if k < len(scores):
+        idx = np.argpartition(-scores, k - 1)[:k]
+    else:
+        idx = np.arange(len(scores))
+    return idx[np.argsort(-scores[idx])]
+
 async def get_final_scenes(custom_retrievals: List[str], movie_id: int, video_summaries: List[Dict] = None) -> Dict[str, List[str]]:
     """
     커스텀 검색어들을 사용하여 최종 장면 검색 결과를 생성합니다.
@@ -497,38 +801,40 @@ async def get_final_scenes(custom_retrievals: List[str], movie_id: int, video_su
     """
     
     if not video_summaries:
-        print("⚠️ video_summaries가 제공되지 않았습니다.")
+        logger.warning("⚠️ video_summaries가 제공되지 않았습니다.")
         return {}
+    
+    if not custom_retrievals:
+        return {}  # 검색어가 없으면 빈 결과 반환
 
-    db = SessionLocal()
-    embedding_uri = get_embedding_uri(db, movie_id)
-    db.close()
+    with SessionLocal() as db:
+        embedding_uri = get_embedding_uri(db, movie_id)
     
     if not embedding_uri:
         return {}  # 임베딩이 없으면 빈 결과 반환
     
-    print(f"📊 임베딩 URI: {embedding_uri}")
-
-    # S3에서 임베딩 벡터 딕셔너리(JSON) 다운로드
-    uri2embedding_dict = download_json_from_s3(embedding_uri)
-    print(f"✅ S3에서 임베딩 벡터 데이터 다운로드 완료 (총 {len(uri2embedding_dict)}개 항목)")
+    logger.info("📊 임베딩 URI: %s", embedding_uri)
 
-    uri_list = list(uri2embedding_dict.keys())
-    scene_feat_list = list(uri2embedding_dict.values())
-    scene_feat_matrix = np.array(scene_feat_list)
-    
-    # 정규화
-    scene_feat_matrix = scene_feat_matrix / np.linalg.norm(scene_feat_matrix, axis=1, keepdims=True)
+    # S3 임베딩 벡터 로드 (같은 파일이면 캐시된 정규화 행렬 재사용)
+    uri_list, uri_to_idx, scene_feat_matrix = await run_s3_io(get_scene_embeddings, embedding_uri)
+    logger.info("✅ 임베딩 벡터 데이터 준비 완료 (총 %s개 항목)", len(uri_list))
     
     result = {}
 
     # custom_retrievals가 영어가 아닌 경우 bedrock 요청 통해 번역
-    print("🌐 커스텀 검색어 번역 처리 중...")
+    logger.info("🌐 커스텀 검색어 번역 처리 중...")
     translated_retrievals = await translate_with_claude(custom_retrievals)
     
+    # 모든 검색어를 동시에 임베딩해 정규화한 뒤, 전체 장면과의 코사인 유사도를 한 번의 행렬 곱으로 계산 (검색어 수 × 장면 수)
+    text_matrix = np.array(await asyncio.gather(*(
+        asyncio.to_thread(embed_marengo, "text", text) for text in translated_retrievals
+    )))
+    text_matrix = text_matrix / np.linalg.norm(text_matrix, axis=1, keepdims=True)
+    similarity_matrix = text_matrix @ scene_feat_matrix.T
+    
     # 각 청크에서 LLM이 선택한 장면 문자열 수집
     for i, retrieval in enumerate(custom_retrievals):
-        print(f"\n🔍 검색어 처리 중: '{retrieval}'")
+        logger.info("🔍 검색어 처리 중: '%s'", retrieval)
         
         selected_scene_strings = []
         
@@ -540,7 +846,7 @@ async def get_final_scenes(custom_retrievals: List[str], movie_id: int, video_su
                 selected_scene_strings.extend(chunk_selected)
         
         if not selected_scene_strings:
-            print(f"⚠️ LLM이 '{retrieval}'에 관련된 장면을 찾지 못했습니다.")
+            logger.warning("⚠️ LLM이 '%s'에 관련된 장면을 찾지 못했습니다.", retrieval)
             selected_scene_strings = []
         
         # chunk_n_scene_m 문자열을 URI와 매칭
@@ -550,76 +856,73 @@ async def get_final_scenes(custom_retrievals: List[str], movie_id: int, video_su
             matched_uris = [uri for uri in uri_list if scene_str in uri]
             if matched_uris:
                 selected_uris_from_llm.append(matched_uris[0])  # 첫 번째 매칭 URI 사용
-                print(f"   {scene_str} → {matched_uris[0]}")
+                logger.debug("   %s → %s", scene_str, matched_uris[0])
             else:
-                print(f"   ⚠️ {scene_str}에 매칭되는 URI 없음")
+                logger.debug("   ⚠️ %s에 매칭되는 URI 없음", scene_str)
         
         if not selected_uris_from_llm:
-            print(f"⚠️ 매칭된 URI가 없습니다.")
+            logger.warning("⚠️ 매칭된 URI가 없습니다.")
         
-        print(f"📋 LLM이 선택한 장면: {len(selected_uris_from_llm)}개")
+        logger.info("📋 LLM이 선택한 장면: %s개", len(selected_uris_from_llm))
         
-        # 검색어 임베딩
-        text_vector = embed_marengo("text", translated_retrievals[i])
-        text_vector = np.array(text_vector) / np.linalg.norm(text_vector)
+        # 이 검색어와 전체 장면의 유사도
+        scene_similarities = similarity_matrix[i]
         
         # LLM이 선택한 장면이 3개 미만인 경우
         if len(selected_uris_from_llm) < 3:
             needed_count = 3 - len(selected_uris_from_llm)
-            print(f"⚠️ LLM 선택 장면이 3개 미만입니다. LLM 선택 {len(selected_uris_from_llm)}개 + 유사도 분석 {needed_count}개")
+            logger.warning("⚠️ LLM 선택 장면이 3개 미만입니다. LLM 선택 %s개 + 유사도 분석 %s개", len(selected_uris_from_llm), needed_count)
             
             # LLM이 선택한 장면들의 URI를 먼저 추가
             selected_uris = selected_uris_from_llm.copy()
             
-            # LLM이 선택하지 않은 나머지 장면들
-            remaining_uris = [uri for uri in uri_list if uri not in selected_uris_from_llm]
-            remaining_indices = [uri_list.index(uri) for uri in remaining_uris]
+            # LLM이 선택하지 않은 나머지 장면들 (URI 목록을 다시 훑지 않고 불리언 마스크로 표시)
+            remaining_mask = np.ones(len(uri_list), dtype=bool)
+            remaining_mask[[uri_to_idx[uri] for uri in selected_uris_from_llm]] = False
+            remaining_indices = np.flatnonzero(remaining_mask)
             
-            if remaining_indices:
-                # 나머지 장면들에 대해 유사도 계산
-                remaining_feats = scene_feat_matrix[remaining_indices]
-                remaining_similarities = np.dot(remaining_feats, text_vector)
+            if remaining_indices.size:
+                # 나머지 장면들의 유사도
+                remaining_similarities = scene_similarities[remaining_mask]
                 
                 # 필요한 개수만큼 top-k 선택
-                top_k = min(needed_count, len(remaining_indices))
-                top_k_indices = np.argsort(-remaining_similarities)[:top_k]
+                top_k = min(needed_count, remaining_indices.size)
+                top_indices = top_k_indices(remaining_similarities, top_k)
                 
                 # 추가 장면 URI 추가
-                additional_uris = [uri_list[remaining_indices[idx]] for idx in top_k_indices]
+                additional_uris = [uri_list[remaining_indices[idx]] for idx in top_indices]
                 selected_uris.extend(additional_uris)
                 
             result[retrieval] = selected_uris
-            print(f"✅ 최종 선택: LLM {len(selected_uris_from_llm)}개 + 유사도 {len(selected_uris) - len(selected_uris_from_llm)}개 = 총 {len(result[retrieval])}개")
+            logger.info("✅ 최종 선택: LLM %s개 + 유사도 %s개 = 총 %s개", len(selected_uris_from_llm), len(selected_uris) - len(selected_uris_from_llm), len(result[retrieval]))
         else:
             # 선택된 장면들 중 벡터 유사도 높은 top-3 선택
             selected_uris = selected_uris_from_llm.copy()
-            selected_indices = [uri_list.index(uri) for uri in selected_uris_from_llm]
-            selected_feats = scene_feat_matrix[selected_indices]
+            selected_indices = [uri_to_idx[uri] for uri in selected_uris_from_llm]
             
-            # 코사인 유사도 계산
-            similarities = np.dot(selected_feats, text_vector)
+            # 선택된 장면들의 코사인 유사도
+            similarities = scene_similarities[selected_indices]
             
             # top-3 선택
             top_k = min(3, len(selected_uris))
-            top_k_indices = np.argsort(-similarities)[:top_k]
+            top_indices = top_k_indices(similarities, top_k)
             
-            result[retrieval] = [selected_uris[idx] for idx in top_k_indices]
-            print(f"✅ LLM 선택 장면에서 최종 선택된 장면: {len(result[retrieval])}개")
+            result[retrieval] = [selected_uris[idx] for idx in top_indices]
+            logger.info("✅ LLM 선택 장면에서 최종 선택된 장면: %s개", len(result[retrieval]))
     
     return result
 
     
     
 
-async def create_final_results(video_summaries: List[str], custom_prompts: List[str], characters_info: str, prompt_language: str = "kor") -> List[tuple]:
+async def create_final_results(video_summaries: Iterable[str], custom_prompts: List[str], characters_info: str, prompt_language: str = "kor", rolling_memento: str = None, summary_offset: int = 0) -> List[tuple]:
     """
     모든 비디오 요약을 종합하여 최종 요약을 생성합니다.
+    rolling_memento가 주어지면 video_summaries는 memento 이후의 최근 요약만 담고 있으며,
+    summary_offset은 memento가 포함하는 요약 개수입니다.
     """
-    bedrock = boto3.client(
-        service_name='bedrock-runtime',
-        region_name=os.getenv("AWS_DEFAULT_REGION")
-    )
-    model_id = os.getenv("CLAUDE_MODEL_ID")
+    bedrock = get_bedrock_runtime_client()
+    model_id = CLAUDE_MODEL_ID
 
     # 프롬프트 템플릿 로드
     pre_prompts = load_prompts(prompt_language)
@@ -627,11 +930,13 @@ async def create_final_results(video_summaries: List[str], custom_prompts: List[
     # 각 입력 프롬프트 가져오기.
     template = pre_prompts.get("FINAL_SUMMARY_PROMPT", "")
 
-    # 모든 요약을 하나로 합침
-    all_summaries = "\n\n".join([
+    # 모든 요약을 하나로 합침 (memento가 있으면 누적 줄거리 + 최근 요약만 사용)
+    all_summaries = "\n\n".join(
         f"영상 {i+1}:\n{summary}" 
-        for i, summary in enumerate(video_summaries)
-    ])
+        for i, summary in enumerate(video_summaries, start=summary_offset)
+    )
+    if rolling_memento:
+        all_summaries = f"영상 1~{summary_offset} (누적 줄거리):\n{rolling_memento}\n\n" + all_summaries
 
     # 커스텀 프롬프트 목록 형태의 string으로 변환
     custom_prompt_list = "\n".join(
@@ -695,12 +1000,9 @@ async def create_final_results(video_summaries: List[str], custom_prompts: List[
         
     #     final_responses.append(result_tuple)
 
-    # 디버깅: 최종 요약 프롬프트 출력
-    print("=" * 80)
-    print(f"🎬 FINAL SUMMARY PROMPT INPUT:")
-    print("=" * 80)
-    print(prompt)
-    print("=" * 80)
+    # 디버깅: 최종 요약 프롬프트 출력 (DEBUG 레벨에서만)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🎬 FINAL SUMMARY PROMPT INPUT:\n%s", prompt)
 
     # 프롬프트 보내기
     request_body = {
@@ -719,19 +1021,11 @@ async def create_final_results(video_summaries: List[str], custom_prompts: List[
         ]
     }
 
-    response = bedrock.invoke_model(
-    modelId=model_id,
-    body=json.dumps(request_body)
-    )
-
-    response_body = json.loads(response['body'].read())
-    final_response = response_body['content'][0]['text']
+    final_response = await invoke_claude_stream(bedrock, model_id, request_body)
     
-    # 디버깅: 최종 요약 답변 출력
-    print(f"🎭 FINAL SUMMARY RESPONSE:")
-    print("=" * 80)
-    print(final_response)
-    print("=" * 80)
+    # 디버깅: 최종 요약 답변 출력 (DEBUG 레벨에서만)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🎭 FINAL SUMMARY RESPONSE:\n%s", final_response)
 
     parsed_response_list = parse_final_summary(final_response, len(custom_prompts))
 
@@ -763,84 +1057,58 @@ async def process_single_video(s3_video_uri: str, characters_info: str, movie_id
     """
     try:
         # 청크 정보 생성 (실제 파일 생성 없이 메타데이터만)
-        chunks_info, segment_duration = generate_video_chunks_info(s3_video_uri)
+        chunks_info, segment_duration = await run_s3_io(generate_video_chunks_info, s3_video_uri)
         total_chunks = len(chunks_info)
 
-        print(f"🎬 원본 비디오 동적 청크 처리 시작")
-        print(f"   원본 URI: {s3_video_uri}")
-        print(f"   Movie ID: {movie_id}")
-        print(f"   세그먼트 길이: {segment_duration}초 ({segment_duration/60:.1f}분)")
-        print("=" * 80)
+        logger.info("🎬 원본 비디오 동적 청크 처리 시작")
+        logger.info("   원본 URI: %s", s3_video_uri)
+        logger.info("   Movie ID: %s", movie_id)
+        logger.info("   세그먼트 길이: %s초 (%.1f분)", segment_duration, segment_duration/60)
         
         # init 파라미터에 따른 처리
         start_from = 0
         
-        if init:
-            print(f"🔄 init=True: 처음부터 새로 시작합니다. Movie ID: {movie_id}")
-            # 기존 요약들 모두 삭제
-            db = SessionLocal()
-            deleted_count = delete_summaries_from(db, movie_id, 1)  # summary_id 1부터 모두 삭제
-            update_movie_status(db, movie_id, "PENDING")  # 상태를 PENDING으로 리셋
-            db.close()
-            print(f"🗑️ 기존 요약 {deleted_count}개 삭제 완료")
-            
-            # S3에 있는 embeddings.json과 thumbnails 폴더 삭제
-            print("🗑️ S3 정리 시작...")
-            delete_embeddings_and_thumbnails(movie_id, s3_video_uri)
-
-            print(f"📊 Movie 상태 리셋: PENDING")
-            
-        else:
-            # 재시작 정보 확인
-            db = SessionLocal()
-            resume_info = get_resume_info(db, movie_id)
-            db.close()
-            
-            if resume_info:
-                if resume_info.get("stage") == "organizing" or resume_info.get("stage") == "complete":
-                    if resume_info.get("stage") == "complete":
-                        print(f"⚠️ 이미 완료된 작업입니다. Movie ID: {movie_id}")
-                        print(f"💡 처음부터 다시 시작하려면 init=true로 설정하세요.")
-                    print(f"🔄 ORGANIZING 단계에서 재시작합니다. Movie ID: {movie_id}")
-                    start_from = total_chunks  # 모든 청크 건너뛰고 최종 요약으로
-                    
-                elif resume_info.get("stage") == "proceeding":
-                    current = resume_info.get("current", 0)
-                    total = resume_info.get("total", 0)
-                    print(f"🔄 PROCEEDING[{current}/{total}] 단계에서 재시작합니다. Movie ID: {movie_id}")
-                    start_from = current  # 현재 진행된 위치부터 시작
-            else:
-                print(f"🆕 새로운 작업을 시작합니다. Movie ID: {movie_id}")
-        
         # 변수 초기화
         video_summaries = []
-        previous_summaries = []
-        
-        if start_from > 0 and start_from < total_chunks:  # PROCEEDING 재시작인 경우
-            # 기존 요약들을 로드
-            db = SessionLocal()
-            existing_summaries = get_summaries_up_to(db, movie_id, start_from)
-            db.close()
-            
-            for summary in existing_summaries:
-                chunk_info = chunks_info[summary.summary_id - 1] if summary.summary_id <= len(chunks_info) else None
-                video_summaries.append({
-                    "video_uri": f"chunk_{summary.summary_id}_{chunk_info['start']:.0f}s-{chunk_info['end']:.0f}s" if chunk_info else f"chunk_{summary.summary_id}",
-                    "summary": summary.summary_text,
-                    "order": summary.summary_id,
-                    "summary_id": summary.summary_id
-                })
-                previous_summaries.append(summary.summary_text)
-            
-            print(f"📚 PROCEEDING 재시작: 기존 요약 {len(existing_summaries)}개 로드 완료")
-        elif start_from >= total_chunks:  # ORGANIZING 재시작인 경우
-            # 기존 청크 요약들을 모두 로드
-            db = SessionLocal()
-            existing_summaries = get_summaries_up_to(db, movie_id, total_chunks)
-            db.close()
+        previous_summaries = deque(maxlen=ROLLING_CONTEXT_SIZE)  # 프롬프트에 쓰이는 최근 요약만 유지
+        rolling_memento = None  # 창 밖으로 밀려난 요약들의 누적 요약 (ROLLING_MEMENTO_ENABLED일 때만 사용)
+        memento_task = None
+        
+        # 재시작 정보 확인부터 커스텀 프롬프트 로드까지 하나의 세션에서 연속 처리
+        with SessionLocal() as db:
+            if init:
+                logger.info("🔄 init=True: 처음부터 새로 시작합니다. Movie ID: %s", movie_id)
+                # 기존 요약들 모두 삭제
+                deleted_count = delete_summaries_from(db, movie_id, 1)  # summary_id 1부터 모두 삭제
+                update_movie_status(db, movie_id, "PENDING")  # 상태를 PENDING으로 리셋
+                logger.info("🗑️ 기존 요약 %s개 삭제 완료", deleted_count)
+                logger.info("📊 Movie 상태 리셋: PENDING")
+                
+            else:
+                # 재시작 정보 확인
+                resume_info = get_resume_info(db, movie_id)
+                
+                if resume_info:
+                    if resume_info.get("stage") == "organizing" or resume_info.get("stage") == "complete":
+                        if resume_info.get("stage") == "complete":
+                            logger.warning("⚠️ 이미 완료된 작업입니다. Movie ID: %s", movie_id)
+                            logger.info("💡 처음부터 다시 시작하려면 init=true로 설정하세요.")
+                        logger.info("🔄 ORGANIZING 단계에서 재시작합니다. Movie ID: %s", movie_id)
+                        start_from = total_chunks  # 모든 청크 건너뛰고 최종 요약으로
+                        
+                    elif resume_info.get("stage") == "proceeding":
+                        current = resume_info.get("current", 0)
+                        total = resume_info.get("total", 0)
+                        logger.info("🔄 PROCEEDING[%s/%s] 단계에서 재시작합니다. Movie ID: %s", current, total, movie_id)
+                        start_from = current  # 현재 진행된 위치부터 시작
+                else:
+                    logger.info("🆕 새로운 작업을 시작합니다. Movie ID: %s", movie_id)
             
-            for summary in existing_summaries:
-                if summary.summary_id <= total_chunks:  # 최종 요약 제외
+            if start_from > 0 and start_from < total_chunks:  # PROCEEDING 재시작인 경우
+                # 기존 요약들을 로드
+                existing_summaries = get_summaries_up_to(db, movie_id, start_from)
+                
+                for summary in existing_summaries:
                     chunk_info = chunks_info[summary.summary_id - 1] if summary.summary_id <= len(chunks_info) else None
                     video_summaries.append({
                         "video_uri": f"chunk_{summary.summary_id}_{chunk_info['start']:.0f}s-{chunk_info['end']:.0f}s" if chunk_info else f"chunk_{summary.summary_id}",
@@ -848,111 +1116,154 @@ async def process_single_video(s3_video_uri: str, characters_info: str, movie_id
                         "order": summary.summary_id,
                         "summary_id": summary.summary_id
                     })
+                    previous_summaries.append(summary.summary_text)
+                
+                logger.info("📚 PROCEEDING 재시작: 기존 요약 %s개 로드 완료", len(existing_summaries))
+            elif start_from >= total_chunks:  # ORGANIZING 재시작인 경우
+                # 기존 청크 요약들을 모두 로드
+                existing_summaries = get_summaries_up_to(db, movie_id, total_chunks)
+                
+                for summary in existing_summaries:
+                    if summary.summary_id <= total_chunks:  # 최종 요약 제외
+                        chunk_info = chunks_info[summary.summary_id - 1] if summary.summary_id <= len(chunks_info) else None
+                        video_summaries.append({
+                            "video_uri": f"chunk_{summary.summary_id}_{chunk_info['start']:.0f}s-{chunk_info['end']:.0f}s" if chunk_info else f"chunk_{summary.summary_id}",
+                            "summary": summary.summary_text,
+                            "order": summary.summary_id,
+                            "summary_id": summary.summary_id
+                        })
+                
+                logger.info("📚 ORGANIZING: 기존 청크 요약 %s개 로드 완료", len(video_summaries))
             
-            print(f"📚 ORGANIZING: 기존 청크 요약 {len(video_summaries)}개 로드 완료")
+            # 상태를 PROCEEDING으로 업데이트 (시작)
+            if start_from < total_chunks:
+                update_movie_status(db, movie_id, f"PROCEEDING[{start_from}/{total_chunks}]")
+                logger.info("📊 Movie 상태 업데이트: PROCEEDING[%s/%s]", start_from, total_chunks)
+            
+            # 커스텀 프롬프트 가져오기
+            custom_prompts = get_custom_prompts(db, movie_id)
+            custom_retrievals = get_custom_retrievals(db, movie_id)
         
-        # 상태를 PROCEEDING으로 업데이트 (시작)
-        if start_from < total_chunks:
-            db = SessionLocal()
-            update_movie_status(db, movie_id, f"PROCEEDING[{start_from}/{total_chunks}]")
-            db.close()
-            print(f"📊 Movie 상태 업데이트: PROCEEDING[{start_from}/{total_chunks}]")
-        
-        print(f"🎥 총 {total_chunks}개의 청크 중 {start_from + 1}번부터 처리합니다.")
-        print(f"🎬 Movie ID: {movie_id}")
-        print("=" * 80)
-
-        # 커스텀 프롬프트 가져오기
-        db = SessionLocal()
-        custom_prompts = get_custom_prompts(db, movie_id)
-        custom_retrievals = get_custom_retrievals(db, movie_id)
-        db.close()
-        print(f"프롬프트 {len(custom_prompts)}개, 검색어 {len(custom_retrievals)}개 로드 완료")
+        if init:
+            # S3에 있는 임베딩 파일과 thumbnails 폴더 삭제 (DB 세션 반환 후 수행)
+            logger.info("🗑️ S3 정리 시작...")
+            from app.services.scene_service import delete_embeddings_and_thumbnails
+            await run_s3_io(delete_embeddings_and_thumbnails, movie_id, s3_video_uri)
+        
+        logger.info("🎥 총 %s개의 청크 중 %s번부터 처리합니다.", total_chunks, start_from + 1)
+        logger.info("🎬 Movie ID: %s", movie_id)
+        logger.info("프롬프트 %s개, 검색어 %s개 로드 완료", len(custom_prompts), len(custom_retrievals))
+        
+        pending_saves = []
+        last_status_write = time.monotonic()  # 시작 상태는 위에서 기록함
+        # 아직 저장하지 않은 요약과 그와 함께 기록할 진행 상태 (SUMMARY_SAVE_BATCH_SIZE개마다 한 번에 저장)
+        summary_buffer = []
+        buffered_status = None
+        
+        def flush_summaries():
+            nonlocal buffered_status
+            if summary_buffer or buffered_status:
+                pending_saves.append(save_summaries_in_background(movie_id, summary_buffer.copy(), status=buffered_status))
+                summary_buffer.clear()
+                buffered_status = None
+        
+        # 등장인물 정보가 채워진 분석 프롬프트 템플릿은 영화 전체에서 같으므로 루프 밖에서 한 번만 준비
+        base_template = render_analysis_base_template(prompt_language, characters_info)
+        
+        # 다음 청크들의 추출/STT/장면 감지를 미리 시작해 두고, 현재 청크의 Claude 요약과 겹쳐서 진행
+        # (Rolling Context 때문에 요약은 청크 순서대로 하되, 분석 단계는 요약에 의존하지 않으므로 먼저 수행 가능)
+        analysis_semaphore = asyncio.Semaphore(CHUNK_PREFETCH_DEPTH)
+        pending_analyses = deque()
+        next_to_schedule = start_from
+        
+        def schedule_analysis():
+            nonlocal next_to_schedule
+            if next_to_schedule < total_chunks:
+                pending_analyses.append(asyncio.create_task(
+                    analyze_chunk(s3_video_uri, chunks_info[next_to_schedule], next_to_schedule + 1, language_code, threshold, movie_id, analysis_semaphore, get_frames_dir(movie_id, next_to_schedule))
+                ))
+                next_to_schedule += 1
+        
+        for _ in range(CHUNK_PREFETCH_DEPTH):
+            schedule_analysis()
         
         # start_from 인덱스부터 청크 처리 시작
         for i in range(start_from, total_chunks):
             chunk_info = chunks_info[i]
             current_chunk = i + 1
+            analysis_task = pending_analyses.popleft()
+            schedule_analysis()
             
-            # 각 청크 처리 시작 시 상태 업데이트
-            db = SessionLocal()
-            update_movie_status(db, movie_id, f"PROCEEDING[{current_chunk}/{total_chunks}]")
-            db.close()
-            print(f"📊 Movie 상태 업데이트: PROCEEDING[{current_chunk}/{total_chunks}]")
-            
-            print(f"🎬 [{current_chunk}/{total_chunks}] 청크 처리 시작: {chunk_info['start']:.1f}s - {chunk_info['end']:.1f}s ({chunk_info['duration']:.1f}s)")
+            # 상태는 청크 요약 저장과 함께 일정 간격으로만 기록 (PROCEEDING[완료 개수/전체])
+            logger.info("🎬 [%s/%s] 청크 처리 시작: %.1fs - %.1fs (%.1fs)", current_chunk, total_chunks, chunk_info['start'], chunk_info['end'], chunk_info['duration'])
             
-            # 청크 파일 동적 추출
-            chunk_file_path = None
             try:
-                chunk_file_path = extract_chunk_for_processing(s3_video_uri, chunk_info)
+                # 미리 시작해 둔 청크 추출 + transcribe/scene 병렬 처리 결과 대기
+                utterances, scenes, saved_uri = await analysis_task
                 
-                # 청크를 임시 S3에 업로드하지 않고 로컬 파일 URI로 처리
-                chunk_uri = f"file://{chunk_file_path}"
-                
-                # transcribe process와 scene process 병렬 처리
-                transcribe_task = asyncio.to_thread(transcribe_video, chunk_uri, language_code)
-                scene_task = asyncio.to_thread(scene_process, chunk_uri, threshold, movie_id, current_chunk, s3_video_uri)
-
-                utterances, (scenes, saved_uri) = await asyncio.gather(transcribe_task, scene_task)
+                # 데이터가 없는 청크는 Claude 요청을 구성하기 전에 바로 건너뛰기 (Rolling Context에도 넣지 않음)
+                if not utterances and not scenes:
+                    logger.warning("⚠️ STT와 장면 데이터가 모두 없어 이 청크를 건너뜁니다.")
+                    continue
 
                 if saved_uri:
-                    db = SessionLocal()
-                    set_embedding_uri(db, movie_id, saved_uri)  # 임베딩 URI 저장
-                    db.close()
-                    print(f"✅ 장면 임베딩 URI 저장 완료: {saved_uri}")
+                    # 임베딩 URI 저장 (청크마다 세션을 새로 열지 않고 DB 쓰기 스레드의 세션 재사용)
+                    await submit_db_write(run_db_write, set_embedding_uri, movie_id, saved_uri)
+                    logger.info("✅ 장면 임베딩 URI 저장 완료: %s", saved_uri)
                 else:
-                    print(f"⚠️ 장면 임베딩 URI가 반환되지 않았습니다.")
+                    logger.warning("⚠️ 장면 임베딩 URI가 반환되지 않았습니다.")
                 
-                print(f"✅ STT 결과: {len(utterances) if utterances else 0}개의 발화")
-                print(f"✅ 장면 감지: {len(scenes) if scenes else 0}개의 장면")
+                logger.info("✅ STT 결과: %s개의 발화", len(utterances) if utterances else 0)
+                logger.info("✅ 장면 감지: %s개의 장면", len(scenes) if scenes else 0)
                 
                 # 빈 데이터 처리
                 if not utterances:
                     utterances = []
-                    print("⚠️ STT 결과가 없습니다. (무음 구간일 수 있습니다)")
+                    logger.warning("⚠️ STT 결과가 없습니다. (무음 구간일 수 있습니다)")
                 
                 if not scenes:
                     scenes = []
-                    print("⚠️ 장면 감지 결과가 없습니다.")
-                
-                # scene의 base64 이미지와 start_time 추출
-                scene_images = [
-                    {"start_time": scene["start_time"], "image": scene["frame_image"]}
-                    for scene in scenes
-                ] if scenes else []
+                    logger.warning("⚠️ 장면 감지 결과가 없습니다.")
                 
-                # 데이터가 없는 경우 건너뛰기
-                if not utterances and not scene_images:
-                    print("⚠️ STT와 장면 데이터가 모두 없어 이 청크를 건너뜁니다.")
-                    continue
+                # scene dict를 그대로 Claude 입력으로 재사용 (프레임은 image_path 파일로 전달됨)
+                # Claude 요청 직전에 파일을 읽고 요청 후 삭제하므로 scenes에 이미지가 남아 있지 않음
+                scene_images = scenes
                 
-                print(f"🤖 Claude 요약 생성 시작...")
+                logger.info("🤖 Claude 요약 생성 시작...")
                 # Rolling Context를 적용하여 현재 청크 요약 생성
                 # 검색어도 함께 전달하여 LLM이 관련 장면 선택
+                # 여러 청크를 한 요청으로 묶지 않음: 청크당 장면 이미지가 최대 20개라 Converse 요청당 이미지 한도(20개)를 넘고,
+                # 장면 번호(chunk_n_scene_m) 매핑과 직전 요약에 의존하는 Rolling Context도 청크 단위로 유지해야 함
+                if memento_task is not None:
+                    rolling_memento = await memento_task
+                    memento_task = None
                 summary, scene_selections = await get_bedrock_response_with_context(
-                    utterances, scene_images, characters_info, previous_summaries, i, 
-                    prompt_language, retrieval_queries=custom_retrievals
+                    utterances, scene_images, characters_info, tuple(previous_summaries), i, 
+                    prompt_language, retrieval_queries=custom_retrievals, rolling_memento=rolling_memento,
+                    base_template=base_template
                 )
-                print(f"✅ Claude 요약 생성 완료 (길이: {len(summary)} 문자)")
+                logger.info("✅ Claude 요약 생성 완료 (길이: %s 문자)", len(summary))
                 
                 # scene_selections를 chunk_n_scene_m 형태의 문자열로 변환
-                adjusted_scene_selections = {}
-                for query, indices in scene_selections.items():
-                    scene_strings = [f"chunk_{current_chunk}_scene_{idx + 1}" for idx in indices]
-                    adjusted_scene_selections[query] = scene_strings
-                    print(f"   '{query}': 장면 {indices} → {scene_strings}")
+                adjusted_scene_selections = {
+                    query: [f"chunk_{current_chunk}_scene_{idx + 1}" for idx in indices]
+                    for query, indices in scene_selections.items()
+                }
+                if logger.isEnabledFor(logging.DEBUG):
+                    for query, scene_strings in adjusted_scene_selections.items():
+                        logger.debug("   '%s': 장면 %s → %s", query, scene_selections[query], scene_strings)
                 
                 # 요약을 데이터베이스에 저장 (청크 순서에 맞는 summary_id 사용)
-                print(f"💾 데이터베이스 저장 시작...")
+                # SUMMARY_SAVE_BATCH_SIZE개씩 모아 백그라운드에서 저장하고 바로 다음 청크 처리로 넘어감
+                # (진행 상태는 해당 요약이 저장되는 커밋에서만 기록되므로 저장되지 않은 청크를 건너뛰고 재시작하지 않음)
                 summary_id = i + 1  # 청크 순서와 동일하게 (1부터 시작)
-                print(f"   할당된 Summary ID: {summary_id} (청크 순서 {i + 1})")
-                save_success = save_summary_to_db(movie_id, summary_id, summary)
-                
-                if save_success:
-                    print(f"💾 요약 저장 완료: Summary ID {summary_id}")
-                else:
-                    print(f"⚠️ 요약 저장 실패: Summary ID {summary_id}")
+                logger.info("💾 데이터베이스 저장 요청: Summary ID %s (청크 순서 %s)", summary_id, i + 1)
+                summary_buffer.append({"summary_id": summary_id, "summary_text": summary})
+                if progress_status_due(current_chunk, total_chunks, last_status_write):
+                    buffered_status = f"PROCEEDING[{current_chunk}/{total_chunks}]"
+                    last_status_write = time.monotonic()
+                if len(summary_buffer) >= SUMMARY_SAVE_BATCH_SIZE:
+                    flush_summaries()
                 
                 video_summaries.append({
                     "video_uri": f"chunk_{current_chunk}_{chunk_info['start']:.0f}s-{chunk_info['end']:.0f}s",
@@ -964,68 +1275,97 @@ async def process_single_video(s3_video_uri: str, characters_info: str, movie_id
                     "scene_selections": adjusted_scene_selections  # chunk_n_scene_m 형태로 저장
                 })
                 
+                # 창에서 밀려날 요약은 다음 청크 분석과 겹쳐서 백그라운드로 memento에 합침
+                if ROLLING_MEMENTO_ENABLED and len(previous_summaries) == ROLLING_CONTEXT_SIZE:
+                    memento_task = asyncio.create_task(fold_into_memento(rolling_memento, previous_summaries[0]))
+                
                 # 다음 청크 처리를 위해 이전 요약에 추가
                 previous_summaries.append(summary)
                 
+            except BaseException:
+                # 오류 등으로 루프를 빠져나오면 아직 대기 중인 선행 분석 작업 취소 및 남은 프레임 정리
+                for task in pending_analyses:
+                    task.cancel()
+                shutil.rmtree(get_frames_dir(movie_id), ignore_errors=True)
+                # 이미 요약을 마친 청크는 재시작 시 다시 요약하지 않도록 저장 (실패 상태 기록보다 먼저 커밋됨)
+                flush_summaries()
+                raise
             finally:
-                # 청크 임시 파일 정리
-                if chunk_file_path:
-                    cleanup_chunk_file(chunk_file_path)
+                shutil.rmtree(get_frames_dir(movie_id, i), ignore_errors=True)
             
             
-            print(f"✅ [{current_chunk}/{total_chunks}] 청크 처리 완료")
-            print("=" * 80)
+            logger.info("✅ [%s/%s] 청크 처리 완료", current_chunk, total_chunks)
+        
+        # 남은 요약 저장
+        flush_summaries()
+        
+        # 백그라운드 저장 결과 확인 (DB 쓰기 스레드가 하나라 제출 순서대로 끝남)
+        for summary_ids, save_future in pending_saves:
+            save_success = await save_future
+            if save_success:
+                logger.info("💾 요약 저장 완료: Summary ID %s", summary_ids)
+            else:
+                logger.warning("⚠️ 요약 저장 실패: Summary ID %s", summary_ids)
         
         # 최종 요약 생성 시작 시 상태 업데이트
-        db = SessionLocal()
-        update_movie_status(db, movie_id, "ORGANIZING")
-        db.close()
-        print(f"📊 Movie 상태 업데이트: ORGANIZING")
+        await submit_db_write(save_movie_status, movie_id, "ORGANIZING")
+        logger.info("📊 Movie 상태 업데이트: ORGANIZING")
 
         # 프롬프트가 너무 많다면 10개로 제한
         if len(custom_prompts) > 10:
             custom_prompts = custom_prompts[:10]
-            print(f"⚠️ 프롬프트 개수가 너무 많아 10개로 제한합니다.")
+            logger.warning("⚠️ 프롬프트 개수가 너무 많아 10개로 제한합니다.")
         if len(custom_retrievals) > 10:
             custom_retrievals = custom_retrievals[:10]
-            print(f"⚠️ 검색어 개수가 너무 많아 10개로 제한합니다.")
+            logger.warning("⚠️ 검색어 개수가 너무 많아 10개로 제한합니다.")
         
-        print("🎭 최종 프롬프트 응답 결과 생성 중...")
+        logger.info("🎭 최종 프롬프트 응답 결과 생성 중...")
 
         # 최종 프롬프트 응답 결과 생성
-        final_summary = await create_final_results([vs["summary"] for vs in video_summaries], custom_prompts, characters_info, prompt_language)
-        print(f"✅ 최종 요약 생성 완료")     
+        # 처음부터 memento를 유지해 왔다면 누적 줄거리 + 최근 요약만으로 최종 요약 (전체 요약을 다시 보내지 않음)
+        if memento_task is not None:
+            rolling_memento = await memento_task
+            memento_task = None
+        if ROLLING_MEMENTO_ENABLED and start_from == 0 and rolling_memento:
+            final_results_coro = create_final_results(
+                previous_summaries, custom_prompts, characters_info, prompt_language,
+                rolling_memento=rolling_memento, summary_offset=len(video_summaries) - len(previous_summaries)
+            )
+        else:
+            final_results_coro = create_final_results((vs["summary"] for vs in video_summaries), custom_prompts, characters_info, prompt_language)
 
         # 최종 장면 검색 결과 생성 (LLM 선택 + 벡터 유사도)
         # s3 uri들의 리스트의 딕셔너리 형태가 되어야 할 것.
-        final_scenes = await get_final_scenes(custom_retrievals, movie_id, video_summaries)
+        # 최종 요약과 장면 검색은 서로 독립적이므로 동시에 요청 (동시 Bedrock 호출 수는 BEDROCK_SEM이 제한)
+        final_summary, final_scenes = await asyncio.gather(
+            final_results_coro,
+            get_final_scenes(custom_retrievals, movie_id, video_summaries)
+        )
+        logger.info("✅ 최종 요약 생성 완료")
         
         # 빈 딕셔너리가 아닌 경우에만 출력
         if final_scenes:
-            print(f"✅ 최종 장면 검색 결과 생성 완료")
-            print(f"{final_scenes}")
+            logger.info("✅ 최종 장면 검색 결과 생성 완료")
+            logger.debug("%s", final_scenes)
         else:
-            print(f"⚠️ 최종 장면 검색 결과가 없습니다.")
+            logger.warning("⚠️ 최종 장면 검색 결과가 없습니다.")
 
         # 최종 요약도 데이터베이스에 저장 (모든 청크 다음 순서)
-        print(f"💾 최종 요약 데이터베이스 저장 시작...")
+        logger.info("💾 최종 요약 데이터베이스 저장 시작...")
         final_summary_id = total_chunks + 1  # 마지막 청크 다음 순서
-        print(f"   할당된 Final Summary ID: {final_summary_id} (최종 요약)")
-        final_save_success = save_summary_to_db(movie_id, final_summary_id, final_summary)
+        logger.info("   할당된 Final Summary ID: %s (최종 요약)", final_summary_id)
+        # 최종 요약 저장과 COMPLETE 상태 업데이트를 한 번의 커밋으로 처리
+        final_save_success = await submit_db_write(save_summary_to_db, movie_id, final_summary_id, final_summary, "COMPLETE")
         
         if final_save_success:
-            print(f"💾 최종 요약 저장 완료: Summary ID {final_summary_id}")
+            logger.info("💾 최종 요약 저장 완료: Summary ID %s", final_summary_id)
         else:
-            print(f"⚠️ 최종 요약 저장 실패: Summary ID {final_summary_id}")
-        
-        # 모든 처리 완료 시 상태 업데이트
-        db = SessionLocal()
-        update_movie_status(db, movie_id, "COMPLETE")
-        db.close()
-        print(f"📊 Movie 상태 업데이트: COMPLETE")
+            logger.warning("⚠️ 최종 요약 저장 실패: Summary ID %s", final_summary_id)
+            # 최종 요약 저장에 실패해도 처리 자체는 완료된 것으로 기록
+            await submit_db_write(save_movie_status, movie_id, "COMPLETE")
+        logger.info("📊 Movie 상태 업데이트: COMPLETE")
         
-        print("🎉 모든 청크 처리 완료!")
-        print("=" * 80)
+        logger.info("🎉 모든 청크 처리 완료!")
         
         # 썸네일 정보 수집
         thumbnail_info = collect_thumbnail_info(video_summaries, s3_video_uri)
@@ -1037,72 +1377,177 @@ async def process_single_video(s3_video_uri: str, characters_info: str, movie_id
         }
         
     except Exception as e:
+        # TaskGroup에서 올라온 예외는 처음 실패한 작업의 예외로 보고
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
+        
         # 오류 발생 시 실패 상태로 업데이트
         try:
-            db = SessionLocal()
-            mark_movie_failed(db, movie_id)
-            db.close()
-            print(f"📊 Movie 상태 업데이트: 오류로 인한 FAILED 상태")
+            await submit_db_write(run_db_write, mark_movie_failed, movie_id)
+            logger.info("📊 Movie 상태 업데이트: 오류로 인한 FAILED 상태")
         except:
             pass
         
-        import traceback
-        print(f"❌ 오류 발생: {type(e).__name__}: {str(e)}")
-        print("=" * 80)
-        print("📋 상세 스택 트레이스:")
-        print(traceback.format_exc())
-        print("=" * 80)
+        logger.exception("❌ 오류 발생: %s: %s", type(e).__name__, e)
         raise RuntimeError(f"원본 비디오 처리 중 오류 발생: {str(e)}")
 
-def save_summary_to_db(movie_id: int, summary_id: int, summary_text: str) -> bool:
+def progress_status_due(done: int, total: int, last_write: float) -> bool:
+    """
+    진행 상태를 기록할 시점인지 확인합니다.
+    마지막 기록 후 STATUS_WRITE_INTERVAL이 지났거나 전체의 1% 단위에 도달한 경우에만 기록합니다.
+    마지막 항목(done == total)은 루프 직후 ORGANIZING이 바로 기록되므로 PROCEEDING[N/N]은 기록하지 않습니다.
+    """
+    if done >= total:
+        return False
+    return time.monotonic() - last_write >= STATUS_WRITE_INTERVAL or done % max(1, total // 100) == 0
+
+def save_summaries_to_db(movie_id: int, summaries: List[Dict], status: str = None) -> bool:
     """
-    요약을 데이터베이스에 저장합니다.
+    여러 요약을 한 번의 upsert로 데이터베이스에 저장합니다.
+    status가 주어지면 영화 상태 업데이트도 같은 트랜잭션에서 함께 커밋합니다. (summaries가 비어 있으면 상태만 기록)
     
     Args:
         movie_id: 영화 ID
-        summary_id: 요약 순서 ID
-        summary_text: 요약 텍스트
+        summaries: [{"summary_id": 요약 순서 ID, "summary_text": 요약 텍스트}, ...]
+        status: 함께 기록할 영화 상태 (예: "PROCEEDING[3/10]")
     
     Returns:
         bool: 저장 성공 여부
     """
     try:
-        print(f"💾 요약 저장 시도: Movie ID {movie_id}, Summary ID {summary_id}")
-        print(f"   Summary Text 길이: {len(summary_text)} 문자")
-        print(f"   Summary Text 미리보기: {summary_text[:100]}...")
+        summary_ids = [s["summary_id"] for s in summaries]
+        logger.info("💾 요약 저장 시도: Movie ID %s, Summary ID %s", movie_id, summary_ids)
+        if logger.isEnabledFor(logging.DEBUG):
+            for s in summaries:
+                logger.debug("   Summary ID %s: %s 문자, 미리보기: %s...", s["summary_id"], len(s["summary_text"]), s["summary_text"][:100])
         
-        # 별도의 데이터베이스 세션 사용 (트랜잭션 롤백 방지)
-        db = SessionLocal()
+        # DB 쓰기 스레드의 세션 재사용 (요청 흐름의 세션과 분리되어 트랜잭션 롤백 영향 없음)
+        db = DB_WRITER_LOCAL.session
         
         try:
-            # movie 테이블에 해당 ID가 존재하는지 확인
-            movie = get_movie(db, movie_id)
-            if not movie:
-                print(f"❌ Movie ID {movie_id}가 존재하지 않습니다!")
-                return False
+            # movie 테이블에 해당 ID가 존재하는지 확인 (최근 MOVIE_CHECK_TTL초 안에 확인했으면 조회 생략)
+            verified_movies = DB_WRITER_LOCAL.verified_movies
+            verified = verified_movies.get(movie_id)
+            if verified is None or time.monotonic() - verified[1] > MOVIE_CHECK_TTL:
+                movie = get_movie(db, movie_id)
+                if not movie:
+                    verified_movies.pop(movie_id, None)
+                    logger.error("❌ Movie ID %s가 존재하지 않습니다!", movie_id)
+                    return False
+                verified = (movie.title, time.monotonic())
+                verified_movies[movie_id] = verified
             
-            print(f"✅ Movie ID {movie_id} 확인됨: {movie.title}")
+            logger.info("✅ Movie ID %s 확인됨: %s", movie_id, verified[0])
             
-            # 요약 생성 및 저장 (덮어쓰기 지원)
-            summary = create_or_update_summary(db, movie_id, summary_id, summary_text)
+            if status:
+                # 커밋은 요약 저장과 함께 수행
+                update_movie_status(db, movie_id, status, commit=False)
             
-            print(f"✅ 요약 저장 완료: Movie ID {movie_id}, Summary ID {summary_id}")
-            print(f"   저장된 데이터: movie_id={summary.movie_id}, summary_id={summary.summary_id}")
+            # 요약 생성 및 저장 (덮어쓰기 지원), 상태 업데이트와 함께 한 번만 커밋
+            upsert_summaries(db, movie_id, summaries, commit=False)
+            db.commit()
+            
+            logger.info("✅ 요약 저장 완료: Movie ID %s, Summary ID %s", movie_id, summary_ids)
             return True
             
         except Exception as e:
-            print(f"❌ 요약 저장 중 오류: {str(e)}")
+            logger.error("❌ 요약 저장 중 오류: %s", e)
+            # 실패한 트랜잭션만 롤백하고 세션은 다음 쓰기에 계속 사용
             db.rollback()
             return False
-        finally:
-            db.close()
         
     except Exception as e:
-        print(f"❌ 요약 저장 실패: {str(e)}")
-        import traceback
-        print(f"   상세 오류: {traceback.format_exc()}")
+        logger.exception("❌ 요약 저장 실패: %s", e)
         return False
 
+def save_summary_to_db(movie_id: int, summary_id: int, summary_text: str, status: str = None) -> bool:
+    """
+    요약 하나를 데이터베이스에 저장합니다. (save_summaries_to_db 참고)
+    """
+    return save_summaries_to_db(movie_id, [{"summary_id": summary_id, "summary_text": summary_text}], status)
+
+def run_db_write(crud_func, *args, **kwargs):
+    """
+    DB 쓰기 스레드의 세션으로 crud 함수를 실행합니다. 실패하면 해당 트랜잭션만 롤백하고 예외를 다시 던집니다.
+    """
+    db = DB_WRITER_LOCAL.session
+    try:
+        return crud_func(db, *args, **kwargs)
+    except Exception:
+        db.rollback()
+        raise
+
+def save_movie_status(movie_id: int, status: str) -> bool:
+    """
+    DB 쓰기 스레드의 세션으로 영화 상태를 기록합니다.
+    """
+    return run_db_write(update_movie_status, movie_id, status)
+
+def load_custom_prompts(movie_id: int) -> List[str]:
+    """
+    별도 세션으로 커스텀 프롬프트를 조회합니다.
+    """
+    with SessionLocal() as db:
+        return get_custom_prompts(db, movie_id)
+
+def submit_db_write(func, *args, **kwargs) -> asyncio.Future:
+    """
+    DB 쓰기 함수를 DB_WRITE_EXECUTOR에 제출하고 await 가능한 Future를 반환합니다.
+    save_summaries_to_db, save_summary_to_db, save_movie_status, run_db_write는 DB 쓰기 스레드의 세션을 사용하므로 반드시 이 함수로 실행해야 합니다.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(DB_WRITE_EXECUTOR, functools.partial(func, *args, **kwargs))
+
+def save_summaries_in_background(movie_id: int, summaries: List[Dict], status: str = None) -> tuple[List[int], asyncio.Future]:
+    """
+    save_summaries_to_db를 DB 쓰기 스레드에 즉시 제출하고 ([summary_id, ...], 저장 성공 여부 Future)를 반환합니다.
+    호출 시점에 제출되므로 이후에 제출되는 상태 기록(ORGANIZING, FAILED_ 등)보다 먼저 커밋됩니다.
+    """
+    return [s["summary_id"] for s in summaries], submit_db_write(save_summaries_to_db, movie_id, summaries, status)
+
+async def analyze_video(video_uri: str, language_code: str, threshold: float, movie_id: int, semaphore: asyncio.Semaphore, frames_dir: str = None) -> tuple[List[Dict], List[Dict]]:
+    """
+    비디오 하나에 대해 STT와 장면 감지를 병렬로 수행합니다.
+    semaphore로 동시에 분석 중인 비디오 수를 제한하여 버퍼링되는 장면 이미지 메모리를 묶어 둡니다.
+    
+    Returns:
+        tuple[List[Dict], List[Dict]]: (발화 리스트, 장면 리스트)
+    """
+    async with semaphore:
+        # 하나가 실패하면 나머지도 취소
+        async with asyncio.TaskGroup() as tg:
+            transcribe_task = tg.create_task(transcribe_video(video_uri, language_code))
+            scene_task = tg.create_task(run_scene_process(video_uri, threshold, movie_id, None, None, frames_dir))
+        scenes, _ = scene_task.result()
+        return transcribe_task.result(), scenes
+
+async def analyze_chunk(s3_video_uri: str, chunk_info: Dict, current_chunk: int, language_code: str, threshold: float, movie_id: int, semaphore: asyncio.Semaphore, frames_dir: str = None) -> tuple[List[Dict], List[Dict], str]:
+    """
+    원본 비디오에서 청크 하나를 추출해 STT와 장면 감지를 병렬로 수행합니다.
+    semaphore로 동시에 추출/분석 중인 청크 수를 제한하며, 분석이 끝나면 청크 임시 파일은 바로 삭제합니다.
+    
+    Returns:
+        tuple[List[Dict], List[Dict], str]: (발화 리스트, 장면 리스트, 임베딩 저장 URI)
+    """
+    async with semaphore:
+        chunk_file_path = None
+        try:
+            chunk_file_path = await run_s3_io(extract_chunk_for_processing, s3_video_uri, chunk_info)
+            
+            # 청크를 임시 S3에 업로드하지 않고 로컬 파일 URI로 처리
+            chunk_uri = f"file://{chunk_file_path}"
+            
+            # transcribe process와 scene process 병렬 처리 (하나가 실패하면 나머지도 취소)
+            async with asyncio.TaskGroup() as tg:
+                transcribe_task = tg.create_task(transcribe_video(chunk_uri, language_code))
+                scene_task = tg.create_task(run_scene_process(chunk_uri, threshold, movie_id, current_chunk, s3_video_uri, frames_dir))
+            scenes, saved_uri = scene_task.result()
+            return transcribe_task.result(), scenes, saved_uri
+        finally:
+            # 청크 임시 파일 정리
+            if chunk_file_path:
+                cleanup_chunk_file(chunk_file_path)
+
 async def process_videos_from_folder(s3_folder_path: str, characters_info: str, movie_id: int, init: bool = False, language_code: str = "ko-KR", threshold: float = 30.0) -> Dict:
     """
     S3 폴더에서 비디오 파일들을 찾아 순차적으로 처리하여 각각의 요약과 최종 요약을 생성합니다.
@@ -1120,214 +1565,255 @@ async def process_videos_from_folder(s3_folder_path: str, characters_info: str,
     """
     try:
         # S3 폴더에서 비디오 파일들 조회 (먼저 조회해서 총 개수 확인)
-        video_uris = get_video_files_from_s3_folder(s3_folder_path)
+        video_uris = await run_s3_io(get_video_files_from_s3_folder, s3_folder_path)
         total_videos = len(video_uris)
         
         # init 파라미터에 따른 처리
         start_from = 0
         
         if init:
-            print(f"🔄 init=True: 처음부터 새로 시작합니다. Movie ID: {movie_id}")
+            logger.info("🔄 init=True: 처음부터 새로 시작합니다. Movie ID: %s", movie_id)
             # 기존 요약들 모두 삭제
-            db = SessionLocal()
-            deleted_count = delete_summaries_from(db, movie_id, 1)  # summary_id 1부터 모두 삭제
-            update_movie_status(db, movie_id, "PENDING")  # 상태를 PENDING으로 리셋
-            db.close()
-            print(f"🗑️ 기존 요약 {deleted_count}개 삭제 완료")
-            print(f"📊 Movie 상태 리셋: PENDING")
+            with SessionLocal() as db:
+                deleted_count = delete_summaries_from(db, movie_id, 1)  # summary_id 1부터 모두 삭제
+                update_movie_status(db, movie_id, "PENDING")  # 상태를 PENDING으로 리셋
+            logger.info("🗑️ 기존 요약 %s개 삭제 완료", deleted_count)
+            logger.info("📊 Movie 상태 리셋: PENDING")
         else:
             # 재시작 정보 확인
-            db = SessionLocal()
-            resume_info = get_resume_info(db, movie_id)
-            db.close()
+            with SessionLocal() as db:
+                resume_info = get_resume_info(db, movie_id)
             
             if resume_info:
                 if resume_info.get("stage") == "organizing" or resume_info.get("stage") == "complete":
                     if resume_info.get("stage") == "complete":
-                        print(f"⚠️ 이미 완료된 작업입니다. Movie ID: {movie_id}")
-                        print(f"💡 처음부터 다시 시작하려면 init=true로 설정하세요.")
-                    print(f"🔄 ORGANIZING 단계에서 재시작합니다. Movie ID: {movie_id}")
+                        logger.warning("⚠️ 이미 완료된 작업입니다. Movie ID: %s", movie_id)
+                        logger.info("💡 처음부터 다시 시작하려면 init=true로 설정하세요.")
+                    logger.info("🔄 ORGANIZING 단계에서 재시작합니다. Movie ID: %s", movie_id)
                     # 모든 비디오 요약은 완료되었으므로 최종 요약만 다시 생성
                     start_from = total_videos  # 모든 비디오 건너뛰고 최종 요약으로
-                    
-                    # 기존 비디오 요약들을 모두 로드
-                    db = SessionLocal()
-                    existing_summaries = get_summaries_up_to(db, movie_id, total_videos)
-                    db.close()
-                    
-                    for summary in existing_summaries:
-                        video_summaries.append({
-                            "video_uri": video_uris[summary.summary_id - 1],
-                            "summary": summary.summary_text,
-                            "order": summary.summary_id,
-                            "summary_id": summary.summary_id
-                        })
-                    
-                    print(f"📚 ORGANIZING: 기존 비디오 요약 {len(existing_summaries)}개 로드 완료")
                 elif resume_info.get("stage") == "proceeding":
                     current = resume_info.get("current", 0)
                     total = resume_info.get("total", 0)
-                    print(f"🔄 PROCEEDING[{current}/{total}] 단계에서 재시작합니다. Movie ID: {movie_id}")
+                    logger.info("🔄 PROCEEDING[%s/%s] 단계에서 재시작합니다. Movie ID: %s", current, total, movie_id)
                     start_from = current  # 마지막 완료된 비디오 다음부터 시작
-                    print(f"📍 비디오 {start_from + 1}번부터 재시작합니다.")
+                    logger.info("📍 비디오 %s번부터 재시작합니다.", start_from + 1)
             else:
-                print(f"🆕 새로운 작업을 시작합니다. Movie ID: {movie_id}")
-        
-        # 변수 초기화 (ORGANIZING 단계에서는 이미 초기화됨)
-        if 'video_summaries' not in locals():
-            video_summaries = []
-        if 'previous_summaries' not in locals():
-            previous_summaries = []
-        
-        if start_from > 0 and start_from < total_videos:  # PROCEEDING 재시작인 경우
-            # 기존 요약들을 로드
-            db = SessionLocal()
-            existing_summaries = get_summaries_up_to(db, movie_id, start_from)
-            db.close()
-            
-            for summary in existing_summaries:
-                video_summaries.append({
-                    "video_uri": video_uris[summary.summary_id - 1],  # summary_id는 1부터 시작
-                    "summary": summary.summary_text,
-                    "order": summary.summary_id,
-                    "summary_id": summary.summary_id
-                })
-                previous_summaries.append(summary.summary_text)
+                logger.info("🆕 새로운 작업을 시작합니다. Movie ID: %s", movie_id)
+        
+        # 변수 초기화 (비디오 순서대로 슬롯을 미리 할당, 요약이 없는 비디오는 None으로 남음)
+        video_summaries = [None] * total_videos
+        previous_summaries = deque(maxlen=ROLLING_CONTEXT_SIZE)
+        rolling_memento = None  # 창 밖으로 밀려난 요약들의 누적 요약 (ROLLING_MEMENTO_ENABLED일 때만 사용)
+        memento_task = None
+        
+        if start_from > 0:  # PROCEEDING / ORGANIZING 재시작인 경우
+            # 기존 요약들을 한 번의 쿼리로 로드 (최종 요약은 summary_id 범위에서 제외됨)
+            with SessionLocal() as db:
+                existing_summaries = get_summary_rows_up_to(db, movie_id, min(start_from, total_videos))
             
-            print(f"📚 PROCEEDING 재시작: 기존 요약 {len(existing_summaries)}개 로드 완료")
-        elif start_from >= total_videos:  # ORGANIZING 재시작인 경우
-            # 기존 비디오 요약들을 모두 로드
-            db = SessionLocal()
-            existing_summaries = get_summaries_up_to(db, movie_id, total_videos if total_videos > 0 else 100)  # 충분히 큰 값
-            db.close()
+            for row in existing_summaries:
+                summary_id = row["summary_id"]
+                video_summaries[summary_id - 1] = {  # summary_id는 1부터 시작
+                    "video_uri": video_uris[summary_id - 1],
+                    "summary": row["summary_text"],
+                    "order": summary_id,
+                    "summary_id": summary_id
+                }
             
-            for summary in existing_summaries:
-                if summary.summary_id <= total_videos:  # 최종 요약 제외
-                    video_summaries.append({
-                        "video_uri": video_uris[summary.summary_id - 1] if summary.summary_id <= len(video_uris) else f"s3://dummy/segment_{summary.summary_id:03d}.mp4",
-                        "summary": summary.summary_text,
-                        "order": summary.summary_id,
-                        "summary_id": summary.summary_id
-                    })
-            
-            print(f"📚 ORGANIZING: 기존 비디오 요약 {len(video_summaries)}개 로드 완료")
+            if start_from < total_videos:
+                previous_summaries.extend(row["summary_text"] for row in existing_summaries)
+                logger.info("📚 PROCEEDING 재시작: 기존 요약 %s개 로드 완료", len(existing_summaries))
+            else:
+                logger.info("📚 ORGANIZING: 기존 비디오 요약 %s개 로드 완료", len(existing_summaries))
         
         # 상태를 PROCEEDING으로 업데이트 (시작)
         if start_from < total_videos:
-            db = SessionLocal()
-            update_movie_status(db, movie_id, f"PROCEEDING[{start_from}/{total_videos}]")
-            db.close()
-            print(f"📊 Movie 상태 업데이트: PROCEEDING[{start_from}/{total_videos}]")
-        
-        print(f"🎥 총 {total_videos}개의 비디오 중 {start_from + 1}번부터 처리합니다.")
-        print(f"🎬 Movie ID: {movie_id}")
-        print("=" * 80)
-        
-        # start_from 인덱스부터 비디오 처리 시작
-        for i in range(start_from, total_videos):
-            video_uri = video_uris[i]
-            # 각 비디오 처리 시작 시 상태 업데이트
-            current_video = i + 1
-            db = SessionLocal()
-            update_movie_status(db, movie_id, f"PROCEEDING[{current_video}/{total_videos}]")
-            db.close()
-            print(f"📊 Movie 상태 업데이트: PROCEEDING[{current_video}/{total_videos}]")
-            
-            print(f"🎬 [{current_video}/{total_videos}] 비디오 처리 시작: {video_uri}")
-            
-            # transcribe와 scene 병렬 처리 (movie_id 전달)
-            transcribe_task = asyncio.to_thread(transcribe_video, video_uri, language_code)
-            scene_task = asyncio.to_thread(scene_process, video_uri, threshold, movie_id)
-            utterances, scenes = await asyncio.gather(transcribe_task, scene_task)
-            
-            print(f"✅ STT 결과: {len(utterances) if utterances else 0}개의 발화")
-            print(f"✅ 장면 감지: {len(scenes) if scenes else 0}개의 장면")
-            
-            # 빈 데이터 처리
-            if not utterances:
-                utterances = []
-                print("⚠️ STT 결과가 없습니다. (엔딩 크레딧이나 무음 구간일 수 있습니다)")
-            
-            if not scenes:
-                scenes = []
-                print("⚠️ 장면 감지 결과가 없습니다.")
-            
-            # scene의 base64 이미지와 start_time 추출
-            scene_images = [
-                {"start_time": scene["start_time"], "image": scene["frame_image"]}
-                for scene in scenes
-            ] if scenes else []
-            
-            # 데이터가 없는 경우 건너뛰기
-            if not utterances and not scene_images:
-                print("⚠️ STT와 장면 데이터가 모두 없어 이 비디오를 건너뜁니다.")
-                continue
-            
-            print(f"🤖 Claude 요약 생성 시작...")
-            # Rolling Context를 적용하여 현재 비디오 요약 생성
-            summary, _ = await get_bedrock_response_with_context(utterances, scene_images, characters_info, previous_summaries, i)
-            print(f"✅ Claude 요약 생성 완료 (길이: {len(summary)} 문자)")
-            
-            # 요약을 데이터베이스에 저장 (비디오 순서에 맞는 summary_id 사용)
-            print(f"💾 데이터베이스 저장 시작...")
-            summary_id = i + 1  # 비디오 순서와 동일하게 (1부터 시작)
-            print(f"   할당된 Summary ID: {summary_id} (비디오 순서 {i + 1})")
-            save_success = save_summary_to_db(movie_id, summary_id, summary)
-            
+            await submit_db_write(save_movie_status, movie_id, f"PROCEEDING[{start_from}/{total_videos}]")
+            logger.info("📊 Movie 상태 업데이트: PROCEEDING[%s/%s]", start_from, total_videos)
+        
+        logger.info("🎥 총 %s개의 비디오 중 %s번부터 처리합니다.", total_videos, start_from + 1)
+        logger.info("🎬 Movie ID: %s", movie_id)
+        
+        # 다음 비디오들의 STT/장면 감지를 미리 시작해 두고, 현재 비디오의 Claude 요약과 겹쳐서 진행
+        # (Rolling Context는 요약에만 의존하므로 분석 단계는 순서와 무관하게 먼저 수행 가능)
+        analysis_semaphore = asyncio.Semaphore(FOLDER_PREFETCH_DEPTH)
+        pending_analyses = deque()
+        next_to_schedule = start_from
+        
+        def schedule_analysis():
+            nonlocal next_to_schedule
+            if next_to_schedule < total_videos:
+                pending_analyses.append(asyncio.create_task(
+                    analyze_video(video_uris[next_to_schedule], language_code, threshold, movie_id, analysis_semaphore, get_frames_dir(movie_id, next_to_schedule))
+                ))
+                next_to_schedule += 1
+        
+        for _ in range(FOLDER_PREFETCH_DEPTH):
+            schedule_analysis()
+        
+        pending_saves = []
+        last_status_write = time.monotonic()  # 시작 상태는 위에서 기록함
+        # 아직 저장하지 않은 요약과 그와 함께 기록할 진행 상태 (SUMMARY_SAVE_BATCH_SIZE개마다 한 번에 저장)
+        summary_buffer = []
+        buffered_status = None
+        
+        def flush_summaries():
+            nonlocal buffered_status
+            if summary_buffer or buffered_status:
+                pending_saves.append(save_summaries_in_background(movie_id, summary_buffer.copy(), status=buffered_status))
+                summary_buffer.clear()
+                buffered_status = None
+        
+        # 루프에서 반복 사용하는 전역/속성 조회를 지역 변수로 바인딩
+        create_task = asyncio.create_task
+        monotonic = time.monotonic
+        next_analysis = pending_analyses.popleft
+        add_summary = summary_buffer.append
+        add_context = previous_summaries.append
+        base_template = render_analysis_base_template("kor", characters_info)
+        
+        try:
+            # start_from 인덱스부터 비디오 처리 시작
+            for i in range(start_from, total_videos):
+                video_uri = video_uris[i]
+                analysis_task = next_analysis()
+                schedule_analysis()
+                
+                # 상태는 비디오 처리가 끝난 뒤 요약 저장과 함께 일정 간격으로만 기록 (PROCEEDING[완료 개수/전체])
+                current_video = i + 1
+                progress_status = None
+                if progress_status_due(current_video, total_videos, last_status_write):
+                    progress_status = f"PROCEEDING[{current_video}/{total_videos}]"
+                
+                logger.info("🎬 [%s/%s] 비디오 처리 시작: %s", current_video, total_videos, video_uri)
+                
+                # 미리 시작해 둔 transcribe와 scene 병렬 처리 결과 대기
+                utterances, scenes = await analysis_task
+                
+                # 데이터가 없는 비디오는 Claude 요청을 구성하기 전에 바로 건너뛰기
+                # (video_summaries 슬롯은 None으로 남고 Rolling Context에도 넣지 않음)
+                if not utterances and not scenes:
+                    logger.warning("⚠️ STT와 장면 데이터가 모두 없어 이 비디오를 건너뜁니다.")
+                    if progress_status:
+                        # 앞서 모아 둔 요약과 함께 저장해야 상태가 저장되지 않은 비디오를 앞지르지 않음
+                        buffered_status = progress_status
+                        flush_summaries()
+                        last_status_write = monotonic()
+                    continue
+                
+                logger.info("✅ STT 결과: %s개의 발화", len(utterances) if utterances else 0)
+                logger.info("✅ 장면 감지: %s개의 장면", len(scenes) if scenes else 0)
+                
+                # 빈 데이터 처리
+                if not utterances:
+                    utterances = []
+                    logger.warning("⚠️ STT 결과가 없습니다. (엔딩 크레딧이나 무음 구간일 수 있습니다)")
+                
+                if not scenes:
+                    scenes = []
+                    logger.warning("⚠️ 장면 감지 결과가 없습니다.")
+                
+                # scene dict를 그대로 Claude 입력으로 재사용 (프레임은 image_path 파일로 전달됨)
+                # Claude 요청 직전에 파일을 읽고 요청 후 삭제하므로 scenes에 이미지가 남아 있지 않음
+                scene_images = scenes
+                
+                logger.info("🤖 Claude 요약 생성 시작...")
+                # Rolling Context를 적용하여 현재 비디오 요약 생성
+                if memento_task is not None:
+                    rolling_memento = await memento_task
+                    memento_task = None
+                summary, _ = await get_bedrock_response_with_context(utterances, scene_images, characters_info, tuple(previous_summaries), i, rolling_memento=rolling_memento, base_template=base_template)
+                logger.info("✅ Claude 요약 생성 완료 (길이: %s 문자)", len(summary))
+                
+                # 요약을 데이터베이스에 저장 (비디오 순서에 맞는 summary_id 사용)
+                # SUMMARY_SAVE_BATCH_SIZE개씩 모아 백그라운드에서 저장하고 바로 다음 비디오 요약으로 넘어감
+                # (진행 상태는 해당 요약이 저장되는 커밋에서만 기록되므로 저장되지 않은 비디오를 건너뛰고 재시작하지 않음)
+                summary_id = i + 1  # 비디오 순서와 동일하게 (1부터 시작)
+                logger.info("💾 데이터베이스 저장 요청: Summary ID %s (비디오 순서 %s)", summary_id, i + 1)
+                add_summary({"summary_id": summary_id, "summary_text": summary})
+                if progress_status:
+                    buffered_status = progress_status
+                    last_status_write = monotonic()
+                if len(summary_buffer) >= SUMMARY_SAVE_BATCH_SIZE:
+                    flush_summaries()
+                
+                video_summaries[i] = {
+                    "video_uri": video_uri,
+                    "summary": summary,
+                    "order": i + 1,
+                    "summary_id": summary_id
+                }
+                
+                # 창에서 밀려날 요약은 다음 비디오 분석과 겹쳐서 백그라운드로 memento에 합침
+                if ROLLING_MEMENTO_ENABLED and len(previous_summaries) == ROLLING_CONTEXT_SIZE:
+                    memento_task = create_task(fold_into_memento(rolling_memento, previous_summaries[0]))
+                
+                # 다음 비디오 처리를 위해 이전 요약에 추가
+                add_context(summary)
+                
+                logger.info("✅ [%s/%s] 비디오 처리 완료", current_video, total_videos)
+        finally:
+            # 오류 등으로 루프를 빠져나오면 아직 대기 중인 선행 분석 작업 취소
+            for task in pending_analyses:
+                task.cancel()
+            # 남아 있는 장면 프레임 임시 파일 정리
+            shutil.rmtree(get_frames_dir(movie_id), ignore_errors=True)
+            # 남은 요약 저장 (오류로 빠져나온 경우에도 실패 상태 기록보다 먼저 커밋되어 재시작 시 다시 요약하지 않음)
+            flush_summaries()
+        
+        # ORGANIZING 상태 기록과 커스텀 프롬프트 조회를 남은 저장 대기와 겹쳐서 시작
+        # (상태 기록은 DB 쓰기 스레드에서 앞선 요약 저장들 뒤에 커밋됨)
+        organizing_write = submit_db_write(save_movie_status, movie_id, "ORGANIZING")
+        prompts_task = asyncio.create_task(asyncio.to_thread(load_custom_prompts, movie_id))
+        
+        # 백그라운드 저장 결과 확인 (DB 쓰기 스레드가 하나라 제출 순서대로 끝남)
+        for summary_ids, save_future in pending_saves:
+            save_success = await save_future
             if save_success:
-                print(f"💾 요약 저장 완료: Summary ID {summary_id}")
+                logger.info("💾 요약 저장 완료: Summary ID %s", summary_ids)
             else:
-                print(f"⚠️ 요약 저장 실패: Summary ID {summary_id}")
-            
-            video_summaries.append({
-                "video_uri": video_uri,
-                "summary": summary,
-                "order": i + 1,
-                "summary_id": summary_id
-            })
-            
-            # 다음 비디오 처리를 위해 이전 요약에 추가
-            previous_summaries.append(summary)
-            
-            print(f"✅ [{current_video}/{total_videos}] 비디오 처리 완료")
-            print("=" * 80)
+                logger.warning("⚠️ 요약 저장 실패: Summary ID %s", summary_ids)
         
-        # 최종 요약 생성 시작 시 상태 업데이트
-        db = SessionLocal()
-        update_movie_status(db, movie_id, "ORGANIZING")
-        db.close()
-        print(f"📊 Movie 상태 업데이트: ORGANIZING")
-
-        # 커스텀 프롬프트 가져오기
-        db = SessionLocal()
-        custom_prompts = get_custom_prompts(db, movie_id)
-        db.close()
-        print(f"프롬프트 {len(custom_prompts)}개 로드 완료 for 최종 요약 생성")
-        
-        print("🎭 최종 종합 요약 생성 중...")
+        # 건너뛴 비디오의 빈 슬롯 제거 (순서는 이미 비디오 순서대로 정렬되어 있음)
+        video_summaries = [vs for vs in video_summaries if vs is not None]
+        
+        # 최종 요약 생성 시작 시 상태 업데이트 및 커스텀 프롬프트 가져오기
+        _, custom_prompts = await asyncio.gather(organizing_write, prompts_task)
+        logger.info("📊 Movie 상태 업데이트: ORGANIZING")
+        logger.info("프롬프트 %s개 로드 완료 for 최종 요약 생성", len(custom_prompts))
+        
+        logger.info("🎭 최종 종합 요약 생성 중...")
         # 최종 프롬프트 응답 결과 생성
-        final_summary = await create_final_results([vs["summary"] for vs in video_summaries], custom_prompts, characters_info)
-        print(f"✅ 최종 요약 생성 완료 (길이: {len(final_summary)} 문자)")
+        # 처음부터 memento를 유지해 왔다면 누적 줄거리 + 최근 요약만으로 최종 요약 (전체 요약을 다시 보내지 않음)
+        if memento_task is not None:
+            rolling_memento = await memento_task
+            memento_task = None
+        if ROLLING_MEMENTO_ENABLED and start_from == 0 and rolling_memento:
+            final_summary = await create_final_results(
+                previous_summaries, custom_prompts, characters_info,
+                rolling_memento=rolling_memento, summary_offset=len(video_summaries) - len(previous_summaries)
+            )
+        else:
+            final_summary = await create_final_results((vs["summary"] for vs in video_summaries), custom_prompts, characters_info)
+        logger.info("✅ 최종 요약 생성 완료 (길이: %s 문자)", len(final_summary))
         
         # 최종 요약도 데이터베이스에 저장 (모든 비디오 다음 순서)
-        print(f"💾 최종 요약 데이터베이스 저장 시작...")
+        logger.info("💾 최종 요약 데이터베이스 저장 시작...")
         final_summary_id = total_videos + 1  # 마지막 비디오 다음 순서
-        print(f"   할당된 Final Summary ID: {final_summary_id} (최종 요약)")
-        final_save_success = save_summary_to_db(movie_id, final_summary_id, final_summary)
+        logger.info("   할당된 Final Summary ID: %s (최종 요약)", final_summary_id)
+        # 최종 요약 저장과 COMPLETE 상태 업데이트를 한 번의 커밋으로 처리
+        final_save_success = await submit_db_write(save_summary_to_db, movie_id, final_summary_id, final_summary, "COMPLETE")
         
         if final_save_success:
-            print(f"💾 최종 요약 저장 완료: Summary ID {final_summary_id}")
+            logger.info("💾 최종 요약 저장 완료: Summary ID %s", final_summary_id)
         else:
-            print(f"⚠️ 최종 요약 저장 실패: Summary ID {final_summary_id}")
+            logger.warning("⚠️ 최종 요약 저장 실패: Summary ID %s", final_summary_id)
+            # 최종 요약 저장에 실패해도 처리 자체는 완료된 것으로 기록
+            await submit_db_write(save_movie_status, movie_id, "COMPLETE")
+        logger.info("📊 Movie 상태 업데이트: COMPLETE")
         
-        # 모든 처리 완료 시 상태 업데이트
-        db = SessionLocal()
-        update_movie_status(db, movie_id, "COMPLETE")
-        db.close()
-        print(f"📊 Movie 상태 업데이트: COMPLETE")
-        
-        print("🎉 모든 비디오 처리 완료!")
-        print("=" * 80)
+        logger.info("🎉 모든 비디오 처리 완료!")
         
         # 최종 요약을 줄거리와 평론으로 분리 (이제 필요 없다.)
         parsed_summary = parse_final_summary(final_summary)
@@ -1342,20 +1828,17 @@ async def process_videos_from_folder(s3_folder_path: str, characters_info: str,
         }
         
     except Exception as e:
+        # TaskGroup에서 올라온 예외는 처음 실패한 작업의 예외로 보고
+        if isinstance(e, ExceptionGroup):
+            e = e.exceptions[0]
+        
         # 오류 발생 시 실패 상태로 업데이트
         try:
-            db = SessionLocal()
-            mark_movie_failed(db, movie_id)
-            db.close()
-            print(f"📊 Movie 상태 업데이트: 오류로 인한 FAILED 상태")
+            await submit_db_write(run_db_write, mark_movie_failed, movie_id)
+            logger.info("📊 Movie 상태 업데이트: 오류로 인한 FAILED 상태")
         except:
             pass
         
-        import traceback
-        print(f"❌ 오류 발생: {type(e).__name__}: {str(e)}")
-        print("=" * 80)
-        print("📋 상세 스택 트레이스:")
-        print(traceback.format_exc())
-        print("=" * 80)
+        logger.exception("❌ 오류 발생: %s: %s", type(e).__name__, e)
         raise RuntimeError(f"S3 폴더 비디오 처리 중 오류 발생: {str(e)}")
 
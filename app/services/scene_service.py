@@ -1,16 +1,96 @@
 import os
-import tempfile
-import boto3
-from typing import List, Dict, Optional
+from botocore.config import Config
+from botocore.exceptions import ClientError
+from typing import List, Dict, Optional, Iterable
 import cv2
-from scenedetect import detect, ContentDetector
+from scenedetect import open_video, SceneManager, ContentDetector, FrameTimecode
+from scenedetect.backends import AVAILABLE_BACKENDS
 from app.services.marengo_service import embed_marengo
+from app.services.video_chunk_service import VIDEO_DOWNLOAD_CONCURRENCY, download_video_from_s3
+from app.services.utils import json_loads, b64encode, get_aws_client, s3_bucket_and_key
 import numpy as np
-import base64
 import uuid
-import json
-from PIL import Image
 import io
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import subprocess
+import time
+import random
+import re
+
+# JPEG 인코딩: libjpeg-turbo(TurboJPEG, SIMD)를 사용할 수 있으면 사용하고 없으면 cv2.imencode로 대체
+# (PyTurboJPEG는 호출마다 핸들을 만들므로 인스턴스 하나를 여러 스레드에서 함께 써도 됨)
+try:
+    from turbojpeg import TurboJPEG, TJPF_BGR, TJSAMP_420
+    turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):
+    turbo_jpeg = None
+
+# 장면별 썸네일 업로드와 Marengo 임베딩 요청을 동시에 보낼 최대 개수 (네트워크 대기 위주라 스레드로 처리)
+# 장면당 요청이 2개(업로드, 임베딩)이고 청크당 장면은 최대 20개이므로, 16이면 대부분의 요청이 한 번에 동시 진행됨
+SCENE_EMBED_MAX_WORKERS = int(os.getenv("SCENE_EMBED_MAX_WORKERS", "16"))
+
+# 장면 감지용 디코딩 백엔드: PyAV(멀티스레드 디코딩)가 설치되어 있으면 사용하고 없으면 OpenCV
+SCENE_DETECT_BACKEND = os.getenv("SCENE_DETECT_BACKEND") or ("pyav" if "pyav" in AVAILABLE_BACKENDS else "opencv")
+
+# 품질 검사 전에 프레임을 이 너비로 축소 (0이면 원본 해상도로 검사)
+# 선명도(Laplacian 분산) 기준값은 원본 해상도 기준으로 정해져 있어 기본은 축소하지 않음. 축소하면 검사 비용은 줄지만 값이 커지는 쪽으로 달라짐
+QUALITY_CHECK_MAX_WIDTH = int(os.getenv("QUALITY_CHECK_MAX_WIDTH", "0"))
+
+# 장면 경계 감지 방식: "content"(PySceneDetect ContentDetector, 전체 프레임 디코딩)
+# "ffmpeg"(ffmpeg select 필터의 장면 점수로 네이티브 코드에서 한 번에 감지, FFMPEG_SCENE_THRESHOLD 사용)
+# 또는 "keyframes"(인코더가 넣은 키프레임(I-frame) 위치를 ffprobe로 패킷만 읽어 경계로 사용, 디코딩 없음. threshold는 무시됨)
+SCENE_DETECT_MODE = os.getenv("SCENE_DETECT_MODE", "content").lower()
+
+# "ffmpeg" 감지 방식의 장면 전환 기준 (ffmpeg scene 점수, 0~1)
+FFMPEG_SCENE_THRESHOLD = float(os.getenv("FFMPEG_SCENE_THRESHOLD", "0.3"))
+SHOWINFO_PTS_TIME_RE = re.compile(r'pts_time:\s*([0-9.]+)')
+
+# 대표 프레임 추출 시 FFmpeg 하드웨어 디코딩(NVDEC/VAAPI 등) 사용 여부. 사용할 수 없는 환경에서는 소프트웨어 디코딩으로 대체됨
+VIDEO_HW_DECODE = os.getenv("VIDEO_HW_DECODE", "true").lower() == "true"
+
+# 다음 목표 프레임까지 이 값 이하로 떨어져 있으면 seek 대신 grab()으로 순차 전진
+# (seek은 키프레임부터 다시 디코딩하므로 가까운 거리에서는 순차 전진이 더 저렴함, 대략 GOP 길이)
+SEQUENTIAL_GRAB_MAX_GAP = int(os.getenv("SEQUENTIAL_GRAB_MAX_GAP", "300"))
+
+# Claude/Marengo로 보내는 저해상도 프레임의 최대 너비와 S3 썸네일 JPEG 품질
+LOWRES_MAX_WIDTH = 720
+THUMBNAIL_JPEG_QUALITY = 90
+
+# 저해상도 프레임 JPEG 인코딩에 쓸 스레드 수 (CPU 작업이며 장면 처리 프로세스마다 따로 생기므로 작게 유지)
+SCENE_ENCODE_MAX_WORKERS = int(os.getenv("SCENE_ENCODE_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# 임베딩 파일 조건부 저장이 다른 청크와 충돌했을 때 다시 병합해 저장을 시도할 최대 횟수
+EMBEDDINGS_SAVE_MAX_ATTEMPTS = 5
+
+# 썸네일 정리 시 동시에 보낼 배치 삭제(delete_objects, 요청당 최대 1000개) 요청 수
+S3_DELETE_MAX_WORKERS = int(os.getenv("S3_DELETE_MAX_WORKERS", "8"))
+
+# 장면 처리 스레드들이 함께 쓰는 S3 클라이언트 설정
+# 연결 풀은 동시 업로드 스레드 수보다 크게 잡아 스레드가 연결을 기다리거나 매번 새로 맺지 않도록 함 (botocore 기본값 10)
+S3_MAX_POOL_CONNECTIONS = max(10, 2 * SCENE_EMBED_MAX_WORKERS, VIDEO_DOWNLOAD_CONCURRENCY)
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}  # 스로틀링(503 SlowDown) 시 요청 속도를 스스로 낮춤
+)
+
+def get_s3_client():
+    """
+    장면 처리 스레드(S3 I/O, 장면 임베딩)가 함께 쓰는 S3 클라이언트를 반환합니다.
+    """
+    return get_aws_client('s3', config=S3_CLIENT_CONFIG)
+
+def init_scene_worker():
+    """
+    장면 처리 워커 프로세스 초기화: 프로세스 간 코어 경쟁을 막기 위해 내부 스레드 수를 1로 제한하고 Marengo 클라이언트를 준비합니다.
+    부모에서 만들어진 클라이언트를 물려받은 경우(fork)에도 연결 풀을 공유하지 않도록 S3/Marengo 클라이언트는 새로 만듭니다.
+    """
+    for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ[var] = "1"
+    cv2.setNumThreads(1)
+    from app.services import marengo_service
+    get_aws_client.cache_clear()
+    marengo_service.marengo_client = None
+    marengo_service.init_marengo_client()
 
 def match_utterances_to_scene(scene_start: float, scene_end: float, utterances: List[Dict]) -> str:
     """
@@ -54,32 +134,19 @@ def get_output_bucket() -> str:
         raise ValueError("환경 변수 SCENES_BUCKET이 설정되지 않았습니다.")
     return output_bucket
 
-def download_video_from_s3(s3_uri: str) -> str:
+def get_output_dir(folder: str, movie_id: int, original_uri: str = None) -> str:
     """
-    S3에서 비디오를 다운로드하여 임시 파일로 저장합니다.
+    출력 파일(thumbnails, embeddings)을 저장할 폴더 경로를 결정합니다.
+    원본 비디오가 S3에 있으면 같은 디렉토리 아래에, 아니면 "{folder}/{movie_id}"에 저장합니다.
+    예: s3://bucket/movies/series1/episode1.mp4 → movies/series1/thumbnails
     """
-    if not s3_uri.startswith("s3://"):
-        raise ValueError("s3_uri는 's3://'로 시작해야 합니다.")
-    
-    # S3 URI 파싱
-    bucket = s3_uri.split('/')[2]
-    key = '/'.join(s3_uri.split('/')[3:])
-    
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
-    
-    # 임시 파일 생성
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
-    
-    try:
-        # S3에서 비디오 다운로드
-        s3.download_file(bucket, key, temp_file.name)
-        return temp_file.name
-    except Exception as e:
-        # 임시 파일 삭제
-        os.unlink(temp_file.name)
-        raise e
-    
+    if original_uri and original_uri.startswith("s3://"):
+        directory = s3_bucket_and_key(original_uri)[1].rpartition('/')[0]
+        # 버킷 루트에 있는 비디오는 루트의 폴더 사용
+        return f"{directory}/{folder}" if directory else folder
+    # original_uri가 없거나 S3 URI가 아닌 경우 기본 경로 사용
+    return f"{folder}/{movie_id}"
+
 def download_json_from_s3(s3_uri: str) -> Dict:
     """
     S3에서 JSON 파일을 다운로드하여 파싱합니다.
@@ -88,90 +155,325 @@ def download_json_from_s3(s3_uri: str) -> Dict:
         raise ValueError("s3_uri는 's3://'로 시작해야 합니다.")
     
     # S3 URI 파싱
-    bucket = s3_uri.split('/')[2]
-    key = '/'.join(s3_uri.split('/')[3:])
+    bucket, key = s3_bucket_and_key(s3_uri)
     
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
+    # S3 클라이언트 (프로세스 내 공유)
+    s3 = get_s3_client()
     
     try:
         # S3에서 JSON 파일 다운로드
         response = s3.get_object(Bucket=bucket, Key=key)
-        json_data = response['Body'].read().decode('utf-8')
-        return json.loads(json_data)
+        return json_loads(response['Body'].read())
     except Exception as e:
         raise e
 
+def embeddings_from_npz(data: bytes) -> tuple[List[str], np.ndarray]:
+    """
+    embeddings.npz 바이트를 (URI 리스트, FP32 임베딩 행렬)로 변환합니다.
+    """
+    with np.load(io.BytesIO(data)) as npz:
+        return npz["uris"].tolist(), npz["emb"].astype(np.float32)
+
+def download_embeddings_from_s3(s3_uri: str) -> tuple[List[str], np.ndarray]:
+    """
+    S3에서 임베딩 파일을 다운로드하여 (URI 리스트, FP32 임베딩 행렬)로 반환합니다.
+    .npz(FP16 바이너리)를 기본으로 읽고, 이전 형식인 embeddings.json도 지원합니다.
+    """
+    if s3_uri.endswith(".json"):
+        uri2embedding_dict = download_json_from_s3(s3_uri)
+        return list(uri2embedding_dict.keys()), np.asarray(list(uri2embedding_dict.values()), dtype=np.float32)
+    
+    bucket, key = s3_bucket_and_key(s3_uri)
+    response = get_s3_client().get_object(Bucket=bucket, Key=key)
+    return embeddings_from_npz(response['Body'].read())
+
 def frame_to_bytes(frame: np.ndarray, max_width: int = None) -> bytes:
     """
-    OpenCV 프레임을 JPEG bytes로 변환 (PIL 사용으로 더 안정적)
+    OpenCV 프레임을 JPEG bytes로 변환 (RGB 변환/PIL 이미지 복사 없이 BGR 프레임을 바로 인코딩)
     
     Args:
         frame: OpenCV 프레임
         max_width: 최대 너비 (None이면 원본 크기 유지, 지정하면 해상도 조정)
     """
-    # OpenCV BGR을 RGB로 변환
-    frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    
-    # PIL Image로 변환
-    pil_image = Image.fromarray(frame_rgb)
-    
     # 해상도 조정 (필요한 경우)
-    if max_width and pil_image.width > max_width:
-        # 비율 유지하며 리사이징
-        ratio = max_width / pil_image.width
-        new_height = int(pil_image.height * ratio)
-        pil_image = pil_image.resize((max_width, new_height), Image.LANCZOS)
-        print(f"   📐 이미지 리사이징: {frame_rgb.shape[1]}x{frame_rgb.shape[0]} → {max_width}x{new_height}")
-    
-    # BytesIO를 사용하여 JPEG로 인코딩
-    buffer = io.BytesIO()
-    pil_image.save(buffer, format='JPEG')
+    height, width = frame.shape[:2]
+    if max_width and width > max_width:
+        # 비율 유지하며 리사이징 (축소에는 INTER_AREA가 빠르고 계단 현상이 적음)
+        new_height = int(height * max_width / width)
+        frame = cv2.resize(frame, (max_width, new_height), interpolation=cv2.INTER_AREA)
+        print(f"   📐 이미지 리사이징: {width}x{height} → {max_width}x{new_height}")
+    
+    # 이전 PIL 인코딩과 같은 품질(75)로 메모리에서 인코딩
+    return encode_jpeg(frame, quality=75)
+
+def encode_scene_images(frame: np.ndarray) -> tuple[bytes, Optional[bytes]]:
+    """
+    장면 프레임의 저해상도 JPEG(Claude/Marengo 전송용)를 만듭니다.
+    프레임이 LOWRES_MAX_WIDTH 이하라 축소할 필요가 없으면 썸네일 품질로 한 번만 인코딩하고 썸네일로도 그대로 사용합니다.
     
-    # bytes 반환
-    return buffer.getvalue()
+    Returns:
+        tuple[bytes, Optional[bytes]]: (저해상도 JPEG, 썸네일 JPEG 또는 업로드 시 원본에서 따로 인코딩해야 하면 None)
+    """
+    if frame.shape[1] <= LOWRES_MAX_WIDTH:
+        jpeg_bytes = encode_jpeg(frame, quality=THUMBNAIL_JPEG_QUALITY)
+        return jpeg_bytes, jpeg_bytes
+    return frame_to_bytes(frame, max_width=LOWRES_MAX_WIDTH), None
+
+def encode_jpeg(frame: np.ndarray, quality: int = None) -> bytes:
+    """
+    OpenCV 프레임을 디스크를 거치지 않고 메모리에서 JPEG bytes로 인코딩합니다.
+    quality를 지정하지 않으면 cv2.imencode 기본값(95)과 같은 품질로 인코딩합니다.
+    """
+    if turbo_jpeg is not None:
+        # cv2(libjpeg 기본 설정)와 같은 4:2:0 크로마 서브샘플링 사용
+        return turbo_jpeg.encode(frame, quality=quality or 95, pixel_format=TJPF_BGR, jpeg_subsample=TJSAMP_420)
+    
+    params = [cv2.IMWRITE_JPEG_QUALITY, quality] if quality else []
+    ok, buffer = cv2.imencode('.jpg', frame, params)
+    if not ok:
+        raise RuntimeError("프레임 JPEG 인코딩 실패")
+    return buffer.tobytes()
 
 def save_frame_to_s3(frame: np.ndarray, prefix: str = "scenes") -> str:
     """
     프레임을 S3에 업로드하고 URL을 반환합니다.
     """
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
+    # 공유 S3 클라이언트 사용
+    s3 = get_s3_client()
     
     # 출력 버킷 가져오기
     output_bucket = get_output_bucket()
     
-    # 임시 파일에 프레임 저장
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
-    cv2.imwrite(temp_file.name, frame)
+    # S3에 업로드할 키 생성
+    key = f"{prefix}/{uuid.uuid4()}.jpg"
     
+    # 임시 파일 없이 메모리에서 인코딩한 JPEG를 바로 업로드
+    s3.put_object(Bucket=output_bucket, Key=key, Body=encode_jpeg(frame), ContentType='image/jpeg')
+    
+    # URL 생성 (1시간 동안 유효한 presigned URL)
+    url = s3.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': output_bucket, 'Key': key},
+        ExpiresIn=3600
+    )
+    
+    return url
+
+def upload_scene_thumbnail(scene_index: int, scene_data: Dict, movie_id: int = None, chunk_id: int = None, original_uri: str = None) -> Optional[str]:
+    """
+    장면 하나의 원본 프레임을 썸네일로 S3에 저장하고 URL을 반환합니다. 실패하면 None을 반환합니다.
+    """
     try:
-        # S3에 업로드할 키 생성
-        key = f"{prefix}/{uuid.uuid4()}.jpg"
+        # scene_data에 저장된 원본 프레임 사용
+        scene_frame = scene_data.get("frame")
+        if scene_frame is None:
+            print(f"⚠️ Scene {scene_index + 1}: 프레임이 없습니다. 건너뜁니다.")
+            return None
         
-        # S3에 업로드
-        s3.upload_file(temp_file.name, output_bucket, key)
+        thumbnail_url = save_thumbnail_to_s3(scene_frame, movie_id, chunk_id, scene_index + 1, original_uri, jpeg_bytes=scene_data.get("thumbnail_image"))
+        scene_data['thumbnail_url'] = thumbnail_url
+        return thumbnail_url
         
-        # URL 생성 (1시간 동안 유효한 presigned URL)
-        url = s3.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': output_bucket, 'Key': key},
-            ExpiresIn=3600
-        )
+    except Exception as e:
+        print(f"❌ Scene {scene_index + 1} 썸네일 저장 중 오류: {str(e)}")
+        return None
+
+def embed_scene_frame(scene_index: int, scene_data: Dict) -> Optional[List[float]]:
+    """
+    장면 하나의 저해상도 프레임을 Marengo로 임베딩합니다. 실패하면 None을 반환합니다.
+    """
+    try:
+        # bytes를 base64로 인코딩하여 marengo에 전달
+        frame_image_base64 = b64encode(scene_data["frame_image"]).decode('ascii')
+        return embed_marengo("image", frame_image_base64)
+    except Exception as e:
+        print(f"❌ Scene {scene_index + 1} 임베딩 중 오류: {str(e)}")
+        return None
+
+def open_video_capture(video_path: str) -> cv2.VideoCapture:
+    """
+    대표 프레임 추출용 VideoCapture를 엽니다.
+    VIDEO_HW_DECODE가 켜져 있으면 FFmpeg 백엔드에 하드웨어 가속 디코딩을 요청하고(가능하지 않으면 소프트웨어 디코딩),
+    그래도 열리지 않으면 기본 설정으로 다시 엽니다.
+    """
+    if VIDEO_HW_DECODE:
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [
+            cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY,
+            cv2.CAP_PROP_HW_DEVICE, 0,
+        ])
+        if cap.isOpened():
+            return cap
+        cap.release()
+    return cv2.VideoCapture(video_path)
+
+def read_frames_at(cap: cv2.VideoCapture, frame_numbers: List[int]) -> Dict[int, np.ndarray]:
+    """
+    지정한 프레임 번호들의 프레임을 오름차순으로 한 번만 훑으며 읽어 {프레임 번호: 프레임}으로 반환합니다.
+    가까운 목표까지는 grab()으로 색 변환 없이 전진하고 retrieve()는 목표 프레임에서만 호출하며,
+    멀리 떨어진 목표는 seek로 건너뜁니다. 읽기에 실패한 프레임은 결과에서 빠집니다.
+    """
+    frames = {}
+    position = None  # 다음에 grab()하면 읽히는 프레임 번호 (None이면 아직 위치를 모름)
+    for target in sorted(set(frame_numbers)):
+        if position is None or target < position or target - position > SEQUENTIAL_GRAB_MAX_GAP:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+            position = target
         
-        return url
-    finally:
-        # 임시 파일 삭제
-        os.unlink(temp_file.name)
+        grabbed = True
+        while position < target and grabbed:
+            grabbed = cap.grab()
+            position += 1
+        if grabbed:
+            grabbed = cap.grab()
+            position += 1
+        if not grabbed:
+            position = None
+            continue
+        
+        ret, frame = cap.retrieve()
+        if ret:
+            frames[target] = frame
+    return frames
 
-def detect_and_embed_scenes(video_path: str, threshold: float = 30.0, max_scenes_count: int = 20, movie_id: int = None, chunk_id: int = None, original_uri: str = None) -> tuple[List[Dict], Optional[str]]:
+class FastContentDetector(ContentDetector):
+    """
+    ContentDetector와 같은 점수(HSV 채널별 평균 절대 차이의 가중 평균)를 계산하되,
+    채널을 나눠 int32로 변환한 뒤 numpy로 빼는 대신 cv2.absdiff + cv2.mean으로 3채널을 한 번에(SIMD) 계산합니다.
+    엣지 가중치를 쓰거나 통계 기록이 필요한 경우에는 원래 구현을 그대로 사용합니다.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._last_hsv = None
+
+    def _calculate_frame_score(self, frame_num: int, frame_img: np.ndarray) -> float:
+        if self._weights.delta_edges > 0.0 or self.stats_manager is not None:
+            return super()._calculate_frame_score(frame_num, frame_img)
+        
+        hsv = cv2.cvtColor(frame_img, cv2.COLOR_BGR2HSV)
+        last_hsv, self._last_hsv = self._last_hsv, hsv
+        if last_hsv is None:
+            return 0.0
+        
+        delta_hue, delta_sat, delta_lum, _ = cv2.mean(cv2.absdiff(hsv, last_hsv))
+        weights = self._weights
+        return (
+            (delta_hue * weights.delta_hue + delta_sat * weights.delta_sat + delta_lum * weights.delta_lum)
+            / sum(abs(weight) for weight in weights)
+        )
+
+def get_video_frame_info(video_path: str) -> tuple[float, int]:
+    """
+    비디오의 (fps, 전체 프레임 수)를 컨테이너 메타데이터에서 읽습니다. (디코딩 없음)
+    """
+    cap = cv2.VideoCapture(video_path)
+    fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    cap.release()
+    return fps, total_frames
+
+def boundaries_to_scene_list(boundary_times: Iterable[float], fps: float, total_frames: int) -> list:
+    """
+    장면이 바뀌는 시각(초)들을 detect_scene_list와 같은 (시작, 끝) FrameTimecode 구간 리스트로 변환합니다.
+    """
+    boundaries = sorted({max(0, round(t * fps)) for t in boundary_times})
+    if not boundaries or boundaries[0] > 0:
+        boundaries.insert(0, 0)
+    if total_frames > boundaries[-1]:
+        boundaries.append(total_frames)
+    
+    return [
+        (FrameTimecode(start, fps=fps), FrameTimecode(end, fps=fps))
+        for start, end in zip(boundaries, boundaries[1:])
+    ]
+
+def detect_ffmpeg_scene_list(video_path: str, threshold: float = FFMPEG_SCENE_THRESHOLD) -> list:
+    """
+    ffmpeg의 scene 점수(select 필터)로 장면 전환을 감지해 장면 구간 리스트를 반환합니다. (detect_scene_list와 같은 형식)
+    디코딩과 점수 계산이 모두 ffmpeg 네이티브 코드에서 한 번에 수행되고, 프레임은 출력하지 않고 전환 시각만 읽습니다.
+    점수 계산 전에 폭 256px로 축소하여 ContentDetector(자동 다운스케일)와 비슷한 해상도에서 비교합니다.
+    """
+    fps, total_frames = get_video_frame_info(video_path)
+    
+    cmd = [
+        'ffmpeg',
+        '-hide_banner',
+        '-nostats',
+        '-i', video_path,
+        '-an', '-sn', '-dn',
+        '-vf', f"scale=256:-2,select='gt(scene,{threshold})',showinfo",
+        '-f', 'null',
+        '-'
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    
+    # showinfo는 선택된(장면이 바뀐) 프레임마다 stderr에 "... pts_time:12.345 ..." 줄을 남김
+    boundary_times = [float(match) for match in SHOWINFO_PTS_TIME_RE.findall(result.stderr)]
+    return boundaries_to_scene_list(boundary_times, fps, total_frames)
+
+def detect_keyframe_scene_list(video_path: str) -> list:
+    """
+    키프레임(I-frame) 사이 구간을 장면으로 보는 장면 구간 리스트를 반환합니다. (detect_scene_list와 같은 형식)
+    ffprobe로 비디오 패킷의 키프레임 플래그만 읽으므로 프레임을 디코딩하지 않습니다.
+    인코더는 보통 장면 전환 지점에 키프레임을 넣으므로 썸네일/검색용 대표 장면을 고르기에는 충분히 근사합니다.
+    """
+    fps, total_frames = get_video_frame_info(video_path)
+    
+    cmd = [
+        'ffprobe',
+        '-v', 'error',
+        '-select_streams', 'v:0',
+        '-show_entries', 'packet=pts_time,flags',
+        '-of', 'csv=p=0',
+        video_path
+    ]
+    result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+    
+    # "pts_time,flags" 줄 중 flags에 K가 있는 패킷의 시각 (디코딩 순서로 나오므로 변환 시 정렬)
+    keyframe_times = []
+    for line in result.stdout.splitlines():
+        pts_time, _, flags = line.partition(',')
+        if 'K' in flags and pts_time not in ('', 'N/A'):
+            keyframe_times.append(float(pts_time))
+    return boundaries_to_scene_list(keyframe_times, fps, total_frames)
+
+def detect_scene_list(video_path: str, threshold: float = 30.0) -> list:
+    """
+    PySceneDetect ContentDetector로 장면 구간 리스트를 감지합니다.
+    SCENE_DETECT_BACKEND로 비디오를 열고, 감지는 축소한 프레임으로 수행합니다(SceneManager 자동 다운스케일, 폭 약 256px).
+    SCENE_DETECT_MODE가 "ffmpeg"이면 ffmpeg 장면 점수로(detect_ffmpeg_scene_list),
+    "keyframes"이면 디코딩 없이 키프레임 위치로 장면을 나눕니다. (detect_keyframe_scene_list)
+    """
+    if SCENE_DETECT_MODE == "ffmpeg":
+        try:
+            return detect_ffmpeg_scene_list(video_path)
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            print(f"⚠️ ffmpeg 장면 감지 실패, ContentDetector로 대체: {str(e)}")
+    elif SCENE_DETECT_MODE == "keyframes":
+        try:
+            return detect_keyframe_scene_list(video_path)
+        except (subprocess.CalledProcessError, OSError, ValueError) as e:
+            print(f"⚠️ 키프레임 기반 장면 분할 실패, ContentDetector로 대체: {str(e)}")
+    
+    if SCENE_DETECT_BACKEND == "pyav":
+        # 디코더 내부 스레드를 사용해 디코딩을 여러 코어로 분산
+        video = open_video(video_path, backend="pyav", threading_mode="AUTO")
+    else:
+        video = open_video(video_path, backend=SCENE_DETECT_BACKEND)
+    scene_manager = SceneManager()
+    scene_manager.auto_downscale = True
+    scene_manager.add_detector(FastContentDetector(threshold=threshold))
+    scene_manager.detect_scenes(video, show_progress=False)
+    return scene_manager.get_scene_list()
+
+def detect_and_embed_scenes(video_path: str, threshold: float = 30.0, max_scenes_count: int = 20, movie_id: int = None, chunk_id: int = None, original_uri: str = None, frames_dir: str = None) -> tuple[List[Dict], Optional[str]]:
     """
     비디오에서 주요 장면을 감지하고 각 장면의 대표 프레임을 base64로 반환합니다.
     품질이 좋은 프레임은 S3 thumbnails/ 경로에도 저장합니다.
     장면이 20개 초과일 경우, 시간별로 균일하게 분포하도록 최대 20개로 제한합니다.
+    frames_dir가 주어지면 프레임을 해당 폴더에 JPEG 파일로 저장하고 "image_path"만 반환합니다.
     """
     # 장면 감지
-    scene_list = detect(video_path, ContentDetector(threshold=threshold))
+    scene_list = detect_scene_list(video_path, threshold)
     
     print(f"🎬 감지된 총 장면 수: {len(scene_list)}개")
     
@@ -180,34 +482,37 @@ def detect_and_embed_scenes(video_path: str, threshold: float = 30.0, max_scenes
         print(f"📊 장면 수가 {max_scenes_count}개를 초과하여 interval 기반 선택 적용")
         
         # 시간 범위 계산
-        total_duration = scene_list[-1][1].get_seconds() - scene_list[0][0].get_seconds()
+        starts = np.fromiter((scene[0].get_seconds() for scene in scene_list), dtype=np.float64, count=len(scene_list))
+        total_duration = scene_list[-1][1].get_seconds() - starts[0]
         interval = total_duration / max_scenes_count
         
-        # interval 기반으로 장면 선택
-        selected_scenes = []
-        for i in range(max_scenes_count):
-            target_time = scene_list[0][0].get_seconds() + i * interval
-            closest_scene = min(scene_list, key=lambda x: abs(x[0].get_seconds() - target_time))
-            if closest_scene not in selected_scenes:  # 중복 방지
-                selected_scenes.append(closest_scene)
+        # interval 기반으로 장면 선택: 목표 시각마다 시작 시각이 가장 가까운 장면을 이진 탐색으로 찾음
+        # (장면 시작 시각은 정렬되어 있으므로 바로 앞/뒤 장면만 비교, 같은 거리면 앞 장면)
+        targets = starts[0] + np.arange(max_scenes_count) * interval
+        after = np.searchsorted(starts, targets).clip(1, len(starts) - 1)
+        before = after - 1
+        closest = np.where(targets - starts[before] <= starts[after] - targets, before, after)
         
-        scene_list = selected_scenes
+        # 중복 방지 (목표 시각이 증가하므로 정렬된 고유 인덱스가 곧 선택 순서)
+        scene_list = [scene_list[idx] for idx in np.unique(closest)]
         print(f"✅ {len(scene_list)}개 장면으로 제한됨")
     
     # 비디오 열기
-    cap = cv2.VideoCapture(video_path)
+    cap = open_video_capture(video_path)
     fps = cap.get(cv2.CAP_PROP_FPS)
     
     scenes = []
     video_name = os.path.basename(video_path)
     
+    # 장면의 중간 프레임들을 장면마다 임의 seek하지 않고 프레임 순서대로 한 번에 읽음
+    middle_frames = [int((scene[0].frame_num + scene[1].frame_num) / 2) for scene in scene_list]
+    frames_by_number = read_frames_at(cap, middle_frames)
+    
     for scene_index, scene in enumerate(scene_list):
-        # 장면의 중간 프레임 선택
-        middle_frame = int((scene[0].frame_num + scene[1].frame_num) / 2)
-        cap.set(cv2.CAP_PROP_POS_FRAMES, middle_frame)
-        ret, frame = cap.read()
+        # 장면의 중간 프레임 선택 (품질 검사에서 제외되는 프레임은 바로 해제되도록 dict에서 꺼냄)
+        frame = frames_by_number.pop(middle_frames[scene_index], None)
 
-        if not ret:
+        if frame is None:
             print(f"⚠️ Scene {scene_index + 1}: 프레임 읽기 실패")
             continue
 
@@ -218,19 +523,13 @@ def detect_and_embed_scenes(video_path: str, threshold: float = 30.0, max_scenes
         print(f"   선명도: {quality_check['sharpness']:.1f} ({'✅' if quality_check['sharpness_ok'] else '❌'})")
         
         if quality_check['is_good_quality']:
-            # 저해상도 버전 생성 (Claude/Marengo 전송용, 720p)
-            frame_image_lowres = frame_to_bytes(frame, max_width=720)
-            
-            # 프레임을 복사하여 저장 (S3 저장용 - 원본 해상도)
-            frame_copy = frame.copy()
-            
+            # 저해상도 버전(frame_image)은 품질 검사가 끝난 뒤 여러 스레드에서 한꺼번에 인코딩
             scene_data = {
                 "start_time": scene[0].get_seconds(),
                 "end_time": scene[1].get_seconds(),
                 "start_frame": scene[0].frame_num,
                 "end_frame": scene[1].frame_num,
-                "frame_image": frame_image_lowres,  # 저해상도 버전
-                "frame": frame_copy  # 원본 해상도 (S3 저장용)
+                "frame": frame  # 원본 해상도 (S3 저장용, retrieve()가 프레임마다 새 배열을 반환하므로 복사하지 않음)
             }
             
             scenes.append(scene_data)
@@ -240,44 +539,60 @@ def detect_and_embed_scenes(video_path: str, threshold: float = 30.0, max_scenes
     cap.release()
     
     print(f"✅ 최종 선택된 장면: {len(scenes)}개 (품질 검사 통과)")
+    
+    # 저해상도 버전 생성 (Claude/Marengo 전송용, 720p)
+    # 리사이즈와 JPEG 인코딩은 GIL을 놓고 실행되므로 장면들을 스레드로 나눠 여러 코어에서 동시에 인코딩
+    # 원본이 720p 이하이면 같은 JPEG를 썸네일로도 재사용하여 업로드 시 다시 인코딩하지 않음
+    if scenes:
+        with ThreadPoolExecutor(max_workers=min(SCENE_ENCODE_MAX_WORKERS, len(scenes))) as executor:
+            encoded_images = executor.map(encode_scene_images, [scene_data["frame"] for scene_data in scenes])
+            for scene_data, (frame_image_lowres, thumbnail_image) in zip(scenes, encoded_images):
+                scene_data["frame_image"] = frame_image_lowres
+                if thumbnail_image is not None:
+                    scene_data["thumbnail_image"] = thumbnail_image
 
     embed_uri_pairs = {}
     saved_uri: Optional[str] = None
 
-    for scene_index, scene_data in enumerate(scenes):
-        try:
-            # scene retrieval 과정 수행 필요
-            # marengo_service에서 aws bedrock marengo embed model 호출하여 임베딩을 받아오는 함수 사용
-            # 임베딩을 썸네일과 함께 S3에 저장, DB에 메타데이터 저장.
-            
-            # scene_data에 저장된 원본 프레임 사용
-            scene_frame = scene_data.get("frame")
-            if scene_frame is None:
-                print(f"⚠️ Scene {scene_index + 1}: 프레임이 없습니다. 건너뜁니다.")
-                continue
-            
-            thumbnail_url = save_thumbnail_to_s3(scene_frame, movie_id, chunk_id, scene_index + 1, original_uri)
-            scene_data['thumbnail_url'] = thumbnail_url
-
-            # bytes를 base64로 인코딩하여 marengo에 전달
-            import base64
-            frame_image_base64 = base64.b64encode(scene_data["frame_image"]).decode('utf-8')
-            embedded_vector = embed_marengo("image", frame_image_base64)
-            embed_uri_pairs[thumbnail_url] = embedded_vector
-            
-            # 메모리 절약을 위해 프레임 데이터 제거 (frame만 제거, frame_image는 Claude에 필요)
-            del scene_data['frame']
-            
-        except Exception as e:
-            print(f"❌ Scene {scene_index + 1} 처리 중 오류: {str(e)}")
+    # scene retrieval: 장면마다 썸네일을 S3에 저장하고 marengo 임베딩을 받아 함께 저장
+    # 썸네일 업로드와 임베딩 요청은 장면 간에도, 한 장면 안에서도 서로 독립적이므로 모두 동시에 보냄
+    if scenes:
+        get_s3_client()  # 스레드를 띄우기 전에 클라이언트를 만들어 둠
+        with ThreadPoolExecutor(max_workers=min(SCENE_EMBED_MAX_WORKERS, 2 * len(scenes))) as executor:
+            upload_futures = [
+                executor.submit(upload_scene_thumbnail, scene_index, scene_data, movie_id, chunk_id, original_uri)
+                for scene_index, scene_data in enumerate(scenes)
+            ]
+            embed_futures = [
+                executor.submit(embed_scene_frame, scene_index, scene_data)
+                for scene_index, scene_data in enumerate(scenes)
+            ]
+            # 결과는 장면 순서대로 짝지어 모음 (둘 다 성공한 장면만 저장)
+            for scene_data, upload_future, embed_future in zip(scenes, upload_futures, embed_futures):
+                thumbnail_url = upload_future.result()
+                embedded_vector = embed_future.result()
+                if thumbnail_url is not None and embedded_vector is not None:
+                    embed_uri_pairs[thumbnail_url] = embedded_vector
+                # 메모리 절약을 위해 프레임 데이터 제거 (frame과 썸네일 JPEG만 제거, frame_image는 Claude에 필요)
+                scene_data.pop('frame', None)
+                scene_data.pop('thumbnail_image', None)
 
     if embed_uri_pairs:
-        saved_uri = save_json_to_s3(embed_uri_pairs, movie_id, video_name, original_uri=original_uri)
+        saved_uri = save_embeddings_to_s3(embed_uri_pairs, movie_id, video_name, original_uri=original_uri)
         print(f"✅ 총 {len(embed_uri_pairs)}개 장면 임베딩 완료 및 S3 저장 완료.")
     
+    if frames_dir:
+        # 프레임 bytes를 메모리에 들고 있지 않고 파일로 내려둔 뒤 경로만 반환 (사용하는 쪽에서 읽고 삭제)
+        os.makedirs(frames_dir, exist_ok=True)
+        for scene_index, scene_data in enumerate(scenes):
+            image_path = os.path.join(frames_dir, f"scene_{scene_index + 1}.jpg")
+            with open(image_path, "wb") as f:
+                f.write(scene_data.pop("frame_image"))
+            scene_data["image_path"] = image_path
+    
     return scenes, saved_uri
 
-def scene_process(uri: str, threshold: float = 30.0, movie_id: int = None, chunk_id: int = None, original_uri: str = None) -> tuple[List[Dict], str]:
+def scene_process(uri: str, threshold: float = 30.0, movie_id: int = None, chunk_id: int = None, original_uri: str = None, frames_dir: str = None) -> tuple[List[Dict], str]:
     """
     전체 장면 처리 프로세스입니다. 다음과 같은 과정을 거칩니다.
     1. 해당 비디오를 청크로 분할합니다.
@@ -290,6 +605,7 @@ def scene_process(uri: str, threshold: float = 30.0, movie_id: int = None, chunk
         movie_id: 영화 ID
         chunk_id: 비디오 청크 ID (단일 비디오 모드에서 사용)
         original_uri: 원본 비디오 URI (썸네일 경로 결정용, 단일 비디오 모드에서 사용)
+        frames_dir: 장면 프레임을 파일로 저장할 폴더 (없으면 frame_image bytes로 반환)
         
     Returns:
         List[Dict]: 장면 정보 리스트
@@ -319,7 +635,7 @@ def scene_process(uri: str, threshold: float = 30.0, movie_id: int = None, chunk
         
         try:
             # 다운로드받은 영상 장면 감지 직후 임베딩
-            scenes, saved_uri = detect_and_embed_scenes(video_path, threshold, movie_id=movie_id, chunk_id=chunk_id, original_uri=original_uri)
+            scenes, saved_uri = detect_and_embed_scenes(video_path, threshold, movie_id=movie_id, chunk_id=chunk_id, original_uri=original_uri, frames_dir=frames_dir)
             return scenes, saved_uri
         finally:
             # 임시 파일 삭제 (S3에서 다운로드한 경우만)
@@ -339,14 +655,23 @@ def check_frame_quality(frame: np.ndarray) -> Dict[str, float]:
     Returns:
         Dict: 품질 지표들 (brightness, sharpness, is_good_quality)
     """
+    # 설정된 경우 축소한 뒤 검사 (색 변환 전에 줄여 변환할 픽셀 수도 줄임)
+    width = frame.shape[1]
+    if QUALITY_CHECK_MAX_WIDTH and width > QUALITY_CHECK_MAX_WIDTH:
+        scale = QUALITY_CHECK_MAX_WIDTH / width
+        frame = cv2.resize(frame, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    
     # 그레이스케일 변환
     gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
     
-    # 1. 밝기 검사 (평균 밝기)
-    brightness = np.mean(gray)
+    # 1. 밝기 검사 (평균 밝기, OpenCV SIMD 경로)
+    brightness = cv2.mean(gray)[0]
     
     # 2. 선명도 검사 (Laplacian variance)
-    laplacian_var = cv2.Laplacian(gray, cv2.CV_64F).var()
+    # 8비트 입력의 3x3 Laplacian 값은 ±1020 범위라 16비트 정수로 정확히 표현되므로 CV_16S(SIMD 정수 경로)로 계산하고,
+    # 분산은 임시 배열 없이 meanStdDev로 한 번에 계산 (값은 부동소수 계산과 동일)
+    _, laplacian_std = cv2.meanStdDev(cv2.Laplacian(gray, cv2.CV_16S))
+    laplacian_var = float(laplacian_std[0, 0]) ** 2
     
     # 3. 품질 판정 (기준 완화)
     # 밝기: 30-220 범위가 적절 (기존 50-200에서 완화)
@@ -364,13 +689,43 @@ def check_frame_quality(frame: np.ndarray) -> Dict[str, float]:
         "is_good_quality": is_good_quality
     }
 
-def save_json_to_s3(dict_data: dict, movie_id: int, video_name: str, original_uri: str = None) -> str:
+def merge_existing_embeddings(s3, bucket: str, embeddings_dir: str, key: str, dict_data: dict) -> tuple[dict, Optional[str]]:
+    """
+    S3에 있는 기존 임베딩과 새 uri-임베딩 쌍을 병합하고, 읽은 embeddings.npz의 ETag를 함께 반환합니다.
+    embeddings.npz가 없으면 이전 형식의 embeddings.json을 확인하며, 이 경우 ETag는 None입니다.
+    """
+    etag = None
+    merged_data = dict_data.copy()
+    try:
+        try:
+            response = s3.get_object(Bucket=bucket, Key=key)
+            etag = response['ETag']
+            existing_uris, existing_emb = embeddings_from_npz(response['Body'].read())
+            existing_data = dict(zip(existing_uris, existing_emb))
+        except s3.exceptions.NoSuchKey:
+            response = s3.get_object(Bucket=bucket, Key=f"{embeddings_dir}/embeddings.json")
+            existing_data = json_loads(response['Body'].read())
+        print(f"📥 기존 임베딩 데이터 {len(existing_data)}개 발견, 병합 중...")
+        # 기존 데이터를 먼저 넣고 새 데이터로 업데이트 (중복 시 새 데이터 우선)
+        merged_data = {**existing_data, **dict_data}
+        print(f"📊 병합 완료: 기존 {len(existing_data)}개 + 신규 {len(dict_data)}개 = 총 {len(merged_data)}개")
+    except s3.exceptions.NoSuchKey:
+        print(f"📝 기존 임베딩 파일 없음, 새로 생성")
+    except Exception as e:
+        if etag is not None:
+            # 현재 파일을 읽었는데 해석하지 못한 경우 덮어쓰면 다른 청크의 임베딩이 사라지므로 저장을 중단
+            raise
+        print(f"⚠️ 기존 데이터 로드 실패 (무시하고 새로 저장): {str(e)}")
+    return merged_data, etag
+
+def save_embeddings_to_s3(dict_data: dict, movie_id: int, video_name: str, original_uri: str = None) -> str:
     """
     uri-임베딩 쌍을 원본 비디오와 같은 디렉토리의 embeddings/ 폴더에 저장합니다.
     기존 데이터가 있으면 병합하여 누적 저장합니다.
+    JSON 대신 URI 배열(uris)과 FP16 임베딩 행렬(emb)을 담은 압축 .npz로 저장해 용량과 파싱 시간을 줄입니다.
     
     Args:
-        dict_data: 저장할 JSON 데이터
+        dict_data: 저장할 uri-임베딩 쌍
         movie_id: 영화 ID
         video_name: 비디오 파일명
         original_uri: 원본 비디오 URI (디렉토리 구조 유지용)
@@ -378,62 +733,47 @@ def save_json_to_s3(dict_data: dict, movie_id: int, video_name: str, original_ur
     Returns:
         str: S3 URL
     """
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
+    # S3 클라이언트 (프로세스 내 공유)
+    s3 = get_s3_client()
     
     # 출력 버킷 가져오기
     output_bucket = get_output_bucket()
     
     try:
-        # 썸네일 저장 경로 결정
-        if original_uri and original_uri.startswith("s3://"):
-            # 원본 비디오 URI에서 디렉토리 구조 추출
-            # 예: s3://bucket/movies/series1/episode1.mp4 → movies/series1/embeddings/
-            uri_parts = original_uri.replace("s3://", "").split("/")
-            bucket_from_uri = uri_parts[0]
-            
-            if len(uri_parts) > 1:
-                # 디렉토리 부분 추출 (파일명 제외)
-                directory_path = "/".join(uri_parts[1:-1])
-                if directory_path:
-                    # 같은 디렉토리에 embeddings 폴더 생성
-                    embeddings_dir = f"{directory_path}/embeddings"
-                else:
-                    # 루트 디렉토리인 경우
-                    embeddings_dir = "embeddings"
-            else:
-                # 버킷 루트인 경우
-                embeddings_dir = "embeddings"
-        else:
-            # original_uri가 없거나 S3 URI가 아닌 경우 기본 경로 사용
-            embeddings_dir = f"embeddings/{movie_id}"
+        # 임베딩 저장 경로 결정 (원본 비디오와 같은 디렉토리의 embeddings/)
+        embeddings_dir = get_output_dir("embeddings", movie_id, original_uri)
         
         # 파일명 생성
-        filename = "embeddings.json"
+        filename = "embeddings.npz"
         
         # 최종 S3 키 생성
         key = f"{embeddings_dir}/{filename}"
         uri = f"s3://{output_bucket}/{key}"
         
-        # 기존 데이터 병합 (있으면 다운로드)
-        merged_data = dict_data.copy()
-        try:
-            response = s3.get_object(Bucket=output_bucket, Key=key)
-            existing_data = json.loads(response['Body'].read().decode('utf-8'))
-            print(f"📥 기존 임베딩 데이터 {len(existing_data)}개 발견, 병합 중...")
-            # 기존 데이터를 먼저 넣고 새 데이터로 업데이트 (중복 시 새 데이터 우선)
-            merged_data = {**existing_data, **dict_data}
-            print(f"📊 병합 완료: 기존 {len(existing_data)}개 + 신규 {len(dict_data)}개 = 총 {len(merged_data)}개")
-        except s3.exceptions.NoSuchKey:
-            print(f"📝 기존 임베딩 파일 없음, 새로 생성")
-        except Exception as e:
-            print(f"⚠️ 기존 데이터 로드 실패 (무시하고 새로 저장): {str(e)}")
-        
-        # JSON 데이터를 문자열로 변환
-        json_data = json.dumps(merged_data)
-        
-        # S3에 업로드
-        s3.put_object(Body=json_data, Bucket=output_bucket, Key=key, ContentType='application/json')
+        # 여러 청크가 동시에 같은 파일에 병합할 수 있으므로 조건부 쓰기로 갱신 유실을 막음
+        # (읽은 버전의 ETag와 같을 때만 덮어쓰고, 파일이 없었으면 그 사이 아무도 만들지 않았을 때만 생성)
+        for attempt in range(1, EMBEDDINGS_SAVE_MAX_ATTEMPTS + 1):
+            merged_data, etag = merge_existing_embeddings(s3, output_bucket, embeddings_dir, key, dict_data)
+            
+            # URI 배열과 FP16 임베딩 행렬로 변환하여 압축 저장
+            buffer = io.BytesIO()
+            np.savez_compressed(
+                buffer,
+                uris=np.array(list(merged_data.keys())),
+                emb=np.asarray(list(merged_data.values()), dtype=np.float16)
+            )
+            
+            condition = {'IfMatch': etag} if etag else {'IfNoneMatch': '*'}
+            try:
+                # S3에 업로드
+                s3.put_object(Body=buffer.getvalue(), Bucket=output_bucket, Key=key, ContentType='application/octet-stream', **condition)
+                break
+            except ClientError as e:
+                # 412: 읽은 뒤 다른 청크가 먼저 저장함, 409: 동시에 진행 중인 조건부 쓰기와 충돌
+                if e.response.get('Error', {}).get('Code') not in ('PreconditionFailed', 'ConditionalRequestConflict') or attempt == EMBEDDINGS_SAVE_MAX_ATTEMPTS:
+                    raise
+                print(f"🔁 임베딩 파일이 다른 작업에 의해 갱신됨, 다시 병합합니다 ({attempt}/{EMBEDDINGS_SAVE_MAX_ATTEMPTS})")
+                time.sleep(random.uniform(0.05, 0.2) * attempt)
         
         print(f"✅ 임베딩 저장 완료: {uri}")
         print(f"   경로: {key}")
@@ -445,7 +785,7 @@ def save_json_to_s3(dict_data: dict, movie_id: int, video_name: str, original_ur
         raise e
 def delete_embeddings_and_thumbnails(movie_id: int, s3_video_uri: str = None) -> bool:
     """
-    S3에서 embeddings.json 파일과 thumbnails 폴더를 삭제합니다.
+    S3에서 임베딩 파일(embeddings.npz, 이전 형식의 embeddings.json)과 thumbnails 폴더를 삭제합니다.
     
     Args:
         movie_id: 영화 ID
@@ -455,58 +795,55 @@ def delete_embeddings_and_thumbnails(movie_id: int, s3_video_uri: str = None) ->
         bool: 삭제 성공 여부
     """
     try:
-        s3 = boto3.client('s3')
+        s3 = get_s3_client()
         output_bucket = get_output_bucket()
         
         # 디렉토리 경로 결정
-        if s3_video_uri and s3_video_uri.startswith("s3://"):
-            uri_parts = s3_video_uri.replace("s3://", "").split("/")
-            if len(uri_parts) > 1:
-                directory_path = "/".join(uri_parts[1:-1])
-                if directory_path:
-                    embeddings_dir = f"{directory_path}/embeddings"
-                    thumbnails_dir = f"{directory_path}/thumbnails"
-                else:
-                    embeddings_dir = "embeddings"
-                    thumbnails_dir = "thumbnails"
-            else:
-                embeddings_dir = "embeddings"
-                thumbnails_dir = "thumbnails"
-        else:
-            embeddings_dir = f"embeddings/{movie_id}"
-            thumbnails_dir = f"thumbnails/{movie_id}"
+        embeddings_dir = get_output_dir("embeddings", movie_id, s3_video_uri)
+        thumbnails_dir = get_output_dir("thumbnails", movie_id, s3_video_uri)
         
         deleted_count = 0
         
-        # embeddings.json 파일 삭제
-        embeddings_key = f"{embeddings_dir}/embeddings.json"
-        try:
-            s3.delete_object(Bucket=output_bucket, Key=embeddings_key)
-            print(f"🗑️ embeddings.json 삭제 완료: {embeddings_key}")
-            deleted_count += 1
-        except s3.exceptions.NoSuchKey:
-            print(f"ℹ️ embeddings.json 파일 없음: {embeddings_key}")
-        except Exception as e:
-            print(f"⚠️ embeddings.json 삭제 실패: {str(e)}")
+        # 임베딩 파일 삭제 (현재 형식과 이전 형식 모두)
+        for embeddings_filename in ("embeddings.npz", "embeddings.json"):
+            embeddings_key = f"{embeddings_dir}/{embeddings_filename}"
+            try:
+                s3.delete_object(Bucket=output_bucket, Key=embeddings_key)
+                print(f"🗑️ {embeddings_filename} 삭제 완료: {embeddings_key}")
+                deleted_count += 1
+            except s3.exceptions.NoSuchKey:
+                print(f"ℹ️ {embeddings_filename} 파일 없음: {embeddings_key}")
+            except Exception as e:
+                print(f"⚠️ {embeddings_filename} 삭제 실패: {str(e)}")
         
         # thumbnails 폴더의 모든 파일 삭제
+        # list_objects_v2는 한 번에 최대 1000개만 반환하므로 페이지를 끝까지 순회하고,
+        # 다음 페이지를 조회하는 동안 이전 페이지의 배치 삭제(최대 1000개)를 스레드에서 동시에 진행
         try:
-            # 폴더 내 모든 객체 조회
-            response = s3.list_objects_v2(Bucket=output_bucket, Prefix=thumbnails_dir + "/")
-            
-            if 'Contents' in response:
-                objects_to_delete = [{'Key': obj['Key']} for obj in response['Contents']]
+            paginator = s3.get_paginator('list_objects_v2')
+            with ThreadPoolExecutor(max_workers=S3_DELETE_MAX_WORKERS) as executor:
+                delete_futures = {}  # future -> 요청한 키 개수
+                for page in paginator.paginate(Bucket=output_bucket, Prefix=thumbnails_dir + "/"):
+                    objects_to_delete = [{'Key': obj['Key']} for obj in page.get('Contents', [])]
+                    if objects_to_delete:
+                        future = executor.submit(
+                            s3.delete_objects,
+                            Bucket=output_bucket,
+                            Delete={'Objects': objects_to_delete, 'Quiet': True}
+                        )
+                        delete_futures[future] = len(objects_to_delete)
                 
-                if objects_to_delete:
-                    # 배치 삭제
-                    delete_response = s3.delete_objects(
-                        Bucket=output_bucket,
-                        Delete={'Objects': objects_to_delete}
-                    )
-                    deleted_count += len(objects_to_delete)
-                    print(f"🗑️ thumbnails 폴더 삭제 완료: {len(objects_to_delete)}개 파일")
-                else:
-                    print(f"ℹ️ thumbnails 폴더가 비어있음")
+                thumbnails_deleted = 0
+                for future in as_completed(delete_futures):
+                    # Quiet 모드에서는 삭제에 실패한 키만 Errors로 돌아옴
+                    errors = future.result().get('Errors', [])
+                    thumbnails_deleted += delete_futures[future] - len(errors)
+                    for error in errors:
+                        print(f"⚠️ 썸네일 삭제 실패: {error.get('Key')} - {error.get('Message')}")
+            
+            if delete_futures:
+                deleted_count += thumbnails_deleted
+                print(f"🗑️ thumbnails 폴더 삭제 완료: {thumbnails_deleted}개 파일")
             else:
                 print(f"ℹ️ thumbnails 폴더 없음: {thumbnails_dir}")
         except Exception as e:
@@ -518,7 +855,7 @@ def delete_embeddings_and_thumbnails(movie_id: int, s3_video_uri: str = None) ->
     except Exception as e:
         print(f"❌ S3 삭제 중 오류: {str(e)}")
         return False
-def save_thumbnail_to_s3(frame: np.ndarray, movie_id: int, chunk_id: int, scene_index: int, original_uri: str = None) -> str:
+def save_thumbnail_to_s3(frame: np.ndarray, movie_id: int, chunk_id: int, scene_index: int, original_uri: str = None, jpeg_bytes: bytes = None) -> str:
     """
     썸네일 후보 프레임을 원본 비디오와 같은 디렉토리의 thumbnails/ 폴더에 저장합니다.
     
@@ -527,45 +864,20 @@ def save_thumbnail_to_s3(frame: np.ndarray, movie_id: int, chunk_id: int, scene_
         movie_id: 영화 ID
         scene_index: 장면 인덱스
         original_uri: 원본 비디오 URI (디렉토리 구조 유지용)
+        jpeg_bytes: 이미 인코딩된 썸네일 JPEG (주어지면 frame을 다시 인코딩하지 않고 그대로 업로드)
     
     Returns:
         str: S3 URL
     """
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
+    # 공유 S3 클라이언트 사용
+    s3 = get_s3_client()
     
     # 출력 버킷 가져오기
     output_bucket = get_output_bucket()
     
-    # 임시 파일에 프레임 저장
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.jpg')
-    
-    # JPEG 품질을 높게 설정하여 저장
-    cv2.imwrite(temp_file.name, frame, [cv2.IMWRITE_JPEG_QUALITY, 90])
-    
     try:
-        # 썸네일 저장 경로 결정
-        if original_uri and original_uri.startswith("s3://"):
-            # 원본 비디오 URI에서 디렉토리 구조 추출
-            # 예: s3://bucket/movies/series1/episode1.mp4 → movies/series1/thumbnails/
-            uri_parts = original_uri.replace("s3://", "").split("/")
-            bucket_from_uri = uri_parts[0]
-            
-            if len(uri_parts) > 1:
-                # 디렉토리 부분 추출 (파일명 제외)
-                directory_path = "/".join(uri_parts[1:-1])
-                if directory_path:
-                    # 같은 디렉토리에 thumbnails 폴더 생성
-                    thumbnail_dir = f"{directory_path}/thumbnails"
-                else:
-                    # 루트 디렉토리인 경우
-                    thumbnail_dir = "thumbnails"
-            else:
-                # 버킷 루트인 경우
-                thumbnail_dir = "thumbnails"
-        else:
-            # original_uri가 없거나 S3 URI가 아닌 경우 기본 경로 사용
-            thumbnail_dir = f"thumbnails/{movie_id}"
+        # 썸네일 저장 경로 결정 (원본 비디오와 같은 디렉토리의 thumbnails/)
+        thumbnail_dir = get_output_dir("thumbnails", movie_id, original_uri)
         
         # 파일명 생성
         filename = f"chunk_{chunk_id}_scene_{scene_index}.jpg"
@@ -573,8 +885,10 @@ def save_thumbnail_to_s3(frame: np.ndarray, movie_id: int, chunk_id: int, scene_
         # 최종 S3 키 생성
         key = f"{thumbnail_dir}/{filename}"
         
-        # S3에 업로드
-        s3.upload_file(temp_file.name, output_bucket, key)
+        # S3에 업로드 (JPEG 품질을 높게 설정해 메모리에서 인코딩, 임시 파일 없음)
+        if jpeg_bytes is None:
+            jpeg_bytes = encode_jpeg(frame, quality=THUMBNAIL_JPEG_QUALITY)
+        s3.put_object(Bucket=output_bucket, Key=key, Body=jpeg_bytes, ContentType='image/jpeg')
         
         # 공개 URL 생성 (또는 presigned URL)
         url = f"https://{output_bucket}.s3.amazonaws.com/{key}"
@@ -585,7 +899,4 @@ def save_thumbnail_to_s3(frame: np.ndarray, movie_id: int, chunk_id: int, scene_
         
     except Exception as e:
         print(f"❌ 썸네일 저장 실패: {str(e)}")
-        raise e
-    finally:
-        # 임시 파일 삭제
-        os.unlink(temp_file.name) 
\ No newline at end of file
+        raise e 
\ No newline at end of file
@@ -1,9 +1,13 @@
 import os
-import json
-import boto3
-from typing import List, Dict
-import base64
+from typing import List, Dict, AsyncIterator
 import asyncio
+from app.services.utils import b64decode, get_aws_client, BEDROCK_SEM
+
+def get_bedrock_client():
+    """
+    프로세스 내에서 공유하는 Bedrock Runtime 클라이언트를 반환합니다.
+    """
+    return get_aws_client('bedrock-runtime', region_name=os.getenv("AWS_DEFAULT_REGION"))
 
 def create_claude_prompt(utterances: List[Dict], scene_images: List[Dict]) -> str:
     """
@@ -14,63 +18,130 @@ def create_claude_prompt(utterances: List[Dict], scene_images: List[Dict]) -> st
         for utterance in utterances
     ])
     
-    # 장면별 시간 정보 추가
+    # 장면별 시간 정보 추가 (장면 번호는 1부터)
     scene_times = "\n".join([
-        f"Scene {i+1}: start_time={scene['start_time']}"
-        for i, scene in enumerate(scene_images)
+        f"Scene {i}: start_time={scene['start_time']}"
+        for i, scene in enumerate(scene_images, 1)
     ])
     
     prompt = f"""\n\n[대화 내용]\n{conversation}\n\n[장면별 시작 시각]\n{scene_times}\n\n장면들과 대사들을 보고, 화자를 유추하여 줄거리의 형태로 적어주세요."""
     return prompt
 
-async def get_bedrock_response(utterances: List[Dict], scene_images: List[Dict]) -> str:
-    bedrock = boto3.client(
-        service_name='bedrock-runtime',
-        region_name=os.getenv("AWS_DEFAULT_REGION")
-    )
-    model_id = os.getenv("CLAUDE_MODEL_ID")
+def image_to_bytes(image) -> bytes:
+    """
+    장면 이미지를 Claude 요청용 JPEG bytes로 변환합니다.
+    Converse API는 이미지 bytes를 그대로 받으므로, 장면 파이프라인이 넘긴 bytes는 복사나 base64 인코딩 없이 사용합니다.
+    base64 문자열로 전달된 경우에만 한 번 디코딩합니다.
+    """
+    if isinstance(image, str):
+        return b64decode(image)
+    return image
 
+def build_summary_messages(utterances: List[Dict], scene_images: List[Dict]) -> List[Dict]:
+    """
+    STT 결과와 장면 이미지로 Converse API용 사용자 메시지를 구성합니다.
+    """
     # 텍스트 프롬프트 생성
     text_prompt = create_claude_prompt(utterances, scene_images)
 
     print(text_prompt)
 
-    # 멀티모달 메시지 구성
+    # 멀티모달 메시지 구성 (base64 문자열을 담은 JSON 본문을 만들지 않고 이미지 bytes를 그대로 전달)
     content = []
     for i, scene in enumerate(scene_images):
         content.append({
-            "type": "image",
-            "source": {
-                "type": "base64",
-                "media_type": "image/jpeg",
-                "data": scene["image"]
+            "image": {
+                "format": "jpeg",
+                "source": {
+                    "bytes": image_to_bytes(scene["image"])
+                }
             }
         })
     content.append({
-        "type": "text",
         "text": text_prompt
     })
+    return [
+        {
+            "role": "user",
+            "content": content
+        }
+    ]
+
+async def get_bedrock_response(utterances: List[Dict], scene_images: List[Dict]) -> str:
+    bedrock = get_bedrock_client()
+    model_id = os.getenv("CLAUDE_MODEL_ID")
+    messages = build_summary_messages(utterances, scene_images)
 
-    request_body = {
-        "anthropic_version": "bedrock-2023-05-31",
-        "max_tokens": 4096,
-        "messages": [
-            {
-                "role": "user",
-                "content": content
+    # 동시 Bedrock 호출 수를 제한하고, 응답을 기다리는 동안 이벤트 루프를 막지 않도록 별도 스레드에서 호출
+    async with BEDROCK_SEM:
+        response = await asyncio.to_thread(
+            bedrock.converse,
+            modelId=model_id,
+            messages=messages,
+            inferenceConfig={
+                "maxTokens": 4096
             }
-        ]
-    }
-    response = bedrock.invoke_model(
-        modelId=model_id,
-        body=json.dumps(request_body)
-    )
-    response_body = json.loads(response['body'].read())
-    return response_body['content'][0]['text']
+        )
+    return response['output']['message']['content'][0]['text']
+
+async def stream_bedrock_response(utterances: List[Dict], scene_images: List[Dict]) -> AsyncIterator[str]:
+    """
+    Converse Stream API로 요약을 요청하고, 생성되는 텍스트 조각을 도착하는 대로 yield합니다.
+    스트림 읽기는 블로킹이므로 별도 스레드에서 읽어 asyncio.Queue로 넘깁니다.
+    """
+    bedrock = get_bedrock_client()
+    model_id = os.getenv("CLAUDE_MODEL_ID")
+    messages = build_summary_messages(utterances, scene_images)
+
+    loop = asyncio.get_running_loop()
+    queue = asyncio.Queue()
+    end_of_stream = object()
+
+    def read_stream():
+        try:
+            response = bedrock.converse_stream(
+                modelId=model_id,
+                messages=messages,
+                inferenceConfig={
+                    "maxTokens": 4096
+                }
+            )
+            for event in response['stream']:
+                text = event.get('contentBlockDelta', {}).get('delta', {}).get('text')
+                if text:
+                    loop.call_soon_threadsafe(queue.put_nowait, text)
+            loop.call_soon_threadsafe(queue.put_nowait, end_of_stream)
+        except Exception as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+
+    # 동시 Bedrock 호출 수 제한은 스트림이 끝날 때까지 유지
+    async with BEDROCK_SEM:
+        reader = asyncio.ensure_future(asyncio.to_thread(read_stream))
+        try:
+            while True:
+                item = await queue.get()
+                if item is end_of_stream:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # 소비자가 중간에 끊어도 스트림을 끝까지 읽은 뒤 슬롯을 반환 (읽기 스레드는 중단할 수 없음)
+            await reader
 
 async def summarize_content(utterances: List[Dict], scene_images: List[Dict]) -> str:
     try:
         summary = await get_bedrock_response(utterances, scene_images)
         return summary
     except Exception as e:
-        raise RuntimeError(f"요약 생성 중 오류 발생: {str(e)}") 
\ No newline at end of file
+        raise RuntimeError(f"요약 생성 중 오류 발생: {str(e)}")
+
+async def summarize_content_stream(utterances: List[Dict], scene_images: List[Dict]) -> AsyncIterator[str]:
+    """
+    요약 텍스트를 생성되는 대로 조각 단위로 반환합니다. 전체 요약이 필요하면 "".join으로 이어 붙이면 됩니다.
+    """
+    try:
+        async for text in stream_bedrock_response(utterances, scene_images):
+            yield text
+    except Exception as e:
+        raise RuntimeError(f"요약 생성 중 오류 발생: {str(e)}")
@@ -1,12 +1,73 @@
 # app/services/transcribe_service.py
 
 import os
-import boto3
-import time
+import logging
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
+import asyncio
+import bisect
+import random
 import uuid
 import requests
-import tempfile
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import List, Dict
+from app.services.utils import json_loads, get_aws_client, locked_cache, s3_bucket_and_key
+
+# 전사 결과 스트리밍 파싱: ijson이 있으면 필요한 배열만 응답을 받는 대로 파싱하고, 없으면 전체를 한 번에 파싱
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+logger = logging.getLogger(__name__)
+
+# Transcribe 작업 상태 폴링 간격: 처음에는 짧게 시작해 두 배씩 늘리고 상한에서 고정
+TRANSCRIBE_INITIAL_POLL_SECONDS = float(os.getenv("TRANSCRIBE_INITIAL_POLL_SECONDS", "1"))
+TRANSCRIBE_MAX_POLL_SECONDS = float(os.getenv("TRANSCRIBE_MAX_POLL_SECONDS", "15"))
+
+# 동시에 실행할 Transcribe 작업 수 상한. 계정의 동시 작업 한도에 맞춰 환경변수로 조정
+# (여러 청크/비디오의 STT를 한꺼번에 시작해도 한도를 넘는 작업은 시작 전에 대기열에서 기다림)
+TRANSCRIBE_SEM = asyncio.Semaphore(int(os.getenv("TRANSCRIBE_MAX_CONCURRENCY", "20")))
+
+# 로컬 청크를 Transcribe용 임시 S3 경로에 올릴 때 16MB 파트를 최대 TRANSCRIBE_UPLOAD_CONCURRENCY개 연결로 동시에 업로드
+# (비디오 다운로드 설정과 같은 파트 크기, boto3 기본값은 8MB 파트 10개 연결)
+TRANSCRIBE_UPLOAD_CONCURRENCY = int(os.getenv("TRANSCRIBE_UPLOAD_CONCURRENCY", "16"))
+TRANSCRIBE_UPLOAD_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=TRANSCRIBE_UPLOAD_CONCURRENCY,
+    use_threads=True
+)
+
+# 여러 스레드(asyncio.to_thread)에서 동시에 STT를 수행하므로 클라이언트는 프로세스당 하나씩 만들어 공유
+TRANSCRIBE_S3_CONFIG = Config(max_pool_connections=max(10, TRANSCRIBE_UPLOAD_CONCURRENCY))
+
+def get_s3_client():
+    """
+    임시 업로드/정리에 쓰는 S3 클라이언트를 반환합니다.
+    """
+    return get_aws_client('s3', config=TRANSCRIBE_S3_CONFIG)
+
+def get_transcribe_client():
+    """
+    Transcribe 클라이언트를 반환합니다.
+    """
+    return get_aws_client('transcribe', region_name=os.getenv("AWS_DEFAULT_REGION") or "us-east-1")
+
+@locked_cache
+def get_http_session():
+    """
+    전사 결과 다운로드용 requests 세션을 처음 사용할 때 한 번만 생성하여 반환합니다.
+    여러 청크/작업의 결과를 받을 때 TCP/TLS 연결을 재사용하고, 일시적인 오류는 짧게 재시도합니다.
+    """
+    session = requests.Session()
+    session.mount('https://', HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504))
+    ))
+    return session
 
 class Utterance:
     def __init__(self, speaker: str, start_time: float, end_time: float, text: str):
@@ -35,7 +96,7 @@ def upload_local_file_to_s3(local_path: str) -> str:
     로컬 파일을 S3에 임시 업로드하고 S3 URI를 반환합니다.
     """
     try:
-        s3 = boto3.client('s3')
+        s3 = get_s3_client()
         bucket = os.getenv("TRANSCRIPTS_BUCKET")
         if not bucket:
             raise ValueError("환경 변수 TRANSCRIPTS_BUCKET이 설정되지 않았습니다.")
@@ -43,12 +104,12 @@ def upload_local_file_to_s3(local_path: str) -> str:
         # 임시 키 생성
         temp_key = f"temp_videos/{uuid.uuid4()}.mp4"
         
-        # S3에 업로드
-        s3.upload_file(local_path, bucket, temp_key)
+        # S3에 업로드 (멀티파트 병렬 업로드)
+        s3.upload_file(local_path, bucket, temp_key, Config=TRANSCRIBE_UPLOAD_CONFIG)
         
         # S3 URI 생성
         s3_uri = f"s3://{bucket}/{temp_key}"
-        print(f"🔄 로컬 파일을 S3에 임시 업로드: {s3_uri}")
+        logger.info("🔄 로컬 파일을 S3에 임시 업로드: %s", s3_uri)
         
         return s3_uri
         
@@ -63,26 +124,137 @@ def cleanup_temp_s3_file(s3_uri: str):
         if not s3_uri.startswith("s3://"):
             return
             
-        s3 = boto3.client('s3')
-        bucket = s3_uri.split('/')[2]
-        key = '/'.join(s3_uri.split('/')[3:])
+        s3 = get_s3_client()
+        bucket, key = s3_bucket_and_key(s3_uri)
         
         # temp_videos/ 경로에 있는 파일만 삭제 (안전장치)
         if key.startswith("temp_videos/"):
             s3.delete_object(Bucket=bucket, Key=key)
-            print(f"🗑️ 임시 S3 파일 삭제: {s3_uri}")
+            logger.info("🗑️ 임시 S3 파일 삭제: %s", s3_uri)
         
     except Exception as e:
-        print(f"⚠️ 임시 S3 파일 삭제 실패: {s3_uri} - {str(e)}")
+        logger.warning("⚠️ 임시 S3 파일 삭제 실패: %s - %s", s3_uri, str(e))
 
-def transcribe_video(uri: str, language_code: str = "en-US") -> List[Dict]:
+def start_transcription_job(s3_uri: str, language_code: str) -> str:
+    """
+    S3 비디오에 대한 Transcribe 작업을 시작하고 작업 이름을 반환합니다.
+    """
+    transcribe = get_transcribe_client()
+
+    output_bucket = os.getenv("TRANSCRIPTS_BUCKET")
+    if not output_bucket:
+        raise ValueError("환경 변수 TRANSCRIPTS_BUCKET이 설정되지 않았습니다.")
+
+    job_name = f"transcribe-job-{uuid.uuid4()}"
+    transcribe.start_transcription_job(
+        TranscriptionJobName=job_name,
+        Media={'MediaFileUri': s3_uri},
+        MediaFormat='mp4',
+        LanguageCode=language_code,
+        OutputBucketName=output_bucket,
+        OutputKey=f"transcripts/{job_name}.json",
+        Settings={
+            'ShowSpeakerLabels': True,
+            'MaxSpeakerLabels': 5  # 최대 5명의 발화자로 제한
+        }
+    )
+    return job_name
+
+def read_transcript_sections(response) -> tuple[List[Dict], List[Dict]]:
+    """
+    전사 결과 JSON 응답에서 speaker_labels.segments와 items만 꺼내 (segments, items)로 반환합니다.
+    ijson이 있으면 응답을 받는 대로 스트리밍 파싱하여 두 배열만 객체로 만들고 나머지(전체 transcript 등)는 버리므로,
+    긴 영상의 수십 MB JSON도 본문 전체와 파싱된 dict를 동시에 메모리에 올리지 않습니다.
+    """
+    if ijson is None:
+        results = json_loads(response.content)['results']
+        if 'speaker_labels' not in results or 'segments' not in results['speaker_labels']:
+            return [], []
+        return results['speaker_labels']['segments'], results['items']
+
+    # 두 배열의 원소 경로 -> 결과 리스트 (한 번의 파싱으로 둘 다 수집)
+    sections = {
+        'results.speaker_labels.segments.item': [],
+        'results.items.item': []
+    }
+    builder = None
+    target = None
+    response.raw.decode_content = True  # gzip 등 전송 인코딩은 풀어서 파싱
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if builder is None:
+            if event == 'start_map' and prefix in sections:
+                builder = ijson.ObjectBuilder()
+                target = prefix
+                builder.event(event, value)
+            continue
+        builder.event(event, value)
+        if event == 'end_map' and prefix == target:
+            sections[target].append(builder.value)
+            builder = None
+    return sections['results.speaker_labels.segments.item'], sections['results.items.item']
+
+def fetch_transcript_utterances(result_url: str) -> List[Dict]:
+    """
+    presigned URL로부터 전사 결과 JSON을 가져와 발화 정보 리스트로 파싱합니다.
+    """
+    with get_http_session().get(result_url, stream=True, timeout=30) as response:
+        segments, items = read_transcript_sections(response)
+
+    utterances = []
+
+    # speaker_labels.segments에서 발화자 정보 추출
+    if segments:
+        # items의 시간은 한 번만 파싱하고 시작 시간 순으로 정렬해 두어, 세그먼트마다 전체 items를 훑지 않고
+        # 이진 탐색으로 시작 시간이 세그먼트 범위 안에 있는 후보만 확인
+        item_times = [
+            (safe_float_convert(item.get('start_time', '0')), safe_float_convert(item.get('end_time', '0')))
+            for item in items
+        ]
+        order = sorted(range(len(items)), key=lambda idx: item_times[idx][0])
+        sorted_starts = [item_times[idx][0] for idx in order]
+
+        # 각 세그먼트에 대해 발화 정보 생성
+        for segment in segments:
+            start_time = safe_float_convert(segment.get('start_time', '0'))
+            end_time = safe_float_convert(segment.get('end_time', '0'))
+
+            # 해당 세그먼트의 시간 범위에 있는 items 찾기 (원래 items 순서 유지)
+            lo = bisect.bisect_left(sorted_starts, start_time)
+            hi = bisect.bisect_right(sorted_starts, end_time)
+            segment_items = [
+                items[idx] for idx in sorted(order[lo:hi])
+                if item_times[idx][1] <= end_time
+            ]
+
+            # items에서 텍스트 추출
+            segment_text = ' '.join([
+                item['alternatives'][0]['content']
+                for item in segment_items
+                if 'alternatives' in item and item['alternatives']
+            ])
+
+            utterance = Utterance(
+                speaker=segment.get('speaker_label', 'unknown'),
+                start_time=start_time,
+                end_time=end_time,
+                text=segment_text
+            )
+            utterances.append(utterance.to_dict())
+
+    return utterances
+
+async def transcribe_video(uri: str, language_code: str = "en-US", initial_poll: float = TRANSCRIBE_INITIAL_POLL_SECONDS, max_poll: float = TRANSCRIBE_MAX_POLL_SECONDS) -> List[Dict]:
     """
     AWS Transcribe를 통해 비디오를 음성 텍스트로 변환하고,
     발화자, 시간, 대사 정보를 포함한 JSON 리스트를 반환합니다.
+    작업 완료를 기다리는 동안에는 스레드를 점유하지 않고 이벤트 루프에서 대기하며,
+    짧은 AWS 호출과 업로드/다운로드만 스레드에서 실행합니다.
     
     Args:
         uri: S3 URI (s3://) 또는 로컬 파일 URI (file://)
         language_code: 언어 코드
+        initial_poll: 작업 상태 첫 조회 간격 (초)
+        max_poll: 작업 상태 조회 간격 상한 (초), 여러 작업을 동시에 돌릴 때 GetTranscriptionJob 호출량 조절용
     
     Returns:
         List[Dict]: 발화 정보 리스트
@@ -97,7 +269,7 @@ def transcribe_video(uri: str, language_code: str = "en-US") -> List[Dict]:
             if not os.path.exists(local_path):
                 raise ValueError(f"로컬 파일이 존재하지 않습니다: {local_path}")
             
-            temp_s3_uri = upload_local_file_to_s3(local_path)
+            temp_s3_uri = await asyncio.to_thread(upload_local_file_to_s3, local_path)
             s3_uri = temp_s3_uri
             
         elif uri.startswith("s3://"):
@@ -107,79 +279,25 @@ def transcribe_video(uri: str, language_code: str = "en-US") -> List[Dict]:
         else:
             raise ValueError("URI는 's3://' 또는 'file://'로 시작해야 합니다.")
 
-        transcribe = boto3.client(
-            'transcribe',
-            region_name=os.getenv("AWS_DEFAULT_REGION") or "us-east-1"
-        )
+        async with TRANSCRIBE_SEM:
+            job_name = await asyncio.to_thread(start_transcription_job, s3_uri, language_code)
+            transcribe = get_transcribe_client()
 
-        output_bucket = os.getenv("TRANSCRIPTS_BUCKET")
-        if not output_bucket:
-            raise ValueError("환경 변수 TRANSCRIPTS_BUCKET이 설정되지 않았습니다.")
-
-        job_name = f"transcribe-job-{uuid.uuid4()}"
-        transcribe.start_transcription_job(
-            TranscriptionJobName=job_name,
-            Media={'MediaFileUri': s3_uri},
-            MediaFormat='mp4',
-            LanguageCode=language_code,
-            OutputBucketName=output_bucket,
-            OutputKey=f"transcripts/{job_name}.json",
-            Settings={
-                'ShowSpeakerLabels': True,
-                'MaxSpeakerLabels': 5  # 최대 5명의 발화자로 제한
-            }
-        )
-
-        # 완료될 때까지 5초 간격으로 폴링
-        while True:
-            status = transcribe.get_transcription_job(TranscriptionJobName=job_name)
-            job_status = status['TranscriptionJob']['TranscriptionJobStatus']
-            if job_status in ['COMPLETED', 'FAILED']:
-                break
-            time.sleep(5)
+            # 완료될 때까지 폴링 (짧은 작업은 빨리 감지하고 긴 작업은 호출 수를 줄이도록 간격을 두 배씩 늘림)
+            delay = initial_poll
+            while True:
+                status = await asyncio.to_thread(transcribe.get_transcription_job, TranscriptionJobName=job_name)
+                job_status = status['TranscriptionJob']['TranscriptionJobStatus']
+                if job_status in ['COMPLETED', 'FAILED']:
+                    break
+                # 동시에 시작한 작업들의 조회 시점이 겹치지 않도록 약간의 지터 추가
+                await asyncio.sleep(delay + random.uniform(0, 0.25))
+                delay = min(delay * 2, max_poll)
 
         if job_status == 'COMPLETED':
             # presigned URL로부터 JSON을 가져와 발화 정보 파싱
             result_url = status['TranscriptionJob']['Transcript']['TranscriptFileUri']
-            response = requests.get(result_url)
-            transcript_json = response.json()
-            
-            utterances = []
-            
-            # speaker_labels.segments에서 발화자 정보 추출
-            if 'speaker_labels' in transcript_json['results'] and 'segments' in transcript_json['results']['speaker_labels']:
-                segments = transcript_json['results']['speaker_labels']['segments']
-                items = transcript_json['results']['items']
-                
-                if segments:
-                    # 각 세그먼트에 대해 발화 정보 생성
-                    for segment in segments:
-                        start_time = safe_float_convert(segment.get('start_time', '0'))
-                        end_time = safe_float_convert(segment.get('end_time', '0'))
-                        
-                        # 해당 세그먼트의 시간 범위에 있는 items 찾기
-                        segment_items = [
-                            item for item in items 
-                            if safe_float_convert(item.get('start_time', '0')) >= start_time 
-                            and safe_float_convert(item.get('end_time', '0')) <= end_time
-                        ]
-                        
-                        # items에서 텍스트 추출
-                        segment_text = ' '.join([
-                            item['alternatives'][0]['content']
-                            for item in segment_items
-                            if 'alternatives' in item and item['alternatives']
-                        ])
-                        
-                        utterance = Utterance(
-                            speaker=segment.get('speaker_label', 'unknown'),
-                            start_time=start_time,
-                            end_time=end_time,
-                            text=segment_text
-                        )
-                        utterances.append(utterance.to_dict())
-
-            return utterances
+            return await asyncio.to_thread(fetch_transcript_utterances, result_url)
         else:
             raise RuntimeError(f"Transcription job {job_name} failed")
             
@@ -189,4 +307,4 @@ def transcribe_video(uri: str, language_code: str = "en-US") -> List[Dict]:
     finally:
         # 임시 S3 파일 정리
         if temp_s3_uri:
-            cleanup_temp_s3_file(temp_s3_uri)
\ No newline at end of file
+            await asyncio.to_thread(cleanup_temp_s3_file, temp_s3_uri)
@@ -0,0 +1,62 @@
+# app/services/utils.py
+
+import os
+import json
+import asyncio
+import functools
+import threading
+import boto3
+
+# Bedrock 요청/응답 본문과 S3 JSON 직렬화: orjson(C 구현)이 있으면 사용하고 없으면 표준 json으로 대체
+# (둘 다 bytes를 바로 파싱하며, orjson.dumps는 bytes를 반환하지만 botocore가 그대로 전송)
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    json_dumps = json.dumps
+    json_loads = json.loads
+
+# base64 인코딩/디코딩: pybase64(SIMD)가 있으면 사용하고 없으면 표준 base64로 대체 (결과는 동일)
+try:
+    from pybase64 import b64encode, b64decode
+except ImportError:
+    from base64 import b64encode, b64decode
+
+# 동시에 진행할 수 있는 Bedrock(Claude) 호출 수 상한. 모델별 RPM/TPM 한도에 맞춰 환경변수로 조정
+# 같은 계정/모델을 쓰는 모든 서비스가 이 하나의 세마포어를 공유해야 전체 동시 호출 수가 상한을 넘지 않음
+# 한도를 넘겨 스로틀링/재시도가 반복되는 것보다 대기열에서 기다리는 편이 전체 처리 시간이 짧음
+BEDROCK_SEM = asyncio.Semaphore(int(os.getenv("BEDROCK_MAX_CONCURRENCY", "4")))
+
+def locked_cache(factory):
+    """
+    인자별로 결과를 한 번만 만들어 재사용하는 functools.cache에 잠금을 더한 데코레이터입니다.
+    여러 스레드에서 처음 호출이 겹쳐도 클라이언트/세션이 하나만 만들어집니다. (boto3 클라이언트 생성은 스레드 안전하지 않음)
+    """
+    cached_factory = functools.cache(factory)
+    lock = threading.Lock()
+
+    @functools.wraps(factory)
+    def wrapper(*args, **kwargs):
+        with lock:
+            return cached_factory(*args, **kwargs)
+
+    wrapper.cache_clear = cached_factory.cache_clear
+    return wrapper
+
+@locked_cache
+def get_aws_client(service_name: str, region_name: str = None, config=None):
+    """
+    (서비스, 리전, Config) 조합마다 boto3 클라이언트를 프로세스당 하나만 생성하여 반환합니다.
+    boto3 클라이언트 사용은 스레드 안전하므로 자격증명 탐색/엔드포인트 해석과 연결 풀을 호출 간에 공유합니다.
+    config는 모듈 수준 상수로 넘겨야 같은 클라이언트가 재사용됩니다.
+    """
+    return boto3.client(service_name, region_name=region_name, config=config)
+
+def s3_bucket_and_key(s3_uri: str) -> tuple[str, str]:
+    """
+    s3://버킷/키 형태의 URI를 (버킷, 키)로 분리합니다.
+    urlsplit은 키에 있는 '?', '#'을 쿼리/프래그먼트로 잘라내므로 직접 분리합니다.
+    """
+    bucket, _, key = s3_uri[len("s3://"):].partition('/')
+    return bucket, key
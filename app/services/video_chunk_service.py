@@ -1,9 +1,49 @@
 import os
+import logging
 import tempfile
 import subprocess
-import boto3
+from botocore.config import Config
+from boto3.s3.transfer import TransferConfig
 from typing import List, Dict
+from app.services.utils import get_aws_client, s3_bucket_and_key
 import uuid
+import functools
+
+logger = logging.getLogger(__name__)
+
+# 비디오 다운로드 설정: 16MB 단위 Range GET을 최대 VIDEO_DOWNLOAD_CONCURRENCY개 연결로 동시에 받음 (boto3 기본값 8MB, 10개)
+VIDEO_DOWNLOAD_CONCURRENCY = int(os.getenv("VIDEO_DOWNLOAD_CONCURRENCY", "16"))
+VIDEO_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=16 * 1024 * 1024,
+    max_concurrency=VIDEO_DOWNLOAD_CONCURRENCY,
+    use_threads=True
+)
+
+# 다운로드한 비디오를 둘 임시 폴더 (기본은 시스템 임시 폴더)
+# 메모리가 충분하면 /dev/shm으로 지정해 디코딩 시 디스크 읽기를 건너뛸 수 있음 (컨테이너 기본 shm 크기는 64MB이므로 주의)
+VIDEO_TEMP_DIR = os.getenv("VIDEO_TEMP_DIR") or None
+
+# 프로세스당 하나의 S3 클라이언트를 재사용 (presigned URL 생성은 로컬 서명이므로 클라이언트 생성 비용이 대부분)
+VIDEO_S3_CONFIG = Config(max_pool_connections=max(10, VIDEO_DOWNLOAD_CONCURRENCY))
+
+def get_s3_client():
+    """
+    비디오 다운로드/presigned URL 생성에 쓰는 S3 클라이언트를 반환합니다.
+    """
+    return get_aws_client('s3', config=VIDEO_S3_CONFIG)
+
+def get_presigned_url(s3_uri: str, expires_in: int = 3600) -> str:
+    """
+    S3 URI에 대한 GET presigned URL을 생성합니다. (기본 1시간 유효)
+    ffmpeg/ffprobe는 이 URL을 HTTP Range 요청으로 읽으므로 필요한 구간만 내려받습니다.
+    """
+    bucket, key = s3_bucket_and_key(s3_uri)
+    return get_s3_client().generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=expires_in
+    )
 
 def download_video_from_s3(s3_uri: str) -> str:
     """
@@ -13,18 +53,18 @@ def download_video_from_s3(s3_uri: str) -> str:
         raise ValueError("s3_uri는 's3://'로 시작해야 합니다.")
     
     # S3 URI 파싱
-    bucket = s3_uri.split('/')[2]
-    key = '/'.join(s3_uri.split('/')[3:])
+    bucket, key = s3_bucket_and_key(s3_uri)
     
-    # S3 클라이언트 생성
-    s3 = boto3.client('s3')
+    # S3 클라이언트
+    s3 = get_s3_client()
     
-    # 임시 파일 생성
-    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
+    # 임시 파일 생성 (경로만 사용하므로 핸들은 바로 닫음)
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4', dir=VIDEO_TEMP_DIR)
+    temp_file.close()
     
     try:
-        # S3에서 비디오 다운로드
-        s3.download_file(bucket, key, temp_file.name)
+        # S3에서 비디오 다운로드 (큰 청크를 여러 연결로 동시에 받는 멀티파트 Range GET)
+        s3.download_file(bucket, key, temp_file.name, Config=VIDEO_TRANSFER_CONFIG)
         return temp_file.name
     except Exception as e:
         # 임시 파일 삭제
@@ -34,20 +74,21 @@ def download_video_from_s3(s3_uri: str) -> str:
 def get_video_duration_from_s3(s3_uri: str) -> float:
     """
     S3 비디오의 총 재생 시간을 초 단위로 반환합니다.
+    객체의 ETag로 캐시를 조회하여, 같은 비디오를 재시작/재처리할 때는 ffprobe를 다시 실행하지 않습니다.
+    """
+    bucket, key = s3_bucket_and_key(s3_uri)
+    etag = get_s3_client().head_object(Bucket=bucket, Key=key)['ETag']
+    return probe_video_duration(s3_uri, etag)
+
+@functools.lru_cache(maxsize=64)
+def probe_video_duration(s3_uri: str, etag: str) -> float:
+    """
+    ffprobe로 S3 비디오의 재생 시간을 측정합니다. (s3_uri, ETag) 단위로 프로세스 내에 캐시됩니다.
     메타데이터만 확인하므로 전체 파일을 다운로드하지 않습니다.
     """
     try:
         # presigned URL을 통해 ffprobe로 메타데이터만 조회
-        s3 = boto3.client('s3')
-        bucket = s3_uri.split('/')[2]
-        key = '/'.join(s3_uri.split('/')[3:])
-        
-        # presigned URL 생성 (1시간 유효)
-        presigned_url = s3.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': bucket, 'Key': key},
-            ExpiresIn=3600
-        )
+        presigned_url = get_presigned_url(s3_uri)
         
         cmd = [
             'ffprobe', 
@@ -76,16 +117,9 @@ def extract_video_chunk_from_s3(s3_uri: str, start_seconds: int, duration_second
         str: 추출된 청크 파일의 로컬 경로
     """
     try:
-        # S3 presigned URL 생성
-        s3 = boto3.client('s3')
-        bucket = s3_uri.split('/')[2]
-        key = '/'.join(s3_uri.split('/')[3:])
-        
-        presigned_url = s3.generate_presigned_url(
-            'get_object',
-            Params={'Bucket': bucket, 'Key': key},
-            ExpiresIn=3600
-        )
+        # S3 presigned URL 생성 (청크 처리 시점마다 새로 서명하므로 긴 영화에서도 만료되지 않음)
+        # -ss를 -i 앞에 두어 ffmpeg가 HTTP Range 요청으로 해당 구간 근처만 읽음 (전체 다운로드 없음)
+        presigned_url = get_presigned_url(s3_uri)
         
         # 출력 파일 생성
         output_file = tempfile.NamedTemporaryFile(delete=False, suffix='.mp4')
@@ -104,8 +138,8 @@ def extract_video_chunk_from_s3(s3_uri: str, start_seconds: int, duration_second
             output_path
         ]
         
-        print(f"🎬 청크 추출 중: {start_seconds}초~{start_seconds + duration_seconds}초")
-        print(f"   명령어: ffmpeg -ss {start_seconds} -i [URL] -t {duration_seconds} -c copy {os.path.basename(output_path)}")
+        logger.info("🎬 청크 추출 중: %s초~%s초", start_seconds, start_seconds + duration_seconds)
+        logger.debug("   명령어: ffmpeg -ss %s -i [URL] -t %s -c copy %s", start_seconds, duration_seconds, os.path.basename(output_path))
         
         # ffmpeg 실행
         result = subprocess.run(cmd, capture_output=True, text=True, check=True)
@@ -113,7 +147,7 @@ def extract_video_chunk_from_s3(s3_uri: str, start_seconds: int, duration_second
         # 파일 크기 확인
         if os.path.exists(output_path) and os.path.getsize(output_path) > 0:
             file_size = os.path.getsize(output_path) / (1024 * 1024)  # MB
-            print(f"✅ 청크 추출 완료: {os.path.basename(output_path)} ({file_size:.1f}MB)")
+            logger.info("✅ 청크 추출 완료: %s (%.1fMB)", os.path.basename(output_path), file_size)
             return output_path
         else:
             raise RuntimeError("추출된 청크 파일이 비어있거나 생성되지 않았습니다.")
@@ -136,9 +170,9 @@ def cleanup_chunk_file(file_path: str):
     try:
         if os.path.exists(file_path):
             os.unlink(file_path)
-            print(f"🗑️ 청크 파일 삭제: {os.path.basename(file_path)}")
+            logger.info("🗑️ 청크 파일 삭제: %s", os.path.basename(file_path))
     except Exception as e:
-        print(f"⚠️ 청크 파일 삭제 실패: {file_path} - {str(e)}")
+        logger.warning("⚠️ 청크 파일 삭제 실패: %s - %s", file_path, str(e))
 
 def generate_video_chunks_info(s3_uri: str) -> List[Dict]:
     """
@@ -155,7 +189,7 @@ def generate_video_chunks_info(s3_uri: str) -> List[Dict]:
     try:
         # 총 비디오 길이 확인
         total_duration = get_video_duration_from_s3(s3_uri)
-        print(f"📹 원본 비디오 길이: {total_duration:.1f}초 ({total_duration/60:.1f}분)")
+        logger.info("📹 원본 비디오 길이: %.1f초 (%.1f분)", total_duration, total_duration/60)
         
         chunks = []
         start_time = 0
@@ -181,7 +215,7 @@ def generate_video_chunks_info(s3_uri: str) -> List[Dict]:
             start_time += chunk_duration
             chunk_order += 1
         
-        print(f"📁 총 {len(chunks)}개의 청크로 분할 예정 (각 최대 {segment_duration/60:.1f}분)")
+        logger.info("📁 총 %s개의 청크로 분할 예정 (각 최대 %.1f분)", len(chunks), segment_duration/60)
         
         return chunks, segment_duration
         
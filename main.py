@@ -1,5 +1,8 @@
 # app/main.py
 import os
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from fastapi import FastAPI
 # from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
@@ -7,6 +10,18 @@ from app.routers import chat, transcribe, scene, summarize, pipeline, moviemanag
 
 load_dotenv()
 
+# LOG_LEVEL=DEBUG 로 실행하면 프롬프트/응답 전문까지 출력됩니다.
+# 로그는 큐에 넣기만 하고, 실제 stdout 출력은 QueueListener 스레드가 담당하여 이벤트 루프를 막지 않습니다.
+log_queue = queue.SimpleQueue()
+log_stream_handler = logging.StreamHandler()
+log_stream_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = QueueListener(log_queue, log_stream_handler)
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
+    handlers=[QueueHandler(log_queue)],
+)
+log_listener.start()
+
 app = FastAPI()
 
 # app.add_middleware(
@@ -25,6 +40,11 @@ app.include_router(summarize.router)
 app.include_router(pipeline.router)
 app.include_router(moviemanager.router)
 
+@app.on_event("shutdown")
+def stop_log_listener():
+    # 큐에 남은 로그를 모두 출력한 뒤 리스너 스레드 종료
+    log_listener.stop()
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to DWP API"}